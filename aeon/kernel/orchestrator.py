@@ -24,7 +24,6 @@ from aeon.orchestration.contracts import (
     validate_phase_invariants,
     validate_transition_contract,
 )
-from aeon.orchestration.context_ops import build_phase_context
 from aeon.orchestration.execution_pass_ops import (
     apply_refinement_to_plan_state,
     build_execution_pass_after_phase,
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from aeon.plan.models import Plan, PlanStep, StepStatus
 from aeon.memory.interface import Memory
@@ -90,6 +90,11 @@ class ExecutionPass(BaseModel):
     ttl_remaining: int = Field(..., ge=0, description="TTL cycles remaining")
     timing_information: Dict[str, Any] = Field(default_factory=dict, description="Contains start_time, end_time, duration (ISO 8601 timestamps)")
 
+    # Start time as a datetime, so completion need not re-parse timing_information["start_time"]
+    _start_time: Optional[datetime] = PrivateAttr(default=None)
+    # Monotonic clock reading at pass start, so completion can measure duration without datetime.now()
+    _start_perf: Optional[float] = PrivateAttr(default=None)
+
     model_config = {"extra": "forbid"}
 
 
@@ -90,6 +90,8 @@ def build_execution_result(
     status: str,
     state: Optional[OrchestrationState],
     execution_passes: List[Any],
+    total_passes: Optional[int] = None,
+    total_refinements: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Build execution result with ExecutionHistory.
@@ -107,6 +109,10 @@ def build_execution_result(
         status: Final status string
         state: Current orchestration state
         execution_passes: List of execution passes
+        total_passes: Passes run, including any evicted from execution_passes
+            (defaults to len(execution_passes))
+        total_refinements: Refinement changes across all passes run, including evicted
+            ones (defaults to the sum over execution_passes)
         
     Returns:
         Execution result dict
@@ -125,8 +131,12 @@ def build_execution_result(
             "status": status
         },
         overall_statistics={
-            "total_passes": len(execution_passes),
-            "total_refinements": sum(len(p.refinement_changes) for p in execution_passes),
+            "total_passes": len(execution_passes) if total_passes is None else total_passes,
+            "total_refinements": (
+                sum(len(p.refinement_changes) for p in execution_passes)
+                if total_refinements is None
+                else total_refinements
+            ),
             "convergence_achieved": converged,
             "total_time": (execution_end - execution_start).total_seconds()
         }
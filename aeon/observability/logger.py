@@ -1,6 +1,8 @@
 """JSONL logger for orchestration cycles."""
 
 import json
+import threading
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
@@ -15,18 +17,96 @@ from aeon.observability.models import (
     ValidationIssuesSummary,
 )
 
+# Fields shared by every phase-aware event (the list-valued legacy fields are
+# part of the preserved log schema and always emitted)
+_COMMON_EVENT_FIELDS = frozenset(
+    {
+        "event",
+        "correlation_id",
+        "phase",
+        "pass_number",
+        "timestamp",
+        "supervisor_actions",
+        "tool_calls",
+        "errors",
+    }
+)
+
+# Fields serialized per phase-aware event type. LogEntry carries 25+ fields but
+# each event only populates a handful, so restricting the dump to these skips
+# the unused ones. Events not listed here (e.g. legacy "cycle") are dumped in full.
+_EVENT_FIELDS: Dict[str, frozenset] = {
+    "phase_entry": _COMMON_EVENT_FIELDS,
+    "phase_exit": _COMMON_EVENT_FIELDS | {"duration", "outcome"},
+    "state_transition": _COMMON_EVENT_FIELDS
+    | {"component", "before_state", "after_state", "transition_reason"},
+    "state_snapshot": _COMMON_EVENT_FIELDS | {"plan_state", "ttl_remaining", "before_state"},
+    "ttl_snapshot": _COMMON_EVENT_FIELDS | {"ttl_remaining", "before_state"},
+    "phase_transition_error": _COMMON_EVENT_FIELDS | {"original_error"},
+    "refinement_outcome": _COMMON_EVENT_FIELDS
+    | {"before_plan_fragment", "after_plan_fragment", "refinement_actions", "evaluation_signals"},
+    "evaluation_outcome": _COMMON_EVENT_FIELDS
+    | {"convergence_assessment", "validation_report", "evaluation_signals"},
+    "error": _COMMON_EVENT_FIELDS
+    | {"original_error", "before_plan_fragment", "after_plan_fragment", "evaluation_signals"},
+    "error_recovery": _COMMON_EVENT_FIELDS
+    | {"original_error", "recovery_action", "recovery_outcome"},
+}
+
 
 class JSONLLogger:
     """JSONL logger for orchestration cycle logging."""
 
-    def __init__(self, file_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        file_path: Optional[Path] = None,
+        snapshot_sample_rate: float = 1.0,
+        buffer_size: int = 0,
+    ) -> None:
         """
         Initialize JSONL logger.
 
         Args:
             file_path: Path to JSONL log file (optional, defaults to None for no-op logger)
-        """
+            snapshot_sample_rate: Fraction of executions (0.0-1.0) whose state/TTL snapshots
+                are logged (defaults to 1.0, all executions)
+            buffer_size: Number of entries held in memory before they are written in one
+                append (defaults to 0, write-through). Buffered entries are also written
+                at every phase exit and on flush().
+        """
+        if not 0.0 <= snapshot_sample_rate <= 1.0:
+            raise ValueError(f"snapshot_sample_rate must be between 0.0 and 1.0, got {snapshot_sample_rate}")
+        if buffer_size < 0:
+            raise ValueError(f"buffer_size must be non-negative, got {buffer_size}")
         self.file_path = file_path
+        self.snapshot_sample_rate = snapshot_sample_rate
+        self.buffer_size = buffer_size
+        self._pending: List[str] = []
+        self._pending_lock = threading.Lock()
+        # crc32 values below this threshold are sampled
+        self._sample_threshold = int(snapshot_sample_rate * 0x100000000)
+
+    def should_sample(self, correlation_id: Optional[str]) -> bool:
+        """
+        Decide whether snapshots for an execution are logged.
+
+        The decision is a deterministic hash of the correlation_id, so all snapshots of
+        one execution are kept or dropped together. Phase entry/exit and error events
+        are never sampled.
+
+        Args:
+            correlation_id: Correlation ID of the execution
+
+        Returns:
+            True if the execution's snapshots should be logged
+        """
+        if not self.file_path:
+            return False
+        if self._sample_threshold >= 0x100000000:
+            return True
+        if not correlation_id:
+            return False
+        return zlib.crc32(correlation_id.encode("utf-8")) < self._sample_threshold
 
     def log_entry(self, entry: LogEntry) -> None:
         """
@@ -42,14 +122,44 @@ class JSONLLogger:
             return  # No-op if no file path provided
 
         try:
-            # Append mode - creates file if it doesn't exist
-            with open(self.file_path, 'a', encoding='utf-8') as f:
-                json_str = entry.model_dump_json()
-                f.write(json_str + '\n')
+            self._write_line(entry.model_dump_json(include=_EVENT_FIELDS.get(entry.event)))
         except Exception:
             # Non-blocking: silently fail on write errors
             pass
 
+    def _write_line(self, json_str: str) -> None:
+        """Buffer a serialized entry, or append it directly when unbuffered."""
+        if self.buffer_size:
+            with self._pending_lock:
+                self._pending.append(json_str + '\n')
+                full = len(self._pending) >= self.buffer_size
+            if full:
+                self.flush()
+            return
+        # Append mode - creates file if it doesn't exist
+        with open(self.file_path, 'a', encoding='utf-8') as f:
+            f.write(json_str + '\n')
+
+    def flush(self) -> None:
+        """
+        Write buffered entries to the JSONL file in a single append.
+
+        Note:
+            This method is non-blocking and will silently fail if file write fails.
+            Buffered entries are dropped on failure, as write-through entries would be.
+        """
+        # Hold the lock through the write so concurrent flushes keep entry order
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            try:
+                with open(self.file_path, 'a', encoding='utf-8') as f:
+                    f.write(''.join(pending))
+            except Exception:
+                # Non-blocking: silently fail on write errors
+                pass
+
     def format_entry(
         self,
         step_number: int,
@@ -144,9 +254,7 @@ class JSONLLogger:
                 "errors": errors or [],
                 "timestamp": datetime.now().isoformat(),
             }
-            with open(self.file_path, 'a', encoding='utf-8') as f:
-                json_str = json.dumps(entry, default=str)
-                f.write(json_str + '\n')
+            self._write_line(json.dumps(entry, default=str))
         except Exception:
             # Non-blocking: silently fail on write errors
             pass
@@ -228,6 +336,8 @@ class JSONLLogger:
         except Exception:
             # Non-blocking: silently fail on errors
             pass
+        # A phase's buffered events are written together when it exits
+        self.flush()
 
     def log_state_transition(
         self,
@@ -717,8 +827,8 @@ class JSONLLogger:
         Note:
             This method is non-blocking and will silently fail if file write fails.
         """
-        if not self.file_path:
-            return  # No-op if no file path provided
+        if not self.should_sample(correlation_id):
+            return  # No-op without a file path or when the execution is sampled out
 
         try:
             
@@ -762,8 +872,8 @@ class JSONLLogger:
         Note:
             This method is non-blocking and will silently fail if file write fails.
         """
-        if not self.file_path:
-            return  # No-op if no file path provided
+        if not self.should_sample(correlation_id):
+            return  # No-op without a file path or when the execution is sampled out
 
         try:
             
@@ -1,32 +1,56 @@
 """Observability data models."""
 
 import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from aeon.plan.models import PlanStep
 
-
-class CorrelationID(BaseModel):
-    """A unique identifier that links all log entries for a single execution cycle."""
-
-    value: str = Field(..., description="UUIDv5 string representation of the correlation ID")
-
-    @field_validator("value")
-    @classmethod
-    def validate_uuid_format(cls, v: str) -> str:
-        """Validate that value is a valid UUID format."""
-        # UUID format: 8-4-4-4-12 hex digits
-        uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-        # Also allow fallback format: aeon-timestamp-hash
-        fallback_pattern = r"^aeon-\d{4}-\d{2}-\d{2}T[\d:\.]+-[0-9a-f]{8}$"
-        if not (re.match(uuid_pattern, v, re.IGNORECASE) or re.match(fallback_pattern, v)):
+# UUID format: 8-4-4-4-12 hex digits
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+# Fallback format: aeon-timestamp-hash
+_FALLBACK_RE = re.compile(r"^aeon-\d{4}-\d{2}-\d{2}T[\d:\.]+-[0-9a-f]{8}$")
+
+# Valid <COMPONENT> segments of an AEON.<COMPONENT>.<CODE> error code
+ERROR_CODE_COMPONENTS = frozenset(
+    {
+        "REFINEMENT",
+        "EXECUTION",
+        "VALIDATION",
+        "PHASE",
+        "PLAN",
+        "TOOL",
+        "MEMORY",
+        "LLM",
+        "SUPERVISOR",
+    }
+)
+
+
+class CorrelationID(str):
+    """A unique identifier that links all log entries for a single execution cycle.
+
+    Implemented as a validated ``str`` subclass rather than a Pydantic model so
+    that creating one costs a single string allocation.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: str) -> "CorrelationID":
+        """Validate that value is a valid UUID or fallback format."""
+        if not isinstance(value, str) or not (_UUID_RE.match(value) or _FALLBACK_RE.match(value)):
             raise ValueError("Correlation ID must be a valid UUID or fallback format")
-        return v
+        return super().__new__(cls, value)
 
-    model_config = ConfigDict(frozen=True)
+    @property
+    def value(self) -> str:
+        """UUIDv5 string representation of the correlation ID."""
+        return str.__str__(self)
 
 
 class ErrorSeverity(str, Enum):
@@ -54,8 +78,14 @@ class ErrorRecord(BaseModel):
     @classmethod
     def validate_error_code_format(cls, v: str) -> str:
         """Validate that error code matches AEON.<COMPONENT>.<CODE> format."""
-        pattern = r"^AEON\.(REFINEMENT|EXECUTION|VALIDATION|PHASE|PLAN|TOOL|MEMORY|LLM|SUPERVISOR)\.\d{3}$"
-        if not re.match(pattern, v):
+        parts = v.split(".")
+        if (
+            len(parts) != 3
+            or parts[0] != "AEON"
+            or parts[1] not in ERROR_CODE_COMPONENTS
+            or len(parts[2]) != 3
+            or not parts[2].isdecimal()
+        ):
             raise ValueError(
                 f"Error code must match pattern AEON.<COMPONENT>.<CODE>, got '{v}'"
             )
@@ -72,32 +102,48 @@ class ErrorRecord(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
-class PlanFragment(BaseModel):
-    """A plan fragment containing only changed steps with step IDs."""
+@dataclass(frozen=True, slots=True)
+class PlanFragment:
+    """A plan fragment containing only changed steps with step IDs.
 
-    changed_steps: List[PlanStep] = Field(
-        ..., description="Steps that were modified, added, or removed (full step data)"
-    )
-    unchanged_step_ids: List[str] = Field(
-        ..., description="Step IDs of unchanged steps (ID only, no full data)"
-    )
+    A frozen slotted dataclass rather than a Pydantic model: fragments are
+    built on every refinement and only need the overlap check below.
 
-    @field_validator("unchanged_step_ids")
-    @classmethod
-    def validate_no_overlap(cls, v: List[str], info) -> List[str]:
-        """Validate that step IDs in changed_steps and unchanged_step_ids don't overlap."""
-        if "changed_steps" in info.data:
-            changed_ids = {step.step_id for step in info.data["changed_steps"]}
-            unchanged_ids = set(v)
-            overlap = changed_ids & unchanged_ids
-            if overlap:
-                raise ValueError(
-                    f"Step IDs in changed_steps and unchanged_step_ids must not overlap, "
-                    f"found overlap: {overlap}"
-                )
-        return v
+    Attributes:
+        changed_steps: Steps that were modified, added, or removed (full step data);
+            dicts are validated into PlanStep
+        unchanged_step_ids: Step IDs of unchanged steps (ID only, no full data)
+    """
 
-    model_config = ConfigDict(frozen=True)
+    changed_steps: Tuple[PlanStep, ...]
+    unchanged_step_ids: Tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """Normalize to tuples of PlanStep and validate that step IDs don't overlap."""
+        object.__setattr__(
+            self,
+            "changed_steps",
+            tuple(
+                step if isinstance(step, PlanStep) else PlanStep.model_validate(step)
+                for step in self.changed_steps
+            ),
+        )
+        object.__setattr__(self, "unchanged_step_ids", tuple(self.unchanged_step_ids))
+        overlap = {step.step_id for step in self.changed_steps}.intersection(
+            self.unchanged_step_ids
+        )
+        if overlap:
+            raise ValueError(
+                f"Step IDs in changed_steps and unchanged_step_ids must not overlap, "
+                f"found overlap: {overlap}"
+            )
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Serialize to a dict (kept for parity with the Pydantic models)."""
+        return {
+            "changed_steps": [step.model_dump() for step in self.changed_steps],
+            "unchanged_step_ids": list(self.unchanged_step_ids),
+        }
 
 
 class ConvergenceAssessmentSummary(BaseModel):
@@ -138,6 +184,11 @@ class ValidationIssuesSummary(BaseModel):
     @model_validator(mode="after")
     def validate_total_matches_sum(self) -> "ValidationIssuesSummary":
         """Validate that total_issues equals sum of severity counts."""
+        # Fast path: the common no-issues summary needs no summation
+        if self.total_issues == 0 and not (
+            self.critical_count or self.error_count or self.warning_count or self.info_count
+        ):
+            return self
         expected_total = (
             self.critical_count + self.error_count + self.warning_count + self.info_count
         )
@@ -266,7 +317,10 @@ class LogEntry(BaseModel):
         """
         if v is None:
             return 0
-        return max(0, int(v))
+        # Most callers already pass an int; skip the int() conversion for them
+        if type(v) is not int:
+            v = int(v)
+        return max(v, 0)
     
     # Phase exit fields
     duration: Optional[float] = Field(None, ge=0.0, description="Duration in seconds (for phase_exit events)")
@@ -4,10 +4,9 @@ This module contains functions for building and normalizing context before
 LLM calls, extracted from the kernel to reduce LOC.
 """
 
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, FrozenSet, Literal, Optional, Tuple
 
 from aeon.orchestration.phases import (
-    build_llm_context,
     get_context_propagation_specification,
     validate_context_propagation,
 )
@@ -15,33 +14,85 @@ from aeon.orchestration.phases import (
 __all__ = [
     "build_phase_context",
     "normalize_context",
+    "prepare_context_for_llm",
     "validate_context_before_llm",
 ]
 
+# Defaults for must-have fields missing from a context being normalized
+_FIELD_DEFAULTS: Dict[str, Any] = {"request": "", "pass_number": 0}
 
-def build_phase_context(
+# Per-phase cache of (skeleton, propagated_fields) used by normalize_context
+_NORMALIZE_SKELETONS: Dict[str, Tuple[Dict[str, Any], FrozenSet[str]]] = {}
+
+
+def _get_normalize_skeleton(
+    phase: Literal["A", "B", "C", "D"],
+) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+    """Return the cached default skeleton and propagated field set for a phase.
+
+    The propagated field set is the union of must-have and must-pass-unchanged
+    fields, so a single key-view intersection selects everything to copy.
+    """
+    cached = _NORMALIZE_SKELETONS.get(phase)
+    if cached is None:
+        spec = get_context_propagation_specification(phase)
+        skeleton = dict.fromkeys(spec.must_have_fields)
+        for field_name in skeleton.keys() & _FIELD_DEFAULTS.keys():
+            skeleton[field_name] = _FIELD_DEFAULTS[field_name]
+        cached = (
+            skeleton,
+            frozenset(spec.must_have_fields) | frozenset(spec.must_pass_unchanged_fields),
+        )
+        _NORMALIZE_SKELETONS[phase] = cached
+    return cached
+
+
+def prepare_context_for_llm(
     phase: Literal["A", "B", "C", "D"],
     base_context: Dict[str, Any],
 ) -> Dict[str, Any]:
     """
-    Build normalized context for a phase before LLM call.
+    Validate and build LLM context for a phase with a single spec fetch.
+
+    Fuses validation and context extraction so the specification is looked
+    up and the context validated exactly once.
 
     Args:
         phase: Phase identifier
         base_context: Base context dictionary
 
     Returns:
-        Normalized context dictionary for LLM
+        LLM context dictionary containing only the phase's must-have fields
 
     Raises:
         ValueError: If required context fields are missing
     """
     spec = get_context_propagation_specification(phase)
-    is_valid, error_message, missing_fields = validate_context_propagation(phase, base_context, spec)
+    is_valid, error_message, _ = validate_context_propagation(phase, base_context, spec)
     if not is_valid:
         raise ValueError(f"Context validation failed for phase {phase}: {error_message}")
 
-    return build_llm_context(phase, base_context, spec)
+    return {field_name: base_context[field_name] for field_name in spec.must_have_fields}
+
+
+def build_phase_context(
+    phase: Literal["A", "B", "C", "D"],
+    base_context: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Build normalized context for a phase before LLM call.
+
+    Args:
+        phase: Phase identifier
+        base_context: Base context dictionary
+
+    Returns:
+        Normalized context dictionary for LLM
+
+    Raises:
+        ValueError: If required context fields are missing
+    """
+    return prepare_context_for_llm(phase, base_context)
 
 
 def normalize_context(
@@ -60,26 +111,15 @@ def normalize_context(
     Returns:
         Normalized context dictionary
     """
-    spec = get_context_propagation_specification(phase)
-
-    # Ensure all must_have_fields are present
-    normalized = {}
-    for field_name in spec.must_have_fields:
-        if field_name in context:
-            normalized[field_name] = context[field_name]
-        else:
-            # Provide defaults for optional fields if needed
-            if field_name in ["request"]:
-                normalized[field_name] = ""
-            elif field_name in ["pass_number"]:
-                normalized[field_name] = 0
-            else:
-                normalized[field_name] = None
-
-    # Include must_pass_unchanged_fields
-    for field_name in spec.must_pass_unchanged_fields:
-        if field_name in context:
-            normalized[field_name] = context[field_name]
+    skeleton, propagated_fields = _get_normalize_skeleton(phase)
+
+    # Ensure all must_have_fields are present and include any provided
+    # must_pass_unchanged_fields: start from the defaulted skeleton and overlay
+    # the context's propagated fields in one C-level merge
+    normalized = dict(skeleton)
+    normalized |= {
+        field_name: context[field_name] for field_name in context.keys() & propagated_fields
+    }
 
     return normalized
 
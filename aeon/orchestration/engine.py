@@ -4,21 +4,136 @@ This module contains the OrchestrationEngine class that owns the multipass loop
 and phase sequencing logic, extracted from the kernel to reduce LOC.
 """
 
+import asyncio
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple
 import uuid
 
+from aeon.adaptive.models import TaskProfile
+from aeon.exceptions import TTLExpiredError
+from aeon.kernel.state import ExecutionPass
+from aeon.observability.helpers import build_execution_result
+from aeon.orchestration.contracts import (
+    validate_phase_entry,
+    validate_phase_exit,
+    validate_phase_invariants,
+    validate_transition_contract,
+)
+from aeon.orchestration.execution_pass_ops import (
+    PassHistory,
+    apply_refinement_to_plan_state,
+    build_execution_pass_after_phase,
+    build_execution_pass_before_phase,
+    finalize_execution_pass,
+    get_execution_results,
+    get_refinement_changes,
+    merge_evaluation_results,
+    merge_execution_results,
+    set_refinement_changes,
+    update_ttl_remaining,
+)
+from aeon.orchestration.phases import PhaseEInput, execute_phase_e
+from aeon.orchestration.strategy import has_converged, should_refine
+from aeon.orchestration.ttl import check_ttl_after_llm_call, check_ttl_before_phase_entry, decrement_ttl_per_cycle
+from aeon.orchestration.validation import check_ttl_at_phase_boundary
+from aeon.prompts.registry import get_prompt_registry
+
 if TYPE_CHECKING:
-    from aeon.adaptive.models import TaskProfile
     from aeon.plan.models import Plan
-    from aeon.kernel.state import ExecutionContext, ExecutionHistory, ExecutionPass, OrchestrationState
+    from aeon.kernel.state import ExecutionContext, ExecutionHistory, OrchestrationState
     from aeon.observability.logger import JSONLLogger
     from aeon.kernel.executor import StepExecutor
     from aeon.llm.interface import LLMAdapter
+    from aeon.orchestration.plan_cache import PlanCache
 
 __all__ = ["OrchestrationEngine"]
 
 
+@lru_cache(maxsize=128)
+def _dumper_for(cls: type) -> Optional[Callable]:
+    """Return the model_dump method for a type, or None if it has none."""
+    return getattr(cls, "model_dump", None)
+
+
+def _dump(value: Any) -> Any:
+    """Serialize a pydantic model via model_dump(); return other values unchanged."""
+    dumper = _dumper_for(type(value))
+    return dumper(value) if dumper else value
+
+
+def _skip_validation(*args: Any, **kwargs: Any) -> None:
+    """No-op stand-in for contract checks when validation is disabled."""
+
+
+def _collect_phase_e_context(
+    execution_passes: List["ExecutionPass"],
+    state: "OrchestrationState",
+    detailed_passes: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Extract PhaseEInput fields derived from the execution passes.
+
+    Args:
+        execution_passes: Completed execution passes
+        state: Orchestration state (plan fallback when the last pass has no plan_state)
+        detailed_passes: Number of most recent passes serialized in full; earlier
+            passes are summarized (None serializes every pass in full)
+
+    Returns:
+        Dict with plan_state, execution_results, convergence_assessment,
+        semantic_validation and execution_passes (all None when there are no passes)
+    """
+    context: Dict[str, Any] = {
+        "plan_state": None,
+        "execution_results": None,
+        "convergence_assessment": None,
+        "semantic_validation": None,
+        "execution_passes": None,
+    }
+    if not execution_passes:
+        return context
+
+    last_pass = execution_passes[-1]
+    # Serialize plan state from last pass or current state
+    if last_pass.plan_state:
+        context["plan_state"] = last_pass.plan_state
+    elif state.plan:
+        context["plan_state"] = _dump(state.plan)
+
+    # Extract execution results from all passes
+    context["execution_results"] = list(chain.from_iterable(map(get_execution_results, execution_passes)))
+
+    # Extract convergence assessment and semantic validation from last pass
+    evaluation_results = getattr(last_pass, 'evaluation_results', None)
+    if isinstance(evaluation_results, dict) and evaluation_results:
+        context["convergence_assessment"] = evaluation_results.get('convergence_assessment')
+        context["semantic_validation"] = evaluation_results.get('semantic_validation')
+
+    # Serialize recent passes in full; older passes are reduced to summaries
+    split = max(len(execution_passes) - detailed_passes, 0) if detailed_passes is not None else 0
+    older_passes = execution_passes[:split]
+    recent_passes = execution_passes[split:]
+    context["execution_passes"] = [_summarize_pass(pass_item) for pass_item in older_passes] + [
+        _dump(pass_item) for pass_item in recent_passes
+    ]
+    return context
+
+
+def _summarize_pass(execution_pass: "ExecutionPass") -> Dict[str, Any]:
+    """Reduce an older ExecutionPass to the metadata Phase E needs."""
+    return {
+        "pass_number": execution_pass.pass_number,
+        "phase": execution_pass.phase,
+        "converged": has_converged(execution_pass.evaluation_results),
+        "ttl_remaining": execution_pass.ttl_remaining,
+        "num_results": len(execution_pass.execution_results),
+        "summarized": True,
+    }
+
+
 class OrchestrationEngine:
     """Engine that owns the multipass execution loop and phase sequencing."""
 
@@ -38,6 +153,13 @@ class OrchestrationEngine:
         logger: Optional["JSONLLogger"] = None,
         memory: Optional[Any] = None,  # Memory
         plan_generator: Optional[Callable] = None,  # Function to generate plans
+        max_concurrent_steps: int = 1,
+        plan_cache: Optional["PlanCache"] = None,
+        validate_contracts: bool = True,
+        phase_ab_fn: Optional[Callable] = None,
+        pass_history_limit: Optional[int] = None,
+        pass_sink: Optional[Callable[["ExecutionPass"], None]] = None,
+        phase_e_detailed_passes: Optional[int] = None,
     ):
         """
         Initialize orchestration engine.
@@ -57,6 +179,24 @@ class OrchestrationEngine:
             logger: Optional JSONL logger
             memory: Optional Memory interface
             plan_generator: Optional function to generate plans
+            max_concurrent_steps: Maximum ready steps executed concurrently per Phase C
+                batch (default 1, serial). Values above 1 only apply to external,
+                thread-safe execute_step_fn implementations; the kernel's
+                Orchestrator._execute_step mutates shared state without locking, so
+                run_multipass rejects it with a ValueError when this is greater than 1
+            plan_cache: Optional PlanCache, consulted only when no plan is supplied; on a
+                hit for the request, Phases A and B are skipped and the cached refined
+                plan is executed
+            validate_contracts: Run phase entry/exit/invariant and transition contract
+                checks (default True). Disable in production to skip the per-pass checks.
+            phase_ab_fn: Optional function (request, plan, ttl, execution_context) ->
+                (task_profile, ttl_allocated, refined_plan) that produces Phase A and
+                Phase B outputs in a single LLM call; split Phases A and B run otherwise
+            pass_history_limit: Optional cap on completed passes held in memory; older
+                passes are evicted and omitted from the returned execution history
+            pass_sink: Optional function called with each evicted pass (e.g. to persist it)
+            phase_e_detailed_passes: Optional number of most recent passes given to Phase E
+                in full; earlier passes are reduced to summaries (default None, all in full)
         """
         self.llm = llm
         self._phase_orchestrator = phase_orchestrator
@@ -72,6 +212,26 @@ class OrchestrationEngine:
         self.logger = logger
         self.memory = memory
         self._plan_generator = plan_generator
+        self._max_concurrent_steps = max_concurrent_steps
+        self._plan_cache = plan_cache
+        self._phase_ab_fn = phase_ab_fn
+        self._pass_history_limit = pass_history_limit
+        self._pass_sink = pass_sink
+        self._phase_e_detailed_passes = phase_e_detailed_passes
+        self._prompt_registry = None  # Resolved lazily by _get_prompt_registry()
+
+        # Contract checks are bound once; with validate_contracts=False they become no-ops
+        self._validate_contracts = validate_contracts
+        if validate_contracts:
+            self._validate_transition_contract = validate_transition_contract
+            self._validate_phase_entry = validate_phase_entry
+            self._validate_phase_exit = validate_phase_exit
+            self._validate_phase_invariants = validate_phase_invariants
+        else:
+            self._validate_transition_contract = _skip_validation
+            self._validate_phase_entry = _skip_validation
+            self._validate_phase_exit = _skip_validation
+            self._validate_phase_invariants = _skip_validation
 
     def run_multipass(
         self,
@@ -104,12 +264,19 @@ class OrchestrationEngine:
 
         Raises:
             TTLExpiredError: If TTL expires during execution
+            ValueError: If max_concurrent_steps > 1 with the kernel's step executor
         """
-        from aeon.kernel.state import ExecutionPass
-        from aeon.observability.helpers import build_execution_result
-        from aeon.orchestration.contracts import validate_transition_contract
-        from aeon.exceptions import TTLExpiredError
-
+        if self._max_concurrent_steps > 1:
+            # Deferred import: the kernel orchestrator imports this module
+            from aeon.kernel.orchestrator import Orchestrator
+
+            # Orchestrator._execute_step mutates shared state (tool history, execution
+            # modes, TTL) without locking, so it may only run serially
+            if isinstance(getattr(execute_step_fn, "__self__", None), Orchestrator):
+                raise ValueError(
+                    "max_concurrent_steps > 1 requires a thread-safe execute_step_fn; "
+                    "the kernel's _execute_step is not"
+                )
         execution_id = str(uuid.uuid4())
         execution_start = datetime.now()
         execution_start_timestamp = execution_context.execution_start_timestamp
@@ -117,46 +284,81 @@ class OrchestrationEngine:
         # Initialize multi-pass state
         pass_number = 0
         current_phase: Optional[Literal["A", "B", "C", "D"]] = None
-        execution_passes: List[ExecutionPass] = []
+        execution_passes = PassHistory(max_passes=self._pass_history_limit, on_evict=self._pass_sink)
         ttl_allocated = ttl  # Will be updated by Phase A
 
+        # The cache is keyed by request only, so an explicitly supplied plan bypasses it
+        use_plan_cache = self._plan_cache is not None and plan is None
+        cached = self._plan_cache.get(request) if use_plan_cache else None
+        refined_plan_snapshot = None
+
         try:
-            # Phase A: TaskProfile & TTL allocation
-            task_profile, ttl_allocated = self.execute_phase_a(request, ttl, execution_context)
-
-            # Initialize state for execution
-            plan_to_execute = plan or (self._plan_generator(request) if self._plan_generator else None)
-            if not plan_to_execute:
-                raise ValueError("Plan is required but not provided and no plan generator available")
-            self._step_preparation.populate_step_indices(plan_to_execute)
-            state.plan = plan_to_execute
-            state.ttl_remaining = ttl_allocated
-
-            # Contract validation: A→B transition
-            inputs_a_b = {
-                "task_profile": task_profile,
-                "initial_plan": plan_to_execute,
-                "ttl": ttl_allocated,
-            }
-            validate_transition_contract("A→B", inputs_a_b)
+            if cached:
+                # Plan cache hit: reuse Phase A/B outputs and proceed directly to Phase C
+                task_profile, ttl_allocated, plan_to_execute = cached
+                ttl_allocated = min(ttl_allocated, ttl)
+                # Keep the Phase A/B boundary TTL checks the skipped phases would have run
+                check_ttl_at_phase_boundary(ttl_allocated, "A", None, 0, plan=plan_to_execute)
+                check_ttl_at_phase_boundary(ttl_allocated, "B", None, 0, plan=plan_to_execute)
+                self._step_preparation.populate_step_indices(plan_to_execute)
+                state.plan = plan_to_execute
+                state.ttl_remaining = ttl_allocated
+            elif self._phase_ab_fn is not None:
+                # Combined Phase A+B: one call yields (task_profile, ttl_allocated, refined_plan)
+                task_profile, ttl_allocated, plan_to_execute = self.execute_phase_ab(
+                    request, plan, ttl, execution_context
+                )
+                self._step_preparation.populate_step_indices(plan_to_execute)
+                state.plan = plan_to_execute
+                state.ttl_remaining = ttl_allocated
 
-            # Phase B: Initial Plan & Pre-Execution Refinement
-            plan_to_execute = self.execute_phase_b(
-                request, plan_to_execute, task_profile, ttl_allocated, execution_context
-            )
-            self._step_preparation.populate_step_indices(plan_to_execute)
-            state.plan = plan_to_execute
+                # Contract validation: A→B transition inputs and outputs
+                inputs_a_b = {
+                    "task_profile": task_profile,
+                    "initial_plan": plan_to_execute,
+                    "ttl": ttl_allocated,
+                }
+                self._validate_transition_contract("A→B", inputs_a_b, {"refined_plan": plan_to_execute})
+            else:
+                # Phase A: TaskProfile & TTL allocation
+                task_profile, ttl_allocated = self.execute_phase_a(request, ttl, execution_context)
+
+                # Initialize state for execution
+                plan_to_execute = plan or (self._plan_generator(request) if self._plan_generator else None)
+                if not plan_to_execute:
+                    raise ValueError("Plan is required but not provided and no plan generator available")
+                self._step_preparation.populate_step_indices(plan_to_execute)
+                state.plan = plan_to_execute
+                state.ttl_remaining = ttl_allocated
+
+                # Contract validation: A→B transition
+                inputs_a_b = {
+                    "task_profile": task_profile,
+                    "initial_plan": plan_to_execute,
+                    "ttl": ttl_allocated,
+                }
+                self._validate_transition_contract("A→B", inputs_a_b)
+
+                # Phase B: Initial Plan & Pre-Execution Refinement
+                plan_to_execute = self.execute_phase_b(
+                    request, plan_to_execute, task_profile, ttl_allocated, execution_context
+                )
+                self._step_preparation.populate_step_indices(plan_to_execute)
+                state.plan = plan_to_execute
 
-            # Contract validation: A→B transition outputs
-            outputs_a_b = {"refined_plan": plan_to_execute}
-            validate_transition_contract("A→B", inputs_a_b, outputs_a_b)
+                # Contract validation: A→B transition outputs
+                outputs_a_b = {"refined_plan": plan_to_execute}
+                self._validate_transition_contract("A→B", inputs_a_b, outputs_a_b)
 
             # Contract validation: B→C transition inputs
             inputs_b_c = {
                 "refined_plan": plan_to_execute,
-                "refined_plan_steps": plan_to_execute.steps if plan_to_execute.steps else [],
+                "refined_plan_steps": plan_to_execute.steps,
             }
-            validate_transition_contract("B→C", inputs_b_c)
+            self._validate_transition_contract("B→C", inputs_b_c)
+            if use_plan_cache and not cached:
+                # Snapshot before Phase C mutates step state; stored only if the run converges
+                refined_plan_snapshot = (task_profile, ttl_allocated, plan_to_execute.model_copy(deep=True))
 
             # Phase C: Execution Passes
             max_passes = 50  # Safety limit to prevent infinite loops
@@ -176,75 +378,22 @@ class OrchestrationEngine:
                 # TTL expiration handled by _execute_phase_c_loop, re-raise to be caught by outer handler
                 raise
 
-            # Phase E: Answer Synthesis (T080-T083)
-            from aeon.orchestration.phases import execute_phase_e, PhaseEInput
-            from aeon.prompts.registry import get_prompt_registry
-            from aeon.orchestration.execution_pass_ops import get_execution_results
-            
-            # Build PhaseEInput from final execution state (T081)
-            final_pass_number = len(execution_passes) if execution_passes else 0
-            total_refinements = state.total_refinements if hasattr(state, 'total_refinements') else 0
-            
-            # Extract data from execution passes if available
-            plan_state = None
-            execution_results_list = None
-            convergence_assessment = None
-            semantic_validation = None
-            execution_passes_data = None
-            
-            if execution_passes:
-                last_pass = execution_passes[-1]
-                # Serialize plan state from last pass or current state
-                if last_pass.plan_state:
-                    plan_state = last_pass.plan_state
-                elif state.plan:
-                    plan_state = state.plan.model_dump() if hasattr(state.plan, 'model_dump') else state.plan
-                
-                # Extract execution results from all passes
-                execution_results_list = []
-                for pass_item in execution_passes:
-                    pass_results = get_execution_results(pass_item)
-                    if pass_results:
-                        execution_results_list.extend(pass_results if isinstance(pass_results, list) else [pass_results])
-                
-                # Extract convergence assessment and semantic validation from last pass
-                if hasattr(last_pass, 'evaluation_results') and last_pass.evaluation_results:
-                    evaluation_results = last_pass.evaluation_results
-                    if isinstance(evaluation_results, dict):
-                        convergence_assessment = evaluation_results.get('convergence_assessment')
-                        semantic_validation = evaluation_results.get('semantic_validation')
-                    else:
-                        convergence_assessment = evaluation_results
-                
-                # Serialize execution passes
-                execution_passes_data = [
-                    pass_item.model_dump() if hasattr(pass_item, 'model_dump') else pass_item
-                    for pass_item in execution_passes
-                ]
-            
-            # Determine convergence status (PhaseEInput uses bool, but AnswerSynthesisInput accepts Union[bool, str])
-            # We pass bool to PhaseEInput, and it will be converted to string in AnswerSynthesisInput if needed
-            
-            phase_e_input = PhaseEInput(
-                request=request,
-                correlation_id=execution_context.correlation_id,
-                execution_start_timestamp=execution_start_timestamp.isoformat() if isinstance(execution_start_timestamp, datetime) else execution_start_timestamp,
+            if converged and refined_plan_snapshot is not None:
+                self._plan_cache.put(request, *refined_plan_snapshot)
+
+            # Phase E: Answer Synthesis (T080-T083) - must execute unconditionally (FR-020, FR-024)
+            final_pass_number = execution_passes.total_passes
+            final_answer_dump = self._run_phase_e(
+                request,
+                execution_context,
+                execution_start_timestamp,
+                execution_passes,
+                state,
+                task_profile,
                 convergence_status=converged,
-                total_passes=final_pass_number,
-                total_refinements=total_refinements,
                 ttl_remaining=state.ttl_remaining,
-                plan_state=plan_state,
-                execution_results=execution_results_list,
-                convergence_assessment=convergence_assessment,
-                execution_passes=execution_passes_data,
-                semantic_validation=semantic_validation,
-                task_profile=task_profile.model_dump() if task_profile and hasattr(task_profile, 'model_dump') else task_profile,
             )
-            
-            # Execute Phase E (T082) - must execute unconditionally (FR-020, FR-024)
-            prompt_registry = get_prompt_registry()
-            final_answer = execute_phase_e(phase_e_input, self.llm, prompt_registry)
-            
+
             # Check if max passes limit was reached
             execution_end = datetime.now()
             if final_pass_number >= max_passes and not converged:
@@ -259,9 +408,11 @@ class OrchestrationEngine:
                     status="max_passes_reached",
                     state=state,
                     execution_passes=execution_passes,
+                    total_passes=execution_passes.total_passes,
+                    total_refinements=execution_passes.total_refinements,
                 )
                 # Attach FinalAnswer to execution result (T083)
-                result["final_answer"] = final_answer.model_dump() if hasattr(final_answer, 'model_dump') else final_answer
+                result["final_answer"] = final_answer_dump
                 return result
 
             # Build ExecutionHistory
@@ -276,71 +427,26 @@ class OrchestrationEngine:
                 status="converged" if converged else "ttl_expired",
                 state=state,
                 execution_passes=execution_passes,
+                total_passes=execution_passes.total_passes,
+                total_refinements=execution_passes.total_refinements,
             )
             # Attach FinalAnswer to execution result (T083)
-            result["final_answer"] = final_answer.model_dump() if hasattr(final_answer, 'model_dump') else final_answer
+            result["final_answer"] = final_answer_dump
             return result
 
         except TTLExpiredError as e:
             # Handle TTL expiration - Phase E must still execute (FR-020, FR-024)
-            from aeon.orchestration.phases import execute_phase_e, PhaseEInput
-            from aeon.prompts.registry import get_prompt_registry
-            from aeon.orchestration.execution_pass_ops import get_execution_results
-            
-            # Build PhaseEInput for TTL expiration scenario
-            final_pass_number = len(execution_passes) if execution_passes else 0
-            total_refinements = state.total_refinements if hasattr(state, 'total_refinements') else 0
-            
-            plan_state = None
-            execution_results_list = None
-            convergence_assessment = None
-            semantic_validation = None
-            execution_passes_data = None
-            
-            if execution_passes:
-                last_pass = execution_passes[-1]
-                if last_pass.plan_state:
-                    plan_state = last_pass.plan_state
-                elif state.plan:
-                    plan_state = state.plan.model_dump() if hasattr(state.plan, 'model_dump') else state.plan
-                
-                execution_results_list = []
-                for pass_item in execution_passes:
-                    pass_results = get_execution_results(pass_item)
-                    if pass_results:
-                        execution_results_list.extend(pass_results if isinstance(pass_results, list) else [pass_results])
-                
-                if hasattr(last_pass, 'evaluation_results') and last_pass.evaluation_results:
-                    evaluation_results = last_pass.evaluation_results
-                    if isinstance(evaluation_results, dict):
-                        convergence_assessment = evaluation_results.get('convergence_assessment')
-                        semantic_validation = evaluation_results.get('semantic_validation')
-                
-                execution_passes_data = [
-                    pass_item.model_dump() if hasattr(pass_item, 'model_dump') else pass_item
-                    for pass_item in execution_passes
-                ]
-            
-            phase_e_input = PhaseEInput(
-                request=request,
-                correlation_id=execution_context.correlation_id,
-                execution_start_timestamp=execution_start_timestamp.isoformat() if isinstance(execution_start_timestamp, datetime) else execution_start_timestamp,
+            final_answer_dump = self._run_phase_e(
+                request,
+                execution_context,
+                execution_start_timestamp,
+                execution_passes,
+                state,
+                task_profile,
                 convergence_status=False,  # TTL expired means not converged
-                total_passes=final_pass_number,
-                total_refinements=total_refinements,
                 ttl_remaining=0,  # TTL expired
-                plan_state=plan_state,
-                execution_results=execution_results_list,
-                convergence_assessment=convergence_assessment,
-                execution_passes=execution_passes_data,
-                semantic_validation=semantic_validation,
-                task_profile=task_profile.model_dump() if task_profile and hasattr(task_profile, 'model_dump') else task_profile,
             )
-            
-            # Execute Phase E even on TTL expiration
-            prompt_registry = get_prompt_registry()
-            final_answer = execute_phase_e(phase_e_input, self.llm, prompt_registry)
-            
+
             # Try to get TTL expiration response if available
             if execution_passes:
                 last_pass = execution_passes[-1]
@@ -355,17 +461,103 @@ class OrchestrationEngine:
                 )
                 if success:
                     # Attach FinalAnswer to expiration response
-                    response["final_answer"] = final_answer.model_dump() if hasattr(final_answer, 'model_dump') else final_answer
+                    response["final_answer"] = final_answer_dump
                     return response
             
             # Fallback: return minimal response with FinalAnswer
-            execution_end = datetime.now()
             return {
                 "execution_id": execution_id,
                 "request": request,
                 "status": "ttl_expired",
-                "final_answer": final_answer.model_dump() if hasattr(final_answer, 'model_dump') else final_answer,
+                "final_answer": final_answer_dump,
             }
+        finally:
+            # Write out entries still buffered by a buffered JSONLLogger
+            flush = getattr(self.logger, "flush", None)
+            if flush is not None:
+                flush()
+
+    def _run_phase_e(
+        self,
+        request: str,
+        execution_context: "ExecutionContext",
+        execution_start_timestamp: Any,
+        execution_passes: List["ExecutionPass"],
+        state: "OrchestrationState",
+        task_profile: Optional["TaskProfile"],
+        convergence_status: bool,
+        ttl_remaining: int,
+    ) -> Any:
+        """
+        Build PhaseEInput from the final execution state and execute Phase E (T081-T082).
+
+        Shared by the normal completion path and the TTL expiration path, which
+        differ only in convergence_status and ttl_remaining.
+
+        Returns:
+            Serialized FinalAnswer from Phase E, ready to attach to the result (T083)
+        """
+        phase_e_input = PhaseEInput(
+            request=request,
+            correlation_id=execution_context.correlation_id,
+            execution_start_timestamp=execution_start_timestamp.isoformat() if isinstance(execution_start_timestamp, datetime) else execution_start_timestamp,
+            convergence_status=convergence_status,
+            total_passes=getattr(execution_passes, "total_passes", len(execution_passes)),
+            total_refinements=state.total_refinements if hasattr(state, 'total_refinements') else 0,
+            ttl_remaining=ttl_remaining,
+            task_profile=_dump(task_profile),
+            **_collect_phase_e_context(execution_passes, state, self._phase_e_detailed_passes),
+        )
+        final_answer = execute_phase_e(phase_e_input, self.llm, self._get_prompt_registry())
+        return _dump(final_answer)
+
+    def _get_prompt_registry(self) -> Any:
+        """Return the prompt registry, resolving it on first use."""
+        if self._prompt_registry is None:
+            self._prompt_registry = get_prompt_registry()
+        return self._prompt_registry
+
+    async def run_multipass_async(
+        self,
+        request: str,
+        plan: Optional["Plan"],
+        execution_context: "ExecutionContext",
+        state: "OrchestrationState",
+        ttl: int,
+        execute_step_fn: Callable,
+    ) -> Dict[str, Any]:
+        """
+        Run the multipass execution loop without blocking the event loop.
+
+        The phase methods and LLM adapters are synchronous, and Phase B's
+        planner → validator → refinement calls form a data-dependency chain, so
+        there is nothing to fan out within a single request. Instead the whole
+        loop runs in a worker thread, letting async callers overlap independent
+        requests.
+
+        Args:
+            request: Natural language request
+            plan: Optional pre-generated plan
+            execution_context: Execution context with correlation_id and execution_start_timestamp
+            state: OrchestrationState instance (must not be shared with concurrent runs)
+            ttl: Initial TTL value
+            execute_step_fn: Function to execute a step
+
+        Returns:
+            Execution result dict with ExecutionHistory
+
+        Raises:
+            TTLExpiredError: If TTL expires during execution
+        """
+        return await asyncio.to_thread(
+            self.run_multipass,
+            request,
+            plan,
+            execution_context,
+            state,
+            ttl,
+            execute_step_fn,
+        )
 
     def execute_phase_a(
         self,
@@ -379,17 +571,8 @@ class OrchestrationEngine:
         Returns:
             Tuple of (task_profile, ttl_allocated)
         """
-        from aeon.orchestration.contracts import validate_phase_entry, validate_phase_exit
-        from aeon.orchestration.execution_pass_ops import (
-            build_execution_pass_after_phase,
-            build_execution_pass_before_phase,
-        )
-        from aeon.orchestration.ttl import check_ttl_before_phase_entry
-        from aeon.orchestration.validation import check_ttl_at_phase_boundary
-        from aeon.exceptions import TTLExpiredError
-
         temp_pass_a = build_execution_pass_before_phase(0, "A", {}, ttl)
-        validate_phase_entry(temp_pass_a, "A")
+        self._validate_phase_entry(temp_pass_a, "A")
         can_proceed, expiration_response = check_ttl_before_phase_entry(ttl, "A", temp_pass_a)
         if not can_proceed:
             raise TTLExpiredError(f"TTL expired before Phase A: {expiration_response.message if expiration_response else 'Unknown'}")
@@ -406,12 +589,11 @@ class OrchestrationEngine:
             ttl_remaining=ttl,
         )
         if not success:
-            from aeon.adaptive.models import TaskProfile
             task_profile = TaskProfile.default()
             ttl_allocated = ttl
 
-        temp_pass_a = build_execution_pass_after_phase(temp_pass_a, datetime.now())
-        validate_phase_exit(temp_pass_a, "A")
+        temp_pass_a = build_execution_pass_after_phase(temp_pass_a)
+        self._validate_phase_exit(temp_pass_a, "A")
         check_ttl_at_phase_boundary(ttl_allocated, "A", temp_pass_a, 0, {})
 
         return (task_profile, ttl_allocated)
@@ -430,19 +612,10 @@ class OrchestrationEngine:
         Returns:
             Refined plan
         """
-        from aeon.orchestration.contracts import validate_phase_entry, validate_phase_exit
-        from aeon.orchestration.execution_pass_ops import (
-            build_execution_pass_after_phase,
-            build_execution_pass_before_phase,
-        )
-        from aeon.orchestration.ttl import check_ttl_before_phase_entry
-        from aeon.orchestration.validation import check_ttl_at_phase_boundary
-        from aeon.exceptions import TTLExpiredError
-
         temp_pass_b = build_execution_pass_before_phase(
             0, "B", plan.model_dump() if plan else {}, ttl_allocated
         )
-        validate_phase_entry(temp_pass_b, "B")
+        self._validate_phase_entry(temp_pass_b, "B")
         can_proceed, expiration_response = check_ttl_before_phase_entry(ttl_allocated, "B", temp_pass_b)
         if not can_proceed:
             raise TTLExpiredError(f"TTL expired before Phase B: {expiration_response.message if expiration_response else 'Unknown'}")
@@ -465,12 +638,59 @@ class OrchestrationEngine:
         if not success:
             refined_plan = plan  # Continue with original plan if refinement fails
 
-        temp_pass_b = build_execution_pass_after_phase(temp_pass_b, datetime.now())
-        validate_phase_exit(temp_pass_b, "B")
-        check_ttl_at_phase_boundary(ttl_allocated, "B", None, 0, refined_plan.model_dump() if refined_plan else {})
+        temp_pass_b = build_execution_pass_after_phase(temp_pass_b)
+        self._validate_phase_exit(temp_pass_b, "B")
+        check_ttl_at_phase_boundary(ttl_allocated, "B", None, 0, plan=refined_plan)
 
         return refined_plan
 
+    def execute_phase_ab(
+        self,
+        request: str,
+        plan: Optional["Plan"],
+        ttl: int,
+        execution_context: "ExecutionContext",
+    ) -> Tuple[Any, int, "Plan"]:  # Returns (task_profile, ttl_allocated, refined_plan)
+        """
+        Execute Phases A and B in a single phase_ab_fn call.
+
+        Applies the Phase A and Phase B entry/exit validation and TTL boundary checks
+        of execute_phase_a and execute_phase_b around the combined call, which is
+        logged as Phase A.
+
+        Returns:
+            Tuple of (task_profile, ttl_allocated, refined_plan)
+        """
+        temp_pass_a = build_execution_pass_before_phase(0, "A", {}, ttl)
+        self._validate_phase_entry(temp_pass_a, "A")
+        can_proceed, expiration_response = check_ttl_before_phase_entry(ttl, "A", temp_pass_a)
+        if not can_proceed:
+            raise TTLExpiredError(f"TTL expired before Phase A: {expiration_response.message if expiration_response else 'Unknown'}")
+
+        task_profile, ttl_allocated, refined_plan = self._execute_phase_with_logging(
+            "A",
+            execution_context.correlation_id,
+            0,
+            self._phase_ab_fn,
+            request,
+            plan,
+            ttl,
+            execution_context,
+        )
+        ttl_allocated = min(ttl_allocated, ttl)
+
+        temp_pass_a = build_execution_pass_after_phase(temp_pass_a)
+        self._validate_phase_exit(temp_pass_a, "A")
+        check_ttl_at_phase_boundary(ttl_allocated, "A", temp_pass_a, 0, {})
+
+        temp_pass_b = build_execution_pass_before_phase(0, "B", refined_plan.model_dump(), ttl_allocated)
+        self._validate_phase_entry(temp_pass_b, "B")
+        temp_pass_b = build_execution_pass_after_phase(temp_pass_b)
+        self._validate_phase_exit(temp_pass_b, "B")
+        check_ttl_at_phase_boundary(ttl_allocated, "B", None, 0, plan=refined_plan)
+
+        return (task_profile, ttl_allocated, refined_plan)
+
     def _execute_phase_with_logging(
         self,
         phase: str,
@@ -484,12 +704,12 @@ class OrchestrationEngine:
         Execute a phase function with entry/exit logging.
         Returns the result of the phase function.
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         if self.logger:
             self.logger.log_phase_entry(phase=phase, correlation_id=correlation_id, pass_number=pass_number)
         try:
             result = phase_fn(*args, **kwargs)
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             if self.logger:
                 success = result[0] if isinstance(result, tuple) and len(result) > 0 else True
                 self.logger.log_phase_exit(
@@ -501,7 +721,7 @@ class OrchestrationEngine:
                 )
             return result
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             if self.logger:
                 self.logger.log_phase_exit(
                     phase=phase,
@@ -528,29 +748,18 @@ class OrchestrationEngine:
         Execute Phase C execution passes until convergence or TTL expiration.
         Returns (converged, updated_task_profile).
         """
-        from aeon.orchestration.contracts import (
-            validate_phase_entry,
-            validate_phase_exit,
-            validate_phase_invariants,
-            validate_transition_contract,
-        )
-        from aeon.orchestration.execution_pass_ops import (
-            apply_refinement_to_plan_state,
-            build_execution_pass_after_phase,
-            build_execution_pass_before_phase,
-            merge_evaluation_results,
-            merge_execution_results,
-        )
-        from aeon.orchestration.strategy import has_converged, should_refine
-        from aeon.orchestration.ttl import check_ttl_after_llm_call, check_ttl_before_phase_entry, decrement_ttl_per_cycle
-        from aeon.orchestration.validation import check_ttl_at_phase_boundary
-        from aeon.exceptions import TTLExpiredError
+        # Collaborators are fixed for the whole loop; bind them once
+        phase_orchestrator = self._phase_orchestrator
+        tool_registry = self.tool_registry
+        logger = self.logger
+        populate_step_indices = self._step_preparation.populate_step_indices
 
         converged = False
-        initial_pass_number = len(execution_passes)
+        initial_pass_number = getattr(execution_passes, "total_passes", len(execution_passes))
         pass_number = initial_pass_number
         while not converged and state.ttl_remaining > 0 and pass_number < max_passes:
             pass_number += 1
+            pass_start = datetime.now()
 
             # Create ExecutionPass for this pass
             execution_pass = build_execution_pass_before_phase(
@@ -558,38 +767,30 @@ class OrchestrationEngine:
                 "C",
                 state.plan.model_dump(),
                 state.ttl_remaining,
+                start_time=pass_start,
             )
 
             # Validate before Phase C entry
-            validate_phase_entry(execution_pass, "C")
+            self._validate_phase_entry(execution_pass, "C")
 
             # TTL check before phase entry
             can_proceed, expiration_response = check_ttl_before_phase_entry(state.ttl_remaining, "C", execution_pass)
             if not can_proceed:
-                execution_pass = build_execution_pass_after_phase(execution_pass, datetime.now())
+                execution_pass = build_execution_pass_after_phase(execution_pass, start_time=pass_start)
                 execution_passes.append(execution_pass)
-                success, response, error = self._ttl_strategy.create_expiration_response(
-                    "phase_boundary",
-                    "C",
-                    execution_pass,
-                    execution_passes,
-                    state,
-                    execution_id,
-                    request,
-                )
-                if success:
-                    raise TTLExpiredError(f"TTL expired before Phase C: {expiration_response.message if expiration_response else 'Unknown'}")
+                # The outer TTLExpiredError handler in run_multipass builds the expiration response
+                if expiration_response:
+                    raise TTLExpiredError(f"TTL expired before Phase C: {expiration_response.message}")
                 raise TTLExpiredError("TTL expired before Phase C")
 
             # Execute batch of ready steps
-            from aeon.orchestration.execution_pass_ops import get_execution_results, get_refinement_changes
             previous_outputs = get_execution_results(execution_pass)
             refinement_changes = get_refinement_changes(execution_pass)
-            execution_results = self._phase_orchestrator.phase_c_execute_batch(
+            execution_results = phase_orchestrator.phase_c_execute_batch(
                 state.plan,
                 state,
                 self.step_executor,
-                self.tool_registry,
+                tool_registry,
                 self.memory,
                 self.supervisor,
                 execute_step_fn,
@@ -600,40 +801,33 @@ class OrchestrationEngine:
                 request=request,
                 previous_outputs=previous_outputs,
                 refinement_changes=refinement_changes,
+                max_concurrent_steps=self._max_concurrent_steps,
             )
             execution_pass = merge_execution_results(execution_pass, execution_results)
 
             # Contract validation: B→C transition outputs
             outputs_b_c = {"execution_results": execution_results}
-            validate_transition_contract("B→C", inputs_b_c, outputs_b_c)
+            self._validate_transition_contract("B→C", inputs_b_c, outputs_b_c)
 
             # TTL check after LLM call within phase
             can_proceed, expiration_response = check_ttl_after_llm_call(state.ttl_remaining, "C", execution_pass)
             if not can_proceed:
-                execution_pass = build_execution_pass_after_phase(execution_pass, datetime.now())
+                execution_pass = build_execution_pass_after_phase(execution_pass, start_time=pass_start)
                 execution_passes.append(execution_pass)
-                success, response, error = self._ttl_strategy.create_expiration_response(
-                    "mid_phase",
-                    "C",
-                    execution_pass,
-                    execution_passes,
-                    state,
-                    execution_id,
-                    request,
-                )
-                if success:
-                    raise TTLExpiredError(f"TTL expired mid-phase C: {expiration_response.message if expiration_response else 'Unknown'}")
+                # The outer TTLExpiredError handler in run_multipass builds the expiration response
+                if expiration_response:
+                    raise TTLExpiredError(f"TTL expired mid-phase C: {expiration_response.message}")
                 raise TTLExpiredError("TTL expired mid-phase C")
 
             # Evaluate: semantic validation + convergence
-            evaluation_results = self._phase_orchestrator.phase_c_evaluate(
+            evaluation_results = phase_orchestrator.phase_c_evaluate(
                 state.plan,
                 execution_results,
                 self._semantic_validator,
                 self._convergence_engine,
-                self.tool_registry,
+                tool_registry,
                 execution_context=execution_context,
-                logger=self.logger,
+                logger=logger,
                 task_profile=task_profile,
                 pass_number=pass_number,
                 ttl_remaining=state.ttl_remaining,
@@ -646,27 +840,27 @@ class OrchestrationEngine:
                 "execution_results": execution_results,
                 "evaluation_results": evaluation_results,
             }
-            validate_transition_contract("C→D", inputs_c_d)
+            self._validate_transition_contract("C→D", inputs_c_d)
 
             # Check convergence
             converged = has_converged(evaluation_results)
             if converged:
-                execution_pass = build_execution_pass_after_phase(execution_pass, datetime.now())
-                validate_phase_exit(execution_pass, "C")
-                validate_phase_invariants(execution_pass, "C")
+                execution_pass = finalize_execution_pass(
+                    execution_pass, "C", start_time=pass_start, validate=self._validate_contracts
+                )
                 execution_passes.append(execution_pass)
                 break
 
             # Decide: check if refinement needed
             needs_refinement = should_refine(evaluation_results)
             if needs_refinement:
-                success, refinement_changes, error, updated_plan = self._phase_orchestrator.phase_c_refine(
+                success, refinement_changes, error, updated_plan = phase_orchestrator.phase_c_refine(
                     state.plan,
                     evaluation_results,
                     self._recursive_planner,
-                    lambda p: self._step_preparation.populate_step_indices(p),
+                    populate_step_indices,
                     execution_context=execution_context,
-                    logger=self.logger,
+                    logger=logger,
                     task_profile=task_profile,
                     pass_number=pass_number,
                     ttl_remaining=state.ttl_remaining,
@@ -675,72 +869,61 @@ class OrchestrationEngine:
                 )
                 if success and updated_plan:
                     state.plan = updated_plan
-                    from aeon.orchestration.execution_pass_ops import set_refinement_changes
                     execution_pass = set_refinement_changes(execution_pass, refinement_changes)
                     execution_pass = apply_refinement_to_plan_state(execution_pass, updated_plan)
 
-            # Phase D: Adaptive Depth (at pass boundary)
-            if pass_number > 0:
-                # Validate before Phase D entry
-                validate_phase_entry(execution_pass, "D")
-                # TTL check before phase entry
-                can_proceed, expiration_response = check_ttl_before_phase_entry(state.ttl_remaining, "D", execution_pass)
-                if not can_proceed:
-                    execution_pass = build_execution_pass_after_phase(execution_pass, datetime.now())
-                    execution_passes.append(execution_pass)
-                    success, response, error = self._ttl_strategy.create_expiration_response(
-                        "phase_boundary",
-                        "D",
-                        execution_pass,
-                        execution_passes,
-                        state,
-                        execution_id,
-                        request,
-                    )
-                    if success:
-                        raise TTLExpiredError(f"TTL expired before Phase D: {expiration_response.message if expiration_response else 'Unknown'}")
-                    raise TTLExpiredError("TTL expired before Phase D")
-
-                success, updated_task_profile, error = self._phase_orchestrator.phase_d_adaptive_depth(
-                    task_profile,
-                    evaluation_results,
-                    state.plan,
-                    self._adaptive_depth,
-                    state,
-                    state.ttl_remaining,  # Use state.ttl_remaining instead of self.ttl
-                    execution_passes,
-                    execution_context=execution_context,
-                    logger=self.logger,
-                    pass_number=pass_number,
-                    ttl_remaining=state.ttl_remaining,
-                    request=request,
-                )
-                if success and updated_task_profile:
-                    task_profile = updated_task_profile
+            # Phase D: Adaptive Depth (at pass boundary; pass_number >= 1 inside this loop)
+            # Validate before Phase D entry
+            self._validate_phase_entry(execution_pass, "D")
+            # TTL check before phase entry
+            can_proceed, expiration_response = check_ttl_before_phase_entry(state.ttl_remaining, "D", execution_pass)
+            if not can_proceed:
+                execution_pass = build_execution_pass_after_phase(execution_pass, start_time=pass_start)
+                execution_passes.append(execution_pass)
+                # The outer TTLExpiredError handler in run_multipass builds the expiration response
+                if expiration_response:
+                    raise TTLExpiredError(f"TTL expired before Phase D: {expiration_response.message}")
+                raise TTLExpiredError("TTL expired before Phase D")
 
-                validate_phase_invariants(execution_pass, "D")
-                check_ttl_at_phase_boundary(state.ttl_remaining, "D", execution_pass, pass_number, state.plan.model_dump() if state else {})
+            success, updated_task_profile, error = phase_orchestrator.phase_d_adaptive_depth(
+                task_profile,
+                evaluation_results,
+                state.plan,
+                self._adaptive_depth,
+                state,
+                state.ttl_remaining,  # Use state.ttl_remaining instead of self.ttl
+                execution_passes,
+                execution_context=execution_context,
+                logger=logger,
+                pass_number=pass_number,
+                ttl_remaining=state.ttl_remaining,
+                request=request,
+            )
+            if success and updated_task_profile:
+                task_profile = updated_task_profile
 
-                # Contract validation: C→D transition outputs
-                outputs_c_d = {"updated_task_profile": updated_task_profile}
-                validate_transition_contract("C→D", inputs_c_d, outputs_c_d)
+            self._validate_phase_invariants(execution_pass, "D")
+            check_ttl_at_phase_boundary(state.ttl_remaining, "D", execution_pass, pass_number)
 
-                # Contract validation: D→A/B transition inputs
-                inputs_d_ab = {
-                    "task_profile": task_profile,
-                    "ttl_remaining": state.ttl_remaining,
-                }
-                validate_transition_contract("D→A/B", inputs_d_ab)
+            # Contract validation: C→D transition outputs
+            outputs_c_d = {"updated_task_profile": updated_task_profile}
+            self._validate_transition_contract("C→D", inputs_c_d, outputs_c_d)
 
-                # TTL decrement occurs in Phase D completion
-                state.ttl_remaining = decrement_ttl_per_cycle(state.ttl_remaining)
-                from aeon.orchestration.execution_pass_ops import update_ttl_remaining
-                execution_pass = update_ttl_remaining(execution_pass, state.ttl_remaining)
+            # Contract validation: D→A/B transition inputs
+            inputs_d_ab = {
+                "task_profile": task_profile,
+                "ttl_remaining": state.ttl_remaining,
+            }
+            self._validate_transition_contract("D→A/B", inputs_d_ab)
+
+            # TTL decrement occurs in Phase D completion
+            state.ttl_remaining = decrement_ttl_per_cycle(state.ttl_remaining)
+            execution_pass = update_ttl_remaining(execution_pass, state.ttl_remaining)
 
             # Complete pass
-            execution_pass = build_execution_pass_after_phase(execution_pass, datetime.now())
-            validate_phase_exit(execution_pass, "C")
-            validate_phase_invariants(execution_pass, "C")
+            execution_pass = finalize_execution_pass(
+                execution_pass, "C", start_time=pass_start, validate=self._validate_contracts
+            )
             execution_passes.append(execution_pass)
 
             # Check TTL at phase boundary before next pass
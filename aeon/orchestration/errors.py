@@ -4,10 +4,11 @@ This module contains functions for creating structured errors with component
 assignment and error codes, extracted from the kernel to reduce LOC.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from aeon.exceptions import AeonError
-from aeon.observability.models import ErrorRecord
+from aeon.observability.models import ERROR_CODE_COMPONENTS, ErrorRecord, ErrorSeverity
 
 __all__ = [
     "create_error_record",
@@ -15,7 +16,13 @@ __all__ = [
     "assign_error_code",
 ]
 
+@lru_cache(maxsize=256)
+def _compute_error_type(error_class: type) -> str:
+    """Derive the error-code type segment from an exception class name."""
+    return error_class.__name__.upper().replace("ERROR", "")
 
+
+@lru_cache(maxsize=256)
 def determine_component(phase: Optional[str] = None, subsystem: Optional[str] = None) -> str:
     """
     Determine the affected component for error reporting.
@@ -34,6 +41,7 @@ def determine_component(phase: Optional[str] = None, subsystem: Optional[str] =
     return "unknown"
 
 
+@lru_cache(maxsize=256)
 def assign_error_code(
     error_type: str,
     phase: Optional[str] = None,
@@ -42,22 +50,25 @@ def assign_error_code(
     """
     Assign error code based on error type and context.
 
+    Error types that name an error-code component (e.g. "VALIDATION", "TOOL") are
+    used as the component. Other errors are filed under PHASE when they occur in a
+    phase or transition, and under EXECUTION otherwise.
+
     Args:
-        error_type: Type of error (e.g., "VALIDATION", "TTL_EXPIRED")
+        error_type: Type of error (e.g., "VALIDATION", "TOOL")
         phase: Optional phase identifier
         transition: Optional transition identifier
 
     Returns:
-        Error code string in format AEON.<TYPE>.<PHASE/TRANSITION>.<CODE>
+        Error code string in format AEON.<COMPONENT>.<CODE>
     """
-    base_code = f"AEON.{error_type}"
-    if transition:
-        # Normalize transition (A→B -> A_B)
-        normalized = transition.replace("→", "_").replace("/", "_")
-        return f"{base_code}.{normalized}.001"
-    if phase:
-        return f"{base_code}.{phase}.001"
-    return f"{base_code}.001"
+    if error_type in ERROR_CODE_COMPONENTS:
+        component = error_type
+    elif phase or transition:
+        component = "PHASE"
+    else:
+        component = "EXECUTION"
+    return f"AEON.{component}.001"
 
 
 def create_error_record(
@@ -91,14 +102,10 @@ def create_error_record(
         return error_record
 
     # Determine error type from exception class name
-    error_type = type(error).__name__.upper().replace("ERROR", "")
-    if error_type.endswith("ERROR"):
-        error_type = error_type[:-5]
+    error_type = _compute_error_type(type(error))
 
     error_code = assign_error_code(error_type, phase, transition)
 
-    from aeon.observability.models import ErrorSeverity
-
     return ErrorRecord(
         code=error_code,
         severity=ErrorSeverity.ERROR,
@@ -107,4 +114,3 @@ def create_error_record(
         context=context or {},
         stack_trace="",
     )
-
@@ -4,14 +4,18 @@ This module contains functions for building and merging ExecutionPass objects,
 extracted from the kernel to reduce LOC.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
 
 from aeon.kernel.state import ExecutionPass
+from aeon.orchestration.contracts import validate_phase_exit, validate_phase_invariants
 
 __all__ = [
+    "PassHistory",
     "build_execution_pass_before_phase",
     "build_execution_pass_after_phase",
+    "finalize_execution_pass",
     "merge_execution_results",
     "merge_evaluation_results",
     "apply_refinement_to_plan_state",
@@ -22,11 +26,66 @@ __all__ = [
 ]
 
 
+class PassHistory(list):
+    """
+    List of completed ExecutionPass objects, optionally bounded to the most recent ones.
+
+    A list subclass (rather than a deque) so existing consumers keep slicing,
+    indexing and Pydantic List validation. When max_passes is set, appending
+    beyond it evicts the oldest pass, handing it to on_evict if given.
+    """
+
+    def __init__(
+        self,
+        passes: Iterable[ExecutionPass] = (),
+        max_passes: Optional[int] = None,
+        on_evict: Optional[Callable[[ExecutionPass], None]] = None,
+    ):
+        """
+        Initialize pass history.
+
+        Args:
+            passes: Initial passes
+            max_passes: Maximum passes retained (None for unbounded)
+            on_evict: Optional sink called with each evicted pass (e.g. to persist it)
+        """
+        if max_passes is not None and max_passes < 1:
+            raise ValueError("max_passes must be at least 1")
+        super().__init__()
+        self.max_passes = max_passes
+        self.on_evict = on_evict
+        self.evicted_count = 0
+        self.evicted_refinements = 0
+        for execution_pass in passes:
+            self.append(execution_pass)
+
+    @property
+    def total_passes(self) -> int:
+        """Number of passes ever appended, including evicted ones."""
+        return len(self) + self.evicted_count
+
+    @property
+    def total_refinements(self) -> int:
+        """Number of refinement changes across all passes, including evicted ones."""
+        return sum(len(p.refinement_changes) for p in self) + self.evicted_refinements
+
+    def append(self, execution_pass: ExecutionPass) -> None:
+        """Append a completed pass, evicting the oldest if over the limit."""
+        super().append(execution_pass)
+        if self.max_passes is not None and len(self) > self.max_passes:
+            evicted = self.pop(0)
+            self.evicted_count += 1
+            self.evicted_refinements += len(evicted.refinement_changes)
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+
+
 def build_execution_pass_before_phase(
     pass_number: int,
     phase: Literal["A", "B", "C", "D"],
     plan_state: Dict[str, Any],
     ttl_remaining: int,
+    start_time: Optional[datetime] = None,
 ) -> ExecutionPass:
     """
     Build ExecutionPass object before phase entry.
@@ -36,58 +95,99 @@ def build_execution_pass_before_phase(
         phase: Phase identifier
         plan_state: Plan state dictionary
         ttl_remaining: TTL cycles remaining
+        start_time: Optional start time (defaults to now)
 
     Returns:
         ExecutionPass object with required before-phase fields
     """
-    return ExecutionPass(
+    if start_time is None:
+        start_time = datetime.now()
+    execution_pass = ExecutionPass(
         pass_number=pass_number,
         phase=phase,
         plan_state=plan_state,
         ttl_remaining=ttl_remaining,
-        timing_information={"start_time": datetime.now().isoformat()},
+        timing_information={"start_time": start_time.isoformat()},
     )
+    execution_pass._start_time = start_time
+    execution_pass._start_perf = time.perf_counter()
+    return execution_pass
 
 
 def build_execution_pass_after_phase(
     execution_pass: ExecutionPass,
     end_time: Optional[datetime] = None,
+    start_time: Optional[datetime] = None,
 ) -> ExecutionPass:
     """
     Complete ExecutionPass object after phase exit.
 
     Args:
         execution_pass: ExecutionPass to complete
-        end_time: Optional end time (defaults to now)
+        end_time: Optional end time (defaults to the recorded start plus the monotonic
+            elapsed time, or now if the pass was not built by build_execution_pass_before_phase)
+        start_time: Optional start time (defaults to the one recorded by
+            build_execution_pass_before_phase; the ISO string is parsed only as a fallback)
 
     Returns:
         Completed ExecutionPass with timing information
     """
+    if isinstance(execution_pass, ExecutionPass):
+        if start_time is None:
+            start_time = execution_pass._start_time
+        # Measure duration on the monotonic clock and derive the wall-clock end from the recorded start
+        if end_time is None and execution_pass._start_perf is not None and start_time == execution_pass._start_time:
+            end_time = start_time + timedelta(seconds=time.perf_counter() - execution_pass._start_perf)
     if end_time is None:
         end_time = datetime.now()
 
-    start_time_str = (
-        execution_pass.timing_information.get("start_time")
-        if isinstance(execution_pass.timing_information, dict)
-        else getattr(execution_pass.timing_information, "start_time", None)
-    )
+    # timing_information is declared Dict[str, Any] on ExecutionPass, so no attribute-style access
+    timing_info = execution_pass.timing_information
+    if start_time is None:
+        start_time = _get_start_time(timing_info)
+    timing_info["end_time"] = end_time.isoformat()
+    timing_info["duration"] = (end_time - start_time).total_seconds() if start_time is not None else 0.0
+    return execution_pass
+
 
-    if start_time_str:
-        try:
-            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            duration = (end_time - start_time).total_seconds()
-        except Exception:
-            duration = 0.0
-    else:
-        duration = 0.0
-
-    if isinstance(execution_pass.timing_information, dict):
-        execution_pass.timing_information["end_time"] = end_time.isoformat()
-        execution_pass.timing_information["duration"] = duration
-    else:
-        setattr(execution_pass.timing_information, "end_time", end_time.isoformat())
-        setattr(execution_pass.timing_information, "duration", duration)
+def _get_start_time(timing_info: Dict[str, Any]) -> Optional[datetime]:
+    """Parse the recorded start time from timing information, or None if unavailable."""
+    try:
+        return datetime.fromisoformat(timing_info["start_time"].replace("Z", "+00:00"))
+    except Exception:
+        return None
 
+
+def finalize_execution_pass(
+    execution_pass: ExecutionPass,
+    phase: Literal["A", "B", "C", "D"],
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    validate: bool = True,
+) -> ExecutionPass:
+    """
+    Complete ExecutionPass timing and validate it in one step.
+
+    Fuses build_execution_pass_after_phase with the phase exit and invariant
+    checks that always follow it at the end of a pass.
+
+    Args:
+        execution_pass: ExecutionPass to complete
+        phase: Phase identifier used for validation
+        start_time: Optional start time (see build_execution_pass_after_phase)
+        end_time: Optional end time (defaults to now)
+        validate: Whether to run the phase exit and invariant checks
+
+    Returns:
+        Completed ExecutionPass
+
+    Raises:
+        ExecutionPassValidationError: If validation fails
+    """
+    execution_pass = build_execution_pass_after_phase(execution_pass, end_time, start_time)
+    if validate:
+        validate_phase_exit(execution_pass, phase)
+        validate_phase_invariants(execution_pass, phase)
     return execution_pass
 
 
@@ -98,9 +198,13 @@ def merge_execution_results(
     """
     Merge execution results into ExecutionPass.
 
+    Replaces (does not extend) execution_results: each pass records the results
+    of its single Phase C batch. ExecutionPass does not enable validate_assignment,
+    so the list is stored as-is without re-validating its elements.
+
     Args:
         execution_pass: ExecutionPass to update
-        new_execution_results: New execution results to merge
+        new_execution_results: Execution results of the pass's Phase C batch
 
     Returns:
         Updated ExecutionPass
@@ -183,7 +287,7 @@ def update_ttl_remaining(
 
 def get_execution_results(
     execution_pass: ExecutionPass,
-) -> Optional[List[Dict[str, Any]]]:
+) -> List[Dict[str, Any]]:
     """
     Get execution results from ExecutionPass.
 
@@ -191,14 +295,14 @@ def get_execution_results(
         execution_pass: ExecutionPass to read from
 
     Returns:
-        Execution results list or None if not present
+        Execution results list (empty if none were recorded)
     """
-    return getattr(execution_pass, "execution_results", None)
+    return execution_pass.execution_results
 
 
 def get_refinement_changes(
     execution_pass: ExecutionPass,
-) -> Optional[List[Dict[str, Any]]]:
+) -> List[Dict[str, Any]]:
     """
     Get refinement changes from ExecutionPass.
 
@@ -206,7 +310,7 @@ def get_refinement_changes(
         execution_pass: ExecutionPass to read from
 
     Returns:
-        Refinement changes list or None if not present
+        Refinement changes list (empty if no refinement occurred)
     """
-    return getattr(execution_pass, "refinement_changes", None)
+    return execution_pass.refinement_changes
 
@@ -4,13 +4,33 @@ This module contains the PhaseOrchestrator class that orchestrates Phase A/B/C/D
 logic for multi-pass execution, extracted from the kernel to reduce LOC.
 """
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple
+import json
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, NoReturn, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from aeon.adaptive.models import TaskProfile
+from aeon.convergence.models import ConvergenceAssessment
+from aeon.exceptions import ContextPropagationError, LLMError, PhaseTransitionError, TTLExpiredError
+from aeon.observability.models import ConvergenceAssessmentSummary, PlanFragment, ValidationIssuesSummary
+from aeon.orchestration.refinement import PlanRefinement
+from aeon.orchestration.step_prep import StepPreparation
+from aeon.plan.models import Plan, StepStatus
+from aeon.prompts.registry import (
+    AnswerSynthesisInput,
+    NoOutputModelError,
+    PromptId,
+    PromptNotFoundError,
+    RenderingError,
+)
+from aeon.validation.models import SemanticValidationReport
+
 if TYPE_CHECKING:
-    from aeon.adaptive.models import TaskProfile
-    from aeon.plan.models import Plan
     from aeon.kernel.state import ExecutionContext, OrchestrationState, ExecutionPass
     from aeon.observability.logger import JSONLLogger
 
@@ -74,24 +94,25 @@ class PhaseTransitionContract(BaseModel):
     transition_name: Literal["A→B", "B→C", "C→D", "D→A/B"] = Field(..., description="Transition identifier")
     required_inputs: Dict[str, Any] = Field(..., description="Field name → validation rule mapping for required inputs")
     guaranteed_outputs: Dict[str, Any] = Field(..., description="Field name → validation rule mapping for guaranteed outputs")
-    invariants: List[str] = Field(..., description="Invariant descriptions that must hold during transition")
-    failure_conditions: List[FailureCondition] = Field(..., description="Failure condition → retryability classification mapping")
+    invariants: Tuple[str, ...] = Field(..., description="Invariant descriptions that must hold during transition")
+    failure_conditions: Tuple[FailureCondition, ...] = Field(..., description="Failure condition → retryability classification mapping")
 
 
 class ContextPropagationSpecification(BaseModel):
     """Structured specification defining, for each phase, what fields must be constructed before phase entry (must-have), what fields must be passed unchanged between phases (must-pass-unchanged), and what fields may be produced/modified only by specific phases (may-modify)."""
 
     phase: Literal["A", "B", "C", "D"] = Field(..., description="Phase identifier")
-    must_have_fields: List[str] = Field(..., description="Required fields before phase entry")
-    must_pass_unchanged_fields: List[str] = Field(..., description="Fields that must be identical across phases")
-    may_modify_fields: List[str] = Field(default_factory=list, description="Fields that may be produced/modified by this phase")
+    must_have_fields: Tuple[str, ...] = Field(..., description="Required fields before phase entry")
+    must_pass_unchanged_fields: Tuple[str, ...] = Field(..., description="Fields that must be identical across phases")
+    may_modify_fields: Tuple[str, ...] = Field(default=(), description="Fields that may be produced/modified by this phase")
 
 
 # Phase Transition Contract Constants
 # These contracts define explicit input requirements, output guarantees, invariants, and failure modes
 # for each phase transition (A→B, B→C, C→D, D→A/B).
+# Built with model_construct(): the values are source literals, so import-time validation is skipped.
 
-CONTRACT_A_TO_B = PhaseTransitionContract(
+CONTRACT_A_TO_B = PhaseTransitionContract.model_construct(
     transition_name="A→B",
     required_inputs={
         "task_profile": lambda x: x is not None,  # TaskProfile must be present
@@ -101,30 +122,30 @@ CONTRACT_A_TO_B = PhaseTransitionContract(
     guaranteed_outputs={
         "refined_plan": lambda x: x is not None,  # Plan must be present
     },
-    invariants=[
+    invariants=(
         "correlation_id must be passed unchanged",
         "execution_start_timestamp must be passed unchanged",
-    ],
-    failure_conditions=[
-        FailureCondition(
+    ),
+    failure_conditions=(
+        FailureCondition.model_construct(
             condition="incomplete profile",
             retryable=False,
             error_code="AEON.PHASE_TRANSITION.A_B.001",
         ),
-        FailureCondition(
+        FailureCondition.model_construct(
             condition="malformed plan JSON",
             retryable=True,
             error_code="AEON.PHASE_TRANSITION.A_B.002",
         ),
-        FailureCondition(
+        FailureCondition.model_construct(
             condition="malformed plan structure",
             retryable=False,
             error_code="AEON.PHASE_TRANSITION.A_B.003",
         ),
-    ],
+    ),
 )
 
-CONTRACT_B_TO_C = PhaseTransitionContract(
+CONTRACT_B_TO_C = PhaseTransitionContract.model_construct(
     transition_name="B→C",
     required_inputs={
         "refined_plan": lambda x: x is not None,  # Plan must be present
@@ -133,30 +154,30 @@ CONTRACT_B_TO_C = PhaseTransitionContract(
     guaranteed_outputs={
         "execution_results": lambda x: isinstance(x, list),  # Execution results must be list
     },
-    invariants=[
+    invariants=(
         "correlation_id must be passed unchanged",
         "execution_start_timestamp must be passed unchanged",
-    ],
-    failure_conditions=[
-        FailureCondition(
+    ),
+    failure_conditions=(
+        FailureCondition.model_construct(
             condition="missing steps",
             retryable=False,
             error_code="AEON.PHASE_TRANSITION.B_C.001",
         ),
-        FailureCondition(
+        FailureCondition.model_construct(
             condition="invalid plan fragments missing required fields",
             retryable=True,
             error_code="AEON.PHASE_TRANSITION.B_C.002",
         ),
-        FailureCondition(
+        FailureCondition.model_construct(
             condition="invalid plan fragments structural invalidity",
             retryable=False,
             error_code="AEON.PHASE_TRANSITION.B_C.003",
         ),
-    ],
+    ),
 )
 
-CONTRACT_C_TO_D = PhaseTransitionContract(
+CONTRACT_C_TO_D = PhaseTransitionContract.model_construct(
     transition_name="C→D",
     required_inputs={
         "execution_results": lambda x: isinstance(x, list),  # Execution results must be list
@@ -165,25 +186,25 @@ CONTRACT_C_TO_D = PhaseTransitionContract(
     guaranteed_outputs={
         "updated_task_profile": lambda x: x is None or True,  # TaskProfile may be None or updated
     },
-    invariants=[
+    invariants=(
         "correlation_id must be passed unchanged",
         "execution_start_timestamp must be passed unchanged",
-    ],
-    failure_conditions=[
-        FailureCondition(
+    ),
+    failure_conditions=(
+        FailureCondition.model_construct(
             condition="execution results incomplete",
             retryable=False,
             error_code="AEON.PHASE_TRANSITION.C_D.001",
         ),
-        FailureCondition(
+        FailureCondition.model_construct(
             condition="evaluation results malformed",
             retryable=True,
             error_code="AEON.PHASE_TRANSITION.C_D.002",
         ),
-    ],
+    ),
 )
 
-CONTRACT_D_TO_A_B = PhaseTransitionContract(
+CONTRACT_D_TO_A_B = PhaseTransitionContract.model_construct(
     transition_name="D→A/B",
     required_inputs={
         "task_profile": lambda x: x is not None,  # TaskProfile must be present
@@ -192,47 +213,48 @@ CONTRACT_D_TO_A_B = PhaseTransitionContract(
     guaranteed_outputs={
         "next_phase": lambda x: x in ("A", "B"),  # Next phase must be A or B
     },
-    invariants=[
+    invariants=(
         "correlation_id must be passed unchanged",
         "execution_start_timestamp must be passed unchanged",
-    ],
-    failure_conditions=[
-        FailureCondition(
+    ),
+    failure_conditions=(
+        FailureCondition.model_construct(
             condition="TTL exhausted",
             retryable=False,
             error_code="AEON.PHASE_TRANSITION.D_AB.001",
         ),
-        FailureCondition(
+        FailureCondition.model_construct(
             condition="task profile update failed",
             retryable=True,
             error_code="AEON.PHASE_TRANSITION.D_AB.002",
         ),
-    ],
+    ),
 )
 
 # Context Propagation Specification Constants
 # These specifications define required fields for each phase (must-have, must-pass-unchanged, may-modify).
+# Built with model_construct() for the same reason as the contracts above.
 
-CONTEXT_SPEC_PHASE_A = ContextPropagationSpecification(
+CONTEXT_SPEC_PHASE_A = ContextPropagationSpecification.model_construct(
     phase="A",
-    must_have_fields=[
+    must_have_fields=(
         "request",
         "pass_number",
         "phase",
         "ttl_remaining",
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    must_pass_unchanged_fields=[
+    ),
+    must_pass_unchanged_fields=(
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    may_modify_fields=[],  # Phase A produces initial context
+    ),
+    may_modify_fields=(),  # Phase A produces initial context
 )
 
-CONTEXT_SPEC_PHASE_B = ContextPropagationSpecification(
+CONTEXT_SPEC_PHASE_B = ContextPropagationSpecification.model_construct(
     phase="B",
-    must_have_fields=[
+    must_have_fields=(
         "request",
         "task_profile",
         "initial_plan",
@@ -241,17 +263,17 @@ CONTEXT_SPEC_PHASE_B = ContextPropagationSpecification(
         "ttl_remaining",
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    must_pass_unchanged_fields=[
+    ),
+    must_pass_unchanged_fields=(
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    may_modify_fields=["refined_plan"],  # Phase B produces refined plan
+    ),
+    may_modify_fields=("refined_plan",),  # Phase B produces refined plan
 )
 
-CONTEXT_SPEC_PHASE_C = ContextPropagationSpecification(
+CONTEXT_SPEC_PHASE_C = ContextPropagationSpecification.model_construct(
     phase="C",
-    must_have_fields=[
+    must_have_fields=(
         "request",
         "task_profile",
         "refined_plan",
@@ -260,21 +282,21 @@ CONTEXT_SPEC_PHASE_C = ContextPropagationSpecification(
         "ttl_remaining",
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    must_pass_unchanged_fields=[
+    ),
+    must_pass_unchanged_fields=(
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    may_modify_fields=[
+    ),
+    may_modify_fields=(
         "execution_results",
         "evaluation_results",
         "refinement_changes",
-    ],  # Phase C produces execution and evaluation results
+    ),  # Phase C produces execution and evaluation results
 )
 
-CONTEXT_SPEC_PHASE_D = ContextPropagationSpecification(
+CONTEXT_SPEC_PHASE_D = ContextPropagationSpecification.model_construct(
     phase="D",
-    must_have_fields=[
+    must_have_fields=(
         "request",
         "task_profile",
         "evaluation_results",
@@ -284,14 +306,108 @@ CONTEXT_SPEC_PHASE_D = ContextPropagationSpecification(
         "ttl_remaining",
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    must_pass_unchanged_fields=[
+    ),
+    must_pass_unchanged_fields=(
         "correlation_id",
         "execution_start_timestamp",
-    ],
-    may_modify_fields=["task_profile"],  # Phase D may update task profile
+    ),
+    may_modify_fields=("task_profile",),  # Phase D may update task profile
 )
 
+# Lookup tables built once at import (contracts and specs are per-transition/phase constants)
+_PHASE_TRANSITION_CONTRACTS: Dict[str, PhaseTransitionContract] = {
+    "A→B": CONTRACT_A_TO_B,
+    "B→C": CONTRACT_B_TO_C,
+    "C→D": CONTRACT_C_TO_D,
+    "D→A/B": CONTRACT_D_TO_A_B,
+}
+_CONTEXT_PROPAGATION_SPECS: Dict[str, ContextPropagationSpecification] = {
+    "A": CONTEXT_SPEC_PHASE_A,
+    "B": CONTEXT_SPEC_PHASE_B,
+    "C": CONTEXT_SPEC_PHASE_C,
+    "D": CONTEXT_SPEC_PHASE_D,
+}
+
+# Required LLM context fields per phase, with a C-level getter fetching them all at once.
+# Only specs whose must-pass-unchanged fields are a subset of the must-have fields qualify,
+# so that a complete must-have set also satisfies validate_context_propagation().
+_PHASE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    phase: spec.must_have_fields
+    for phase, spec in _CONTEXT_PROPAGATION_SPECS.items()
+    if len(spec.must_have_fields) > 1
+    and set(spec.must_pass_unchanged_fields) <= set(spec.must_have_fields)
+}
+_PHASE_FIELD_GETTERS: Dict[str, Callable[[Dict[str, Any]], Tuple[Any, ...]]] = {
+    phase: itemgetter(*fields) for phase, fields in _PHASE_FIELDS.items()
+}
+# (must-have, must-pass-unchanged) field sets per phase for the context validation happy path
+_PHASE_FIELD_SETS: Dict[str, Tuple[frozenset, frozenset]] = {
+    phase: (frozenset(spec.must_have_fields), frozenset(spec.must_pass_unchanged_fields))
+    for phase, spec in _CONTEXT_PROPAGATION_SPECS.items()
+}
+
+# Sentinel for inputs/outputs missing from a transition dict (distinct from a None value)
+_MISSING = object()
+
+
+def _model_state(obj: Any, fallback: Callable[[Any], Any] = lambda _: {}) -> Any:
+    """Serialize a model for state snapshots; non-model values go through fallback."""
+    model_dump = getattr(obj, "model_dump", None)
+    return model_dump() if model_dump is not None else fallback(obj)
+
+
+def _issue_severity(issue: Any) -> Optional[str]:
+    """Severity of a validation issue given as a dict or a ValidationIssue-like object."""
+    if isinstance(issue, dict):
+        return issue.get("severity")
+    return getattr(issue, "severity", None)
+
+
+def _compile_rules(rules: Dict[str, Any]) -> Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]:
+    """Flatten a field → rule mapping into (field_name, rule or None) pairs."""
+    return tuple((field_name, rule if callable(rule) else None) for field_name, rule in rules.items())
+
+
+# Required-input and guaranteed-output rules of the built-in contracts, flattened once at import
+_COMPILED_REQUIRED_INPUTS = {
+    name: _compile_rules(contract.required_inputs) for name, contract in _PHASE_TRANSITION_CONTRACTS.items()
+}
+_COMPILED_GUARANTEED_OUTPUTS = {
+    name: _compile_rules(contract.guaranteed_outputs) for name, contract in _PHASE_TRANSITION_CONTRACTS.items()
+}
+
+# Lowercased failure conditions of the built-in contracts, for matching against error messages
+_FAILURE_TABLE: Dict[str, Tuple[Tuple[str, FailureCondition], ...]] = {
+    name: tuple((fc.condition.lower(), fc) for fc in contract.failure_conditions)
+    for name, contract in _PHASE_TRANSITION_CONTRACTS.items()
+}
+
+
+def _match_failure_condition(
+    transition_name: str,
+    contract: PhaseTransitionContract,
+    error_message: str,
+) -> Optional[FailureCondition]:
+    """Return the first failure condition of the contract mentioned in error_message."""
+    if contract is _PHASE_TRANSITION_CONTRACTS.get(transition_name):
+        table = _FAILURE_TABLE[transition_name]
+    else:
+        table = tuple((fc.condition.lower(), fc) for fc in contract.failure_conditions)
+    error_lower = error_message.lower()
+    return next((fc for condition, fc in table if condition in error_lower), None)
+
+
+def _contract_rules(
+    transition_name: str,
+    contract: PhaseTransitionContract,
+    compiled: Dict[str, Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]],
+    rules: Dict[str, Any],
+) -> Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]:
+    """Return precompiled rules for built-in contracts, compiling custom contracts on the fly."""
+    if contract is _PHASE_TRANSITION_CONTRACTS.get(transition_name):
+        return compiled[transition_name]
+    return _compile_rules(rules)
+
 
 # Phase Transition Contract Functions
 def get_phase_transition_contract(
@@ -309,15 +425,10 @@ def get_phase_transition_contract(
     Raises:
         ValueError: If transition_name is invalid
     """
-    contracts = {
-        "A→B": CONTRACT_A_TO_B,
-        "B→C": CONTRACT_B_TO_C,
-        "C→D": CONTRACT_C_TO_D,
-        "D→A/B": CONTRACT_D_TO_A_B,
-    }
-    if transition_name not in contracts:
+    contract = _PHASE_TRANSITION_CONTRACTS.get(transition_name)
+    if contract is None:
         raise ValueError(f"Invalid transition name: {transition_name}")
-    return contracts[transition_name]
+    return contract
 
 
 def validate_phase_transition_contract(
@@ -340,12 +451,14 @@ def validate_phase_transition_contract(
         contract = get_phase_transition_contract(transition_name)
 
     # Validate all required inputs are present and match validation rules
-    for field_name, validation_rule in contract.required_inputs.items():
-        if field_name not in inputs:
+    rules = _contract_rules(transition_name, contract, _COMPILED_REQUIRED_INPUTS, contract.required_inputs)
+    for field_name, validation_rule in rules:
+        value = inputs.get(field_name, _MISSING)
+        if value is _MISSING:
             return (False, f"Missing required input: {field_name}")
-        if callable(validation_rule):
+        if validation_rule is not None:
             try:
-                if not validation_rule(inputs[field_name]):
+                if not validation_rule(value):
                     return (False, f"Validation failed for input: {field_name}")
             except Exception as e:
                 return (False, f"Validation error for input {field_name}: {str(e)}")
@@ -371,47 +484,78 @@ def enforce_phase_transition_contract(
     Returns:
         Tuple of (success, error_message, phase_transition_error)
     """
-    from aeon.exceptions import PhaseTransitionError
-
     if contract is None:
         contract = get_phase_transition_contract(transition_name)
 
     # Validate inputs
     is_valid, error_message = validate_phase_transition_contract(transition_name, inputs, contract)
     if not is_valid:
-        # Find matching failure condition
-        failure_condition = next(
-            (fc for fc in contract.failure_conditions if fc.condition in error_message.lower()),
-            None,
-        )
-        if failure_condition:
-            error = PhaseTransitionError(
-                transition_name=transition_name,
-                failure_condition=error_message,
-                retryable=failure_condition.retryable,
-            )
-            return (False, error_message, error)
-        else:
-            # Default error for unenumerated failures
-            error = PhaseTransitionError(
-                transition_name=transition_name,
-                failure_condition=error_message,
-                retryable=False,
-            )
-            return (False, error_message, error)
+        return (False, error_message, _build_phase_error(transition_name, error_message, contract))
 
     # Validate outputs
-    for field_name, validation_rule in contract.guaranteed_outputs.items():
-        if field_name not in outputs:
-            return (False, f"Missing guaranteed output: {field_name}", None)
-        if callable(validation_rule):
+    is_valid, error_message = _validate_outputs_only(transition_name, outputs, contract)
+    if not is_valid:
+        return (False, error_message, None)
+
+    return (True, None, None)
+
+
+def _build_phase_error(
+    transition_name: str,
+    error_message: str,
+    contract: PhaseTransitionContract,
+) -> PhaseTransitionError:
+    """
+    Build the PhaseTransitionError for a failed input validation.
+
+    Retryability comes from the contract's matching failure condition; unenumerated
+    failures default to non-retryable.
+
+    Args:
+        transition_name: Transition identifier
+        error_message: Validation error message
+        contract: Phase transition contract
+
+    Returns:
+        PhaseTransitionError for the failure
+    """
+    failure_condition = _match_failure_condition(transition_name, contract, error_message)
+    return PhaseTransitionError(
+        transition_name=transition_name,
+        failure_condition=error_message,
+        retryable=failure_condition.retryable if failure_condition else False,
+    )
+
+
+def _validate_outputs_only(
+    transition_name: str,
+    outputs: Dict[str, Any],
+    contract: PhaseTransitionContract,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Validate phase transition outputs against contract (inputs are not checked).
+
+    Args:
+        transition_name: Transition identifier
+        outputs: Output dictionary to validate
+        contract: Phase transition contract
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    rules = _contract_rules(transition_name, contract, _COMPILED_GUARANTEED_OUTPUTS, contract.guaranteed_outputs)
+    for field_name, validation_rule in rules:
+        value = outputs.get(field_name, _MISSING)
+        if value is _MISSING:
+            return (False, f"Missing guaranteed output: {field_name}")
+        if validation_rule is not None:
             try:
-                if not validation_rule(outputs[field_name]):
-                    return (False, f"Validation failed for output: {field_name}", None)
+                if not validation_rule(value):
+                    return (False, f"Validation failed for output: {field_name}")
             except Exception as e:
-                return (False, f"Validation error for output {field_name}: {str(e)}", None)
+                return (False, f"Validation error for output {field_name}: {str(e)}")
 
-    return (True, None, None)
+    return (True, None)
 
 
 # Context Propagation Functions
@@ -430,15 +574,10 @@ def get_context_propagation_specification(
     Raises:
         ValueError: If phase is invalid
     """
-    specs = {
-        "A": CONTEXT_SPEC_PHASE_A,
-        "B": CONTEXT_SPEC_PHASE_B,
-        "C": CONTEXT_SPEC_PHASE_C,
-        "D": CONTEXT_SPEC_PHASE_D,
-    }
-    if phase not in specs:
+    spec = _CONTEXT_PROPAGATION_SPECS.get(phase)
+    if spec is None:
         raise ValueError(f"Invalid phase: {phase}")
-    return specs[phase]
+    return spec
 
 
 def validate_context_propagation(
@@ -460,6 +599,18 @@ def validate_context_propagation(
     if specification is None:
         specification = get_context_propagation_specification(phase)
 
+    # Happy path for built-in specs: one subset test per field set against the key view
+    field_sets = _PHASE_FIELD_SETS.get(phase) if specification is _CONTEXT_PROPAGATION_SPECS.get(phase) else None
+    if field_sets is not None:
+        must_have, must_pass_unchanged = field_sets
+        context_keys = context.keys()
+        if (
+            must_have <= context_keys
+            and must_pass_unchanged <= context_keys
+            and not any(context[field_name] is None for field_name in must_have)
+        ):
+            return (True, None, [])
+
     missing_fields = []
     # Validate all must_have_fields are present and non-null
     for field_name in specification.must_have_fields:
@@ -504,6 +655,16 @@ def build_llm_context(
     if specification is None:
         specification = get_context_propagation_specification(phase)
 
+    # Fast path for built-in specs: fetch all required fields in one itemgetter call and
+    # build the LLM context directly when every field is present and non-null
+    if specification is _CONTEXT_PROPAGATION_SPECS.get(phase) and phase in _PHASE_FIELD_GETTERS:
+        try:
+            values = _PHASE_FIELD_GETTERS[phase](context)
+        except KeyError:
+            values = None
+        if values is not None and not any(value is None for value in values):
+            return dict(zip(_PHASE_FIELDS[phase], values))
+
     # Validate context first
     is_valid, error_message, missing_fields = validate_context_propagation(phase, context, specification)
     if not is_valid:
@@ -536,50 +697,23 @@ def validate_and_enforce_phase_transition(
     Raises:
         PhaseTransitionError: If validation fails or contract is violated
     """
-    from aeon.exceptions import PhaseTransitionError
-
     if contract is None:
         contract = get_phase_transition_contract(transition_name)
 
     # Validate inputs
     is_valid, error_message = validate_phase_transition_contract(transition_name, inputs, contract)
     if not is_valid:
-        # Find matching failure condition
-        failure_condition = next(
-            (fc for fc in contract.failure_conditions if fc.condition.lower() in error_message.lower()),
-            None,
-        )
-        if failure_condition:
-            phase_error = PhaseTransitionError(
-                transition_name=transition_name,
-                failure_condition=error_message,
-                retryable=failure_condition.retryable,
-            )
-            raise phase_error
-        else:
-            # Default error for unenumerated failures
-            phase_error = PhaseTransitionError(
+        raise _build_phase_error(transition_name, error_message, contract)
+
+    # If outputs provided, enforce contract (inputs were validated above)
+    if outputs is not None:
+        is_valid, error_message = _validate_outputs_only(transition_name, outputs, contract)
+        if not is_valid:
+            raise PhaseTransitionError(
                 transition_name=transition_name,
-                failure_condition=error_message,
+                failure_condition=error_message or "Contract validation failed",
                 retryable=False,
             )
-            raise phase_error
-
-    # If outputs provided, enforce contract
-    if outputs is not None:
-        success_contract, error_message, phase_error = enforce_phase_transition_contract(
-            transition_name, inputs, outputs, contract
-        )
-        if not success_contract:
-            if phase_error:
-                raise phase_error
-            else:
-                phase_error = PhaseTransitionError(
-                    transition_name=transition_name,
-                    failure_condition=error_message or "Contract validation failed",
-                    retryable=False,
-                )
-                raise phase_error
 
 
 def execute_with_retry(
@@ -604,8 +738,6 @@ def execute_with_retry(
     Returns:
         Tuple of (success, result, error_message, phase_transition_error)
     """
-    from aeon.exceptions import PhaseTransitionError
-
     if contract is None:
         contract = get_phase_transition_contract(transition_name)
 
@@ -643,6 +775,47 @@ def execute_with_retry(
         return (False, None, "Unknown error during phase transition", error)
 
 
+# Classify provider errors as retryable or non-retryable
+# Retryable: transient network errors, rate limits (temporary), timeouts
+# Non-retryable: TTL exhaustion, incomplete profile, malformed responses, authentication errors
+_RETRYABLE_ERROR_KEYWORDS = (
+    "network",
+    "timeout",
+    "rate limit",
+    "temporary",
+    "service unavailable",
+    "connection",
+)
+_NON_RETRYABLE_ERROR_KEYWORDS = (
+    "ttl",
+    "expired",
+    "authentication",
+    "unauthorized",
+    "invalid api key",
+    "malformed",
+    "parse error",
+    "incomplete",
+)
+# Each keyword list compiled into a single alternation, so a message is scanned once per list
+_RETRYABLE_ERROR_RE = re.compile("|".join(map(re.escape, _RETRYABLE_ERROR_KEYWORDS)))
+_NON_RETRYABLE_ERROR_RE = re.compile("|".join(map(re.escape, _NON_RETRYABLE_ERROR_KEYWORDS)))
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Determine if error is retryable based on error message and type."""
+    error_str = str(error).lower()
+
+    # Non-retryable keywords take precedence over retryable ones
+    if _NON_RETRYABLE_ERROR_RE.search(error_str):
+        return False
+    if _RETRYABLE_ERROR_RE.search(error_str):
+        return True
+
+    # Default: treat LLMError as potentially retryable (network/timeout issues)
+    # but other errors as non-retryable
+    return isinstance(error, LLMError)
+
+
 def call_llm_with_provider_error_handling(
     llm_adapter: Any,
     prompt: str,
@@ -674,50 +847,17 @@ def call_llm_with_provider_error_handling(
         LLMError: On non-retryable errors or after retry fails
         PhaseTransitionError: On retryable errors that fail after retry
     """
-    from aeon.exceptions import LLMError, PhaseTransitionError
-
-    # Classify provider errors as retryable or non-retryable
-    # Retryable: transient network errors, rate limits (temporary), timeouts
-    # Non-retryable: TTL exhaustion, incomplete profile, malformed responses, authentication errors
-
-    retryable_error_keywords = [
-        "network",
-        "timeout",
-        "rate limit",
-        "temporary",
-        "service unavailable",
-        "connection",
-    ]
-
-    non_retryable_error_keywords = [
-        "ttl",
-        "expired",
-        "authentication",
-        "unauthorized",
-        "invalid api key",
-        "malformed",
-        "parse error",
-        "incomplete",
-    ]
-
-    def is_retryable_error(error: Exception) -> bool:
-        """Determine if error is retryable based on error message and type."""
-        error_str = str(error).lower()
-        error_type = type(error).__name__.lower()
-
-        # Check for non-retryable keywords first
-        for keyword in non_retryable_error_keywords:
-            if keyword in error_str:
-                return False
-
-        # Check for retryable keywords
-        for keyword in retryable_error_keywords:
-            if keyword in error_str:
-                return True
-
-        # Default: treat LLMError as potentially retryable (network/timeout issues)
-        # but other errors as non-retryable
-        return isinstance(error, LLMError)
+    # Structured abort: PhaseTransitionError inside a phase, plain LLMError otherwise
+    transition_name = f"{phase}→*" if phase else None  # Transition name depends on phase
+
+    def _abort(failure_condition: str, llm_message: str, cause: Optional[BaseException] = None) -> NoReturn:
+        if transition_name:
+            raise PhaseTransitionError(
+                transition_name=transition_name,
+                failure_condition=failure_condition,
+                retryable=False,
+            ) from cause
+        raise LLMError(llm_message) from cause
 
     # Attempt LLM call with retry logic
     last_error = None
@@ -738,7 +878,6 @@ def call_llm_with_provider_error_handling(
                     ttl_remaining, phase, execution_pass
                 )
                 if not can_proceed:
-                    from aeon.exceptions import TTLExpiredError
                     raise TTLExpiredError(
                         f"TTL expired mid-phase after LLM call in phase {phase}: "
                         f"{expiration_response.message if expiration_response else 'Unknown'}"
@@ -747,58 +886,92 @@ def call_llm_with_provider_error_handling(
             return response
         except LLMError as e:
             last_error = e
-            if is_retryable_error(e) and attempt < max_retries:
+            if _is_retryable_error(e) and attempt < max_retries:
                 # Retry once for retryable errors
                 continue
-            else:
-                # Non-retryable or retry exhausted - abort with structured error
-                if phase:
-                    error = PhaseTransitionError(
-                        transition_name=f"{phase}→*",  # Transition name depends on phase
-                        failure_condition=f"LLM provider error: {str(e)}",
-                        retryable=is_retryable_error(e) and attempt < max_retries,
-                    )
-                    raise error from e
-                else:
-                    raise LLMError(f"LLM provider error (non-retryable or retry exhausted): {str(e)}") from e
+            # Non-retryable or retry exhausted - abort with structured error
+            _abort(
+                f"LLM provider error: {e}",
+                f"LLM provider error (non-retryable or retry exhausted): {e}",
+                e,
+            )
         except Exception as e:
             # Unexpected exception - treat as non-retryable
-            if phase:
-                error = PhaseTransitionError(
-                    transition_name=f"{phase}→*",
-                    failure_condition=f"Unexpected error during LLM call: {str(e)}",
-                    retryable=False,
-                )
-                raise error from e
-            else:
-                raise LLMError(f"Unexpected error during LLM call: {str(e)}") from e
+            _abort(f"Unexpected error during LLM call: {e}", f"Unexpected error during LLM call: {e}", e)
 
     # All retries exhausted
     if last_error:
-        if phase:
-            error = PhaseTransitionError(
-                transition_name=f"{phase}→*",
-                failure_condition=f"LLM provider error (retry exhausted): {str(last_error)}",
-                retryable=False,
-            )
-            raise error from last_error
-        else:
-            raise LLMError(f"LLM provider error (retry exhausted): {str(last_error)}") from last_error
-    else:
-        if phase:
-            error = PhaseTransitionError(
-                transition_name=f"{phase}→*",
-                failure_condition="Unknown error during LLM call",
-                retryable=False,
-            )
-            raise error
-        else:
-            raise LLMError("Unknown error during LLM call")
+        _abort(
+            f"LLM provider error (retry exhausted): {last_error}",
+            f"LLM provider error (retry exhausted): {last_error}",
+            last_error,
+        )
+    _abort("Unknown error during LLM call", "Unknown error during LLM call")
+
+
+class _NullLogger:
+    """No-op stand-in for JSONLLogger when a phase runs without logger or correlation_id."""
+
+    def should_sample(self, correlation_id: Optional[str]) -> bool:
+        return False
+
+    def log_phase_entry(self, **kwargs: Any) -> None:
+        pass
+
+    def log_phase_exit(self, **kwargs: Any) -> None:
+        pass
+
+    def log_state_snapshot(self, **kwargs: Any) -> None:
+        pass
+
+    def log_ttl_snapshot(self, **kwargs: Any) -> None:
+        pass
+
+    def log_phase_transition_error(self, **kwargs: Any) -> None:
+        pass
+
+
+_NULL_LOGGER = _NullLogger()
+
+
+def _snapshot_logger(log: Any, correlation_id: Optional[str]) -> Any:
+    """Return log if this execution's snapshots are sampled, else the no-op logger.
+
+    Loggers without should_sample (e.g. custom JSONLLogger stand-ins) sample every execution.
+    Phase methods compare the result against _NULL_LOGGER before building snapshot
+    payloads, so plan and profile serialization is skipped when snapshots are off.
+    """
+    should_sample = getattr(log, "should_sample", None)
+    if should_sample is None or should_sample(correlation_id):
+        return log
+    return _NULL_LOGGER
+
+
+def _skip_context_validation(*args: Any, **kwargs: Any) -> Tuple[bool, Optional[str], List[str]]:
+    """Stand-in for validate_context_propagation() when context validation is disabled."""
+    return (True, None, [])
 
 
 class PhaseOrchestrator:
     """Orchestrates Phase A/B/C/D logic for multi-pass execution."""
 
+    def __init__(self, validate_context: bool = True) -> None:
+        """
+        Initialize the phase orchestrator.
+
+        Args:
+            validate_context: Validate each phase's context against its propagation spec
+                before the LLM context is built (default True). When False, the explicit
+                validation pass is skipped; build_llm_context() still rejects missing or
+                null required fields with ValueError instead of ContextPropagationError.
+        """
+        # Bound once; with validate_context=False the per-phase validation is a no-op
+        self._validate_context_propagation = (
+            validate_context_propagation if validate_context else _skip_context_validation
+        )
+        # Shared across calls so populate_step_indices() can skip re-indexing an unchanged plan
+        self._step_prep = StepPreparation()
+
     def phase_a_taskprofile_ttl(
         self,
         request: str,
@@ -824,32 +997,28 @@ class PhaseOrchestrator:
         Returns:
             Tuple of (success, (task_profile, allocated_ttl), error_message)
         """
-        from datetime import datetime
-        from aeon.adaptive.models import TaskProfile
-        from aeon.exceptions import ContextPropagationError
-
-        phase_start_time = datetime.now()
+        phase_start_ns = time.perf_counter_ns()
         correlation_id = execution_context.correlation_id if execution_context else None
+        log = logger if logger and correlation_id else _NULL_LOGGER
+        snapshot_log = _snapshot_logger(log, correlation_id)
         ttl_before = ttl_remaining if ttl_remaining is not None else global_ttl
 
         # T084: Integrate phase entry logging in Phase A
-        if logger and correlation_id:
-            logger.log_phase_entry(
-                phase="A",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-            )
+        log.log_phase_entry(
+            phase="A",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+        )
 
         # T096: Integrate TTL snapshot logging at Phase A boundary
-        if logger and correlation_id:
-            logger.log_ttl_snapshot(
-                correlation_id=correlation_id,
-                phase="A",
-                pass_number=pass_number,
-                ttl_before=ttl_before,
-                ttl_after=ttl_before,  # TTL doesn't change in Phase A
-                ttl_at_boundary=ttl_before,
-            )
+        snapshot_log.log_ttl_snapshot(
+            correlation_id=correlation_id,
+            phase="A",
+            pass_number=pass_number,
+            ttl_before=ttl_before,
+            ttl_after=ttl_before,  # TTL doesn't change in Phase A
+            ttl_at_boundary=ttl_before,
+        )
 
         # Use provided ttl_remaining or default to global_ttl
         if ttl_remaining is None:
@@ -873,20 +1042,19 @@ class PhaseOrchestrator:
             context["execution_start_timestamp"] = execution_context.execution_start_timestamp
 
         # T092: Integrate state snapshot logging before Phase A transition
-        if logger and correlation_id:
-            logger.log_state_snapshot(
-                correlation_id=correlation_id,
-                phase="A",
-                pass_number=pass_number,
-                plan_state={},  # No plan state in Phase A
-                ttl_remaining=ttl_remaining,
-                phase_state={"request": request, "global_ttl": global_ttl},
-                snapshot_type="before_transition",
-            )
+        snapshot_log.log_state_snapshot(
+            correlation_id=correlation_id,
+            phase="A",
+            pass_number=pass_number,
+            plan_state={},  # No plan state in Phase A
+            ttl_remaining=ttl_remaining,
+            phase_state={"request": request, "global_ttl": global_ttl},
+            snapshot_type="before_transition",
+        )
 
         # T028: Integrate context validation before Phase A LLM calls
-        spec = get_context_propagation_specification("A")
-        is_valid, error_message, missing_fields = validate_context_propagation("A", context, spec)
+        spec = CONTEXT_SPEC_PHASE_A
+        is_valid, error_message, missing_fields = self._validate_context_propagation("A", context, spec)
         if not is_valid:
             error = ContextPropagationError(
                 phase="A",
@@ -894,37 +1062,35 @@ class PhaseOrchestrator:
                 message=error_message,
             )
             # T100: Integrate structured error logging for Phase A failures
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="A",
-                    pass_number=pass_number,
-                    error_code="AEON.CONTEXT_PROPAGATION.A.001",
-                    severity="ERROR",
-                    affected_component="phase_a",
-                    failure_condition=error_message,
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="A",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="A",
+                pass_number=pass_number,
+                error_code="AEON.CONTEXT_PROPAGATION.A.001",
+                severity="ERROR",
+                affected_component="phase_a",
+                failure_condition=error_message,
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="A",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             return (False, (None, global_ttl), str(error))
 
-        # Build LLM context from validated context
-        llm_context = build_llm_context("A", context, spec)
-
         if not adaptive_depth:
-            # Fallback to default if AdaptiveDepth not available
+            # Fallback to default if AdaptiveDepth not available (no LLM context needed)
             default_task_profile = TaskProfile.default()
             allocated_ttl = global_ttl
             return (True, (default_task_profile, allocated_ttl), None)
 
+        # Build LLM context from validated context
+        llm_context = build_llm_context("A", context, spec)
+
         try:
             # Infer TaskProfile using AdaptiveDepth
             # Note: AdaptiveDepth.infer_task_profile doesn't accept context dict yet,
@@ -941,51 +1107,48 @@ class PhaseOrchestrator:
             )
 
             # T092: Integrate state snapshot logging after Phase A transition
-            if logger and correlation_id:
-                logger.log_state_snapshot(
+            if snapshot_log is not _NULL_LOGGER:
+                snapshot_log.log_state_snapshot(
                     correlation_id=correlation_id,
                     phase="A",
                     pass_number=pass_number,
                     plan_state={},  # No plan state in Phase A
                     ttl_remaining=allocated_ttl,
-                    phase_state={"task_profile": task_profile.model_dump() if hasattr(task_profile, "model_dump") else str(task_profile)},
+                    phase_state={"task_profile": _model_state(task_profile, str)},
                     snapshot_type="after_transition",
                 )
 
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
             # T088: Integrate phase exit logging in Phase A
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="A",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="success",
-                )
+            log.log_phase_exit(
+                phase="A",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="success",
+            )
 
             return (True, (task_profile, allocated_ttl), None)
         except Exception as e:
             # T100: Integrate structured error logging for Phase A failures
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="A",
-                    pass_number=pass_number,
-                    error_code="AEON.PHASE_TRANSITION.A_B.001",
-                    severity="ERROR",
-                    affected_component="phase_a",
-                    failure_condition=str(e),
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="A",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="A",
+                pass_number=pass_number,
+                error_code="AEON.PHASE_TRANSITION.A_B.001",
+                severity="ERROR",
+                affected_component="phase_a",
+                failure_condition=str(e),
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="A",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             # If inference or allocation fails, return error result
             return (False, (None, global_ttl), str(e))
 
@@ -1020,24 +1183,22 @@ class PhaseOrchestrator:
         Returns:
             Tuple of (success, refined_plan, error_message)
         """
-        from datetime import datetime
-        from aeon.exceptions import ContextPropagationError
-
-        phase_start_time = datetime.now()
+        phase_start_ns = time.perf_counter_ns()
         correlation_id = execution_context.correlation_id if execution_context else None
+        log = logger if logger and correlation_id else _NULL_LOGGER
+        snapshot_log = _snapshot_logger(log, correlation_id)
         ttl_before = ttl_remaining if ttl_remaining is not None else None
 
         # T085: Integrate phase entry logging in Phase B
-        if logger and correlation_id:
-            logger.log_phase_entry(
-                phase="B",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-            )
+        log.log_phase_entry(
+            phase="B",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+        )
 
         # T097: Integrate TTL snapshot logging at Phase B boundary
-        if logger and correlation_id and ttl_before is not None:
-            logger.log_ttl_snapshot(
+        if ttl_before is not None:
+            snapshot_log.log_ttl_snapshot(
                 correlation_id=correlation_id,
                 phase="B",
                 pass_number=pass_number,
@@ -1065,35 +1226,25 @@ class PhaseOrchestrator:
         if ttl_remaining is not None:
             context["ttl_remaining"] = ttl_remaining
 
-        # Add initial_plan goal and step metadata to context (required by spec)
-        # T044: initial_plan_steps is documented as optional/future use (not used in prompts currently)
+        # Add initial_plan goal to context
         if plan:
             context["initial_plan_goal"] = plan.goal if hasattr(plan, "goal") else None
-            # Note: initial_plan_steps is included for future prompt enhancements, not currently used
-            context["initial_plan_steps"] = [
-                {
-                    "step_id": step.step_id,
-                    "description": step.description,
-                    "status": step.status.value if hasattr(step.status, "value") else str(step.status),
-                }
-                for step in (plan.steps if hasattr(plan, "steps") and plan.steps else [])
-            ]
 
         # T093: Integrate state snapshot logging before Phase B transition
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="B",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                plan_state=_model_state(plan),
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
-                phase_state={"request": request, "task_profile": task_profile.model_dump() if hasattr(task_profile, "model_dump") else str(task_profile)},
+                phase_state={"request": request, "task_profile": _model_state(task_profile, str)},
                 snapshot_type="before_transition",
             )
 
         # T029: Integrate context validation before Phase B LLM calls
-        spec = get_context_propagation_specification("B")
-        is_valid, error_message, missing_fields = validate_context_propagation("B", context, spec)
+        spec = CONTEXT_SPEC_PHASE_B
+        is_valid, error_message, missing_fields = self._validate_context_propagation("B", context, spec)
         if not is_valid:
             error = ContextPropagationError(
                 phase="B",
@@ -1101,26 +1252,24 @@ class PhaseOrchestrator:
                 message=error_message,
             )
             # T101: Integrate structured error logging for Phase B failures
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="B",
-                    pass_number=pass_number,
-                    error_code="AEON.CONTEXT_PROPAGATION.B.001",
-                    severity="ERROR",
-                    affected_component="phase_b",
-                    failure_condition=error_message,
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="B",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="B",
+                pass_number=pass_number,
+                error_code="AEON.CONTEXT_PROPAGATION.B.001",
+                severity="ERROR",
+                affected_component="phase_b",
+                failure_condition=error_message,
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="B",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             return (False, plan, str(error))
 
         # Build LLM context from validated context
@@ -1153,8 +1302,6 @@ class PhaseOrchestrator:
                     )
                     # If validation issues found, refine plan
                     if semantic_validation_report.issues and recursive_planner:
-                        from aeon.orchestration.refinement import PlanRefinement
-
                         refinement_actions = recursive_planner.refine_plan(
                             current_plan=refined_plan,
                             validation_issues=semantic_validation_report.issues,
@@ -1163,8 +1310,6 @@ class PhaseOrchestrator:
                             executed_step_ids=set(),
                         )
                         # Apply refinement actions to plan
-                        from aeon.orchestration.refinement import PlanRefinement
-
                         plan_refinement = PlanRefinement()
                         success, refined_plan, error = plan_refinement.apply_actions(
                             refined_plan, refinement_actions
@@ -1178,51 +1323,49 @@ class PhaseOrchestrator:
                     pass
 
             # T093: Integrate state snapshot logging after Phase B transition
-            if logger and correlation_id:
-                logger.log_state_snapshot(
+            if snapshot_log is not _NULL_LOGGER:
+                refined_plan_state = _model_state(refined_plan, str)
+                snapshot_log.log_state_snapshot(
                     correlation_id=correlation_id,
                     phase="B",
                     pass_number=pass_number,
-                    plan_state=refined_plan.model_dump() if hasattr(refined_plan, "model_dump") else {},
+                    plan_state=refined_plan_state if isinstance(refined_plan_state, dict) else {},
                     ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
-                    phase_state={"refined_plan": refined_plan.model_dump() if hasattr(refined_plan, "model_dump") else str(refined_plan)},
+                    phase_state={"refined_plan": refined_plan_state},
                     snapshot_type="after_transition",
                 )
 
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
             # T089: Integrate phase exit logging in Phase B
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="B",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="success",
-                )
+            log.log_phase_exit(
+                phase="B",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="success",
+            )
 
             return (True, refined_plan, None)
         except Exception as e:
             # T101: Integrate structured error logging for Phase B failures
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="B",
-                    pass_number=pass_number,
-                    error_code="AEON.PHASE_TRANSITION.B_C.001",
-                    severity="ERROR",
-                    affected_component="phase_b",
-                    failure_condition=str(e),
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="B",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="B",
+                pass_number=pass_number,
+                error_code="AEON.PHASE_TRANSITION.B_C.001",
+                severity="ERROR",
+                affected_component="phase_b",
+                failure_condition=str(e),
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="B",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             # On failure, return original plan with error
             return (False, plan, str(e))
 
@@ -1243,6 +1386,7 @@ class PhaseOrchestrator:
         request: Optional[str] = None,
         previous_outputs: Optional[List[Dict[str, Any]]] = None,
         refinement_changes: Optional[List[Dict[str, Any]]] = None,
+        max_concurrent_steps: int = 1,
     ) -> PhaseCExecuteResult:
         """
         Phase C: Execute batch of ready steps.
@@ -1263,31 +1407,29 @@ class PhaseOrchestrator:
             request: Natural language request (optional)
             previous_outputs: Previous execution results (optional)
             refinement_changes: Refinement changes from previous pass (optional)
+            max_concurrent_steps: Maximum ready steps executed concurrently (default 1, serial).
+                Only for external, thread-safe execute_step_fn implementations; the
+                kernel's _execute_step must run serially.
 
         Returns:
             List of execution results (dicts with step_id, status, output, clarity_state)
         """
-        from datetime import datetime
-        from aeon.plan.models import StepStatus
-        from aeon.exceptions import ContextPropagationError
-
-        from aeon.orchestration.step_prep import StepPreparation
-
-        phase_start_time = datetime.now()
+        phase_start_ns = time.perf_counter_ns()
         correlation_id = execution_context.correlation_id if execution_context else None
+        log = logger if logger and correlation_id else _NULL_LOGGER
+        snapshot_log = _snapshot_logger(log, correlation_id)
         ttl_before = ttl_remaining if ttl_remaining is not None else None
 
         # T086: Integrate phase entry logging in Phase C (execute)
-        if logger and correlation_id:
-            logger.log_phase_entry(
-                phase="C",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-            )
+        log.log_phase_entry(
+            phase="C",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+        )
 
         # T098: Integrate TTL snapshot logging at Phase C boundary (execute)
-        if logger and correlation_id and ttl_before is not None:
-            logger.log_ttl_snapshot(
+        if ttl_before is not None:
+            snapshot_log.log_ttl_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
@@ -1314,19 +1456,9 @@ class PhaseOrchestrator:
         if execution_context:
             context["correlation_id"] = execution_context.correlation_id
             context["execution_start_timestamp"] = execution_context.execution_start_timestamp
-        # Add refined_plan goal and step metadata
-        # T044: refined_plan_steps is documented as optional/future use (not used in prompts currently)
+        # Add refined_plan goal to context
         if plan:
             context["refined_plan_goal"] = plan.goal if hasattr(plan, "goal") else None
-            # Note: refined_plan_steps is included for future prompt enhancements, not currently used
-            context["refined_plan_steps"] = [
-                {
-                    "step_id": step.step_id,
-                    "description": step.description,
-                    "status": step.status.value if hasattr(step.status, "value") else str(step.status),
-                }
-                for step in (plan.steps if hasattr(plan, "steps") and plan.steps else [])
-            ]
         # Add previous outputs and refinement changes
         if previous_outputs:
             context["previous_outputs"] = previous_outputs
@@ -1334,20 +1466,20 @@ class PhaseOrchestrator:
             context["refinement_changes"] = refinement_changes
 
         # T094: Integrate state snapshot logging before Phase C transition (execute)
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                plan_state=_model_state(plan),
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
                 phase_state={"request": request, "task_profile": task_profile.model_dump() if task_profile and hasattr(task_profile, "model_dump") else str(task_profile) if task_profile else None},
                 snapshot_type="before_transition",
             )
 
         # T030: Integrate context validation before Phase C LLM calls (execution)
-        spec = get_context_propagation_specification("C")
-        is_valid, error_message, missing_fields = validate_context_propagation("C", context, spec)
+        spec = CONTEXT_SPEC_PHASE_C
+        is_valid, error_message, missing_fields = self._validate_context_propagation("C", context, spec)
         if not is_valid:
             error = ContextPropagationError(
                 phase="C",
@@ -1355,26 +1487,24 @@ class PhaseOrchestrator:
                 message=error_message,
             )
             # T102: Integrate structured error logging for Phase C failures (execute)
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="C",
-                    pass_number=pass_number,
-                    error_code="AEON.CONTEXT_PROPAGATION.C.001",
-                    severity="ERROR",
-                    affected_component="phase_c_execute",
-                    failure_condition=error_message,
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="C",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="C",
+                pass_number=pass_number,
+                error_code="AEON.CONTEXT_PROPAGATION.C.001",
+                severity="ERROR",
+                affected_component="phase_c_execute",
+                failure_condition=error_message,
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="C",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             # Return empty results with error - step execution should not proceed without valid context
             return [{"error": str(error), "status": "failed"}]
 
@@ -1384,57 +1514,59 @@ class PhaseOrchestrator:
         # Store both the context and the phase so executor can validate correctly
         if hasattr(state, 'execution_context') and not state.execution_context:
             state.execution_context = execution_context
-        if not hasattr(state, 'phase_context'):
-            state.phase_context = {"phase": "C", "context": llm_context}
-        else:
-            state.phase_context = {"phase": "C", "context": llm_context}
+        state.phase_context = {"phase": "C", "context": llm_context}
 
-        step_prep = StepPreparation()
-        execution_results = []
-        ready_steps = step_prep.get_ready_steps(plan, memory)
+        ready_steps = self._step_prep.get_ready_steps(plan, memory)
 
-        for step in ready_steps:
+        def run_step(step: Any) -> Dict[str, Any]:
             try:
                 # Execute step - context is available via state.phase_c_context
                 # Note: TTL decrement now happens in kernel._execute_step (constitutional requirement)
                 execute_step_fn(step, state)
                 # Handle both enum and string values (use_enum_values=True converts to string)
                 status_value = step.status.value if hasattr(step.status, 'value') else str(step.status)
-                execution_results.append({
+                return {
                     "step_id": step.step_id,
                     "status": status_value,
-                    "output": getattr(step, "step_output", None),
-                    "clarity_state": getattr(step, "clarity_state", None),
-                })
+                    "output": step.step_output,
+                    "clarity_state": step.clarity_state,
+                }
             except Exception as e:
-                execution_results.append({
+                return {
                     "step_id": step.step_id,
                     "status": StepStatus.FAILED.value,
                     "error": str(e),
-                })
+                }
+
+        # Ready steps only depend on steps already COMPLETE, so the batch is a single
+        # dependency level and its steps may run concurrently. Results keep plan order.
+        if max_concurrent_steps > 1 and len(ready_steps) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_concurrent_steps, len(ready_steps))) as pool:
+                execution_results = list(pool.map(run_step, ready_steps))
+        else:
+            execution_results = [run_step(step) for step in ready_steps]
 
         # T094: Integrate state snapshot logging after Phase C transition (execute)
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                plan_state=_model_state(plan),
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
                 phase_state={"execution_results_count": len(execution_results)},
                 snapshot_type="after_transition",
             )
 
-        phase_duration = (datetime.now() - phase_start_time).total_seconds()
+        phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
         # T090: Integrate phase exit logging in Phase C (execute)
-        if logger and correlation_id:
-            logger.log_phase_exit(
-                phase="C",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-                duration=phase_duration,
-                outcome="success",
-            )
+        log.log_phase_exit(
+            phase="C",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+            duration=phase_duration,
+            outcome="success",
+        )
 
         return execution_results
 
@@ -1471,27 +1603,22 @@ class PhaseOrchestrator:
         Returns:
             Evaluation results dict
         """
-        from datetime import datetime
-        from aeon.plan.models import StepStatus
-        from aeon.validation.models import SemanticValidationReport
-        from aeon.convergence.models import ConvergenceAssessment
-        from aeon.exceptions import ContextPropagationError
-
-        phase_start_time = datetime.now()
+        phase_start_ns = time.perf_counter_ns()
         correlation_id = execution_context.correlation_id if execution_context else None
+        log = logger if logger and correlation_id else _NULL_LOGGER
+        snapshot_log = _snapshot_logger(log, correlation_id)
         ttl_before = ttl_remaining if ttl_remaining is not None else None
 
         # T086: Integrate phase entry logging in Phase C (evaluate)
-        if logger and correlation_id:
-            logger.log_phase_entry(
-                phase="C",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-            )
+        log.log_phase_entry(
+            phase="C",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+        )
 
         # T098: Integrate TTL snapshot logging at Phase C boundary (evaluate)
-        if logger and correlation_id and ttl_before is not None:
-            logger.log_ttl_snapshot(
+        if ttl_before is not None:
+            snapshot_log.log_ttl_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
@@ -1518,39 +1645,31 @@ class PhaseOrchestrator:
         if execution_context:
             context["correlation_id"] = execution_context.correlation_id
             context["execution_start_timestamp"] = execution_context.execution_start_timestamp
-        # Add refined_plan goal and step metadata
-        # T044: refined_plan_steps is documented as optional/future use (not used in prompts currently)
+        # Add refined_plan goal to context
         if plan:
             context["refined_plan_goal"] = plan.goal if hasattr(plan, "goal") else None
-            # Note: refined_plan_steps is included for future prompt enhancements, not currently used
-            context["refined_plan_steps"] = [
-                {
-                    "step_id": step.step_id,
-                    "description": step.description,
-                    "status": step.status.value if hasattr(step.status, "value") else str(step.status),
-                }
-                for step in (plan.steps if hasattr(plan, "steps") and plan.steps else [])
-            ]
         # Add current plan state and execution_results
         # Note: current_plan_state and execution_results are used by convergence/validation, not prompts
-        context["current_plan_state"] = plan.model_dump() if plan else {}
+        # Evaluation does not modify the plan, so this one dump serves every consumer below
+        plan_dump = plan.model_dump() if plan else {}
+        context["current_plan_state"] = plan_dump
         context["execution_results"] = execution_results
 
         # T094: Integrate state snapshot logging before Phase C transition (evaluate)
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                plan_state=plan_dump,
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
                 phase_state={"execution_results_count": len(execution_results)},
                 snapshot_type="before_transition",
             )
 
         # T030: Integrate context validation before Phase C LLM calls
-        spec = get_context_propagation_specification("C")
-        is_valid, error_message, missing_fields = validate_context_propagation("C", context, spec)
+        spec = CONTEXT_SPEC_PHASE_C
+        is_valid, error_message, missing_fields = self._validate_context_propagation("C", context, spec)
         if not is_valid:
             error = ContextPropagationError(
                 phase="C",
@@ -1558,26 +1677,24 @@ class PhaseOrchestrator:
                 message=error_message,
             )
             # T102: Integrate structured error logging for Phase C failures (evaluate)
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="C",
-                    pass_number=pass_number,
-                    error_code="AEON.CONTEXT_PROPAGATION.C.001",
-                    severity="ERROR",
-                    affected_component="phase_c_evaluate",
-                    failure_condition=error_message,
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="C",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="C",
+                pass_number=pass_number,
+                error_code="AEON.CONTEXT_PROPAGATION.C.001",
+                severity="ERROR",
+                affected_component="phase_c_evaluate",
+                failure_condition=error_message,
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="C",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             # Return error result instead of raising to maintain phase contract
             return {
                 "converged": False,
@@ -1602,8 +1719,8 @@ class PhaseOrchestrator:
                 step_results.append({
                     "step_id": step.step_id,
                     "status": status_value,
-                    "output": getattr(step, "step_output", None),
-                    "clarity_state": getattr(step, "clarity_state", None),
+                    "output": step.step_output,
+                    "clarity_state": step.clarity_state,
                 })
 
         # Use provided execution_results if available, otherwise use step_results
@@ -1616,7 +1733,7 @@ class PhaseOrchestrator:
                 # T030: Context validated before LLM call
                 # Validate current plan state and execution artifacts
                 execution_artifact = {
-                    "plan": plan.model_dump(),
+                    "plan": plan_dump,
                     "execution_results": eval_results,
                 }
                 semantic_validation_report = semantic_validator.validate(
@@ -1640,7 +1757,7 @@ class PhaseOrchestrator:
                     )
 
                 convergence_assessment = convergence_engine.assess(
-                    plan_state=plan.model_dump(),
+                    plan_state=plan_dump,
                     execution_results=eval_results,
                     semantic_validation_report=semantic_validation_report,
                     execution_context=execution_context,
@@ -1708,33 +1825,29 @@ class PhaseOrchestrator:
             "convergence_reason_codes": convergence_assessment.reason_codes if convergence_assessment else [],
         }
         
-        # Log evaluation outcome (T025) - delegate to convergence engine
-        if logger and execution_context and convergence_engine:
-            # The convergence engine will log the evaluation outcome
-            pass  # Logging is done in convergence engine.assess() method
+        # Log evaluation outcome (T025) - done by convergence_engine.assess() above
 
         # T094: Integrate state snapshot logging after Phase C transition (evaluate)
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                plan_state=plan_dump,
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
                 phase_state={"converged": final_converged, "needs_refinement": needs_refinement},
                 snapshot_type="after_transition",
             )
 
-        phase_duration = (datetime.now() - phase_start_time).total_seconds()
+        phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
         # T090: Integrate phase exit logging in Phase C (evaluate)
-        if logger and correlation_id:
-            logger.log_phase_exit(
-                phase="C",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-                duration=phase_duration,
-                outcome="success",
-            )
+        log.log_phase_exit(
+            phase="C",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+            duration=phase_duration,
+            outcome="success",
+        )
         
         return evaluation_result
 
@@ -1771,25 +1884,22 @@ class PhaseOrchestrator:
         Returns:
             Tuple of (success, refinement_changes, error_message)
         """
-        from datetime import datetime
-        from aeon.plan.models import StepStatus
-        from aeon.exceptions import ContextPropagationError
-
-        phase_start_time = datetime.now()
+        phase_start_ns = time.perf_counter_ns()
         correlation_id = execution_context.correlation_id if execution_context else None
+        log = logger if logger and correlation_id else _NULL_LOGGER
+        snapshot_log = _snapshot_logger(log, correlation_id)
         ttl_before = ttl_remaining if ttl_remaining is not None else None
 
         # T086: Integrate phase entry logging in Phase C (refine)
-        if logger and correlation_id:
-            logger.log_phase_entry(
-                phase="C",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-            )
+        log.log_phase_entry(
+            phase="C",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+        )
 
         # T098: Integrate TTL snapshot logging at Phase C boundary (refine)
-        if logger and correlation_id and ttl_before is not None:
-            logger.log_ttl_snapshot(
+        if ttl_before is not None:
+            snapshot_log.log_ttl_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
@@ -1799,15 +1909,14 @@ class PhaseOrchestrator:
             )
 
         if not recursive_planner:
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="C",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="success",
-                )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="C",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="success",
+            )
             return (True, [], None, plan)  # Return original plan unchanged
 
         # T037: Update Phase C refinement to propagate context
@@ -1839,20 +1948,20 @@ class PhaseOrchestrator:
             context["previous_outputs"] = execution_results_list
 
         # T094: Integrate state snapshot logging before Phase C transition (refine)
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="C",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                plan_state=context["current_plan_state"],
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
                 phase_state={"evaluation_results": evaluation_results},
                 snapshot_type="before_transition",
             )
 
         # T030: Integrate context validation before Phase C LLM calls (refinement)
-        spec = get_context_propagation_specification("C")
-        is_valid, error_message, missing_fields = validate_context_propagation("C", context, spec)
+        spec = CONTEXT_SPEC_PHASE_C
+        is_valid, error_message, missing_fields = self._validate_context_propagation("C", context, spec)
         if not is_valid:
             error = ContextPropagationError(
                 phase="C",
@@ -1860,26 +1969,24 @@ class PhaseOrchestrator:
                 message=error_message,
             )
             # T102: Integrate structured error logging for Phase C failures (refine)
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="C",
-                    pass_number=pass_number,
-                    error_code="AEON.CONTEXT_PROPAGATION.C.001",
-                    severity="ERROR",
-                    affected_component="phase_c_refine",
-                    failure_condition=error_message,
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="C",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="C",
+                pass_number=pass_number,
+                error_code="AEON.CONTEXT_PROPAGATION.C.001",
+                severity="ERROR",
+                affected_component="phase_c_refine",
+                failure_condition=error_message,
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="C",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             return (False, [], str(error))
 
         # Build LLM context from validated context
@@ -1908,22 +2015,18 @@ class PhaseOrchestrator:
                 executed_step_ids=executed_step_ids,
             )
 
-            # Create before_plan_fragment for logging (T024)
+            # Create before_plan_fragment for logging (T024); it also gates the outcome log below
             before_plan_fragment = None
             if logger and execution_context and refinement_actions:
-                from aeon.observability.models import PlanFragment
-                # Get changed step IDs (will be determined after applying actions)
-                changed_step_ids = set()
-                unchanged_step_ids = {step.step_id for step in plan.steps}
+                # Changed steps are determined after applying actions; keep the ID set for that diff
+                before_step_ids = {step.step_id for step in plan.steps}
                 before_plan_fragment = PlanFragment(
                     changed_steps=[],
-                    unchanged_step_ids=list(unchanged_step_ids),
+                    unchanged_step_ids=list(before_step_ids),
                 )
 
             # Apply refinement actions to plan
             if refinement_actions:
-                from aeon.orchestration.refinement import PlanRefinement
-
                 plan_refinement = PlanRefinement()
                 success, updated_plan, error = plan_refinement.apply_actions(
                     plan, refinement_actions, execution_context, logger
@@ -1931,10 +2034,7 @@ class PhaseOrchestrator:
                 if success:
                     plan = updated_plan
                     # Re-populate step indices after refinement
-                    from aeon.orchestration.step_prep import StepPreparation
-
-                    step_prep = StepPreparation()
-                    step_prep.populate_step_indices(plan)
+                    self._step_prep.populate_step_indices(plan)
                 else:
                     # If refinement application fails, continue without refinement
                     return (True, [], None, plan)  # Return original plan unchanged
@@ -1943,15 +2043,13 @@ class PhaseOrchestrator:
             refinement_changes = [action.model_dump() for action in refinement_actions]
             
             # Log refinement outcome (T024)
-            if logger and execution_context and refinement_actions and before_plan_fragment:
-                from aeon.observability.models import PlanFragment
+            if before_plan_fragment is not None:
                 # Create after_plan_fragment with changed steps
                 changed_steps = []
                 unchanged_step_ids_after = set()
                 for step in plan.steps:
                     # Check if this step was modified/added by comparing with original plan
-                    original_step = next((s for s in before_plan_fragment.unchanged_step_ids if s == step.step_id), None)
-                    if original_step is None or step.step_id not in before_plan_fragment.unchanged_step_ids:
+                    if step.step_id not in before_step_ids:
                         changed_steps.append(step)
                     else:
                         unchanged_step_ids_after.add(step.step_id)
@@ -1962,8 +2060,6 @@ class PhaseOrchestrator:
                 )
                 
                 # Build evaluation_signals from evaluation_results (T065, T066, T067)
-                from aeon.observability.models import ConvergenceAssessmentSummary, ValidationIssuesSummary
-                
                 # Extract convergence assessment and create summary
                 convergence_assessment_dict = evaluation_results.get("convergence_assessment", {})
                 convergence_assessment_summary = None
@@ -1986,16 +2082,13 @@ class PhaseOrchestrator:
                 validation_issues_summary = None
                 if validation_issues:
                     try:
-                        critical_count = sum(1 for i in validation_issues if isinstance(i, dict) and i.get("severity") == "CRITICAL" or (hasattr(i, "severity") and i.severity == "CRITICAL"))
-                        error_count = sum(1 for i in validation_issues if isinstance(i, dict) and i.get("severity") == "ERROR" or (hasattr(i, "severity") and i.severity == "ERROR"))
-                        warning_count = sum(1 for i in validation_issues if isinstance(i, dict) and i.get("severity") == "WARNING" or (hasattr(i, "severity") and i.severity == "WARNING"))
-                        info_count = sum(1 for i in validation_issues if isinstance(i, dict) and i.get("severity") == "INFO" or (hasattr(i, "severity") and i.severity == "INFO"))
+                        severity_counts = Counter(map(_issue_severity, validation_issues))
                         validation_issues_summary = ValidationIssuesSummary(
                             total_issues=len(validation_issues),
-                            critical_count=critical_count,
-                            error_count=error_count,
-                            warning_count=warning_count,
-                            info_count=info_count,
+                            critical_count=severity_counts["CRITICAL"],
+                            error_count=severity_counts["ERROR"],
+                            warning_count=severity_counts["WARNING"],
+                            info_count=severity_counts["INFO"],
                             issues_by_type=None,
                         )
                     except Exception:
@@ -2008,18 +2101,7 @@ class PhaseOrchestrator:
                 if validation_issues_summary:
                     evaluation_signals["validation_issues"] = validation_issues_summary.model_dump()
                 
-                # Log refinement trigger (T068) - log what triggered refinement
-                if logger and execution_context:
-                    trigger_reason = []
-                    if convergence_assessment_dict and not convergence_assessment_dict.get("converged", True):
-                        trigger_reason.append("convergence_not_achieved")
-                    if validation_issues:
-                        trigger_reason.append("validation_issues_detected")
-                    if not trigger_reason:
-                        trigger_reason.append("manual_refinement")
-                    
-                    # Log refinement trigger as part of refinement outcome
-                    # The evaluation_signals already contains the trigger context
+                # Log refinement trigger (T068) - the evaluation_signals carry the trigger context
                 
                 # Log refinement actions (T069) - which steps were modified/added/removed
                 # refinement_actions already contains this information in refinement_changes
@@ -2036,52 +2118,49 @@ class PhaseOrchestrator:
                 )
 
             # T094: Integrate state snapshot logging after Phase C transition (refine)
-            if logger and correlation_id:
-                logger.log_state_snapshot(
+            if snapshot_log is not _NULL_LOGGER:
+                snapshot_log.log_state_snapshot(
                     correlation_id=correlation_id,
                     phase="C",
                     pass_number=pass_number,
-                    plan_state=plan.model_dump() if hasattr(plan, "model_dump") else {},
+                    plan_state=_model_state(plan),
                     ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
                     phase_state={"refinement_changes_count": len(refinement_changes)},
                     snapshot_type="after_transition",
                 )
 
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
             # T090: Integrate phase exit logging in Phase C (refine)
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="C",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="success",
-                )
+            log.log_phase_exit(
+                phase="C",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="success",
+            )
             
             return (True, refinement_changes, None, plan)  # Return updated plan
 
         except Exception as e:
             # T102: Integrate structured error logging for Phase C failures (refine)
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="C",
-                    pass_number=pass_number,
-                    error_code="AEON.PHASE_TRANSITION.C_D.001",
-                    severity="ERROR",
-                    affected_component="phase_c_refine",
-                    failure_condition=str(e),
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="C",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="C",
+                pass_number=pass_number,
+                error_code="AEON.PHASE_TRANSITION.C_D.001",
+                severity="ERROR",
+                affected_component="phase_c_refine",
+                failure_condition=str(e),
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="C",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             # If refinement fails, log error and continue without refinement
             return (False, [], str(e), plan)  # Return original plan on error
 
@@ -2120,24 +2199,22 @@ class PhaseOrchestrator:
         Returns:
             Tuple of (success, updated_task_profile, error_message)
         """
-        from datetime import datetime
-        from aeon.exceptions import ContextPropagationError
-
-        phase_start_time = datetime.now()
+        phase_start_ns = time.perf_counter_ns()
         correlation_id = execution_context.correlation_id if execution_context else None
+        log = logger if logger and correlation_id else _NULL_LOGGER
+        snapshot_log = _snapshot_logger(log, correlation_id)
         ttl_before = ttl_remaining if ttl_remaining is not None else None
 
         # T087: Integrate phase entry logging in Phase D
-        if logger and correlation_id:
-            logger.log_phase_entry(
-                phase="D",
-                correlation_id=correlation_id,
-                pass_number=pass_number,
-            )
+        log.log_phase_entry(
+            phase="D",
+            correlation_id=correlation_id,
+            pass_number=pass_number,
+        )
 
         # T099: Integrate TTL snapshot logging at Phase D boundary
-        if logger and correlation_id and ttl_before is not None:
-            logger.log_ttl_snapshot(
+        if ttl_before is not None:
+            snapshot_log.log_ttl_snapshot(
                 correlation_id=correlation_id,
                 phase="D",
                 pass_number=pass_number,
@@ -2147,17 +2224,19 @@ class PhaseOrchestrator:
             )
 
         if not adaptive_depth or not task_profile:
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="D",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="success",
-                )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="D",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="success",
+            )
             return (True, None, None)
 
+        # Phase D does not modify the plan, so serialize it once for context and snapshots
+        plan_state = _model_state(plan)
+
         # T038: Update Phase D to propagate context
         # Build context dict with required fields for Phase D
         # T046: Ensure all required keys are populated for prompt schemas
@@ -2166,7 +2245,7 @@ class PhaseOrchestrator:
             "request": request or "",
             "task_profile": task_profile,
             "evaluation_results": evaluation_results,
-            "plan_state": plan.model_dump() if plan else {},
+            "plan_state": plan_state,
             "pass_number": pass_number,
             "phase": "D",
         }
@@ -2181,24 +2260,24 @@ class PhaseOrchestrator:
         context["adaptive_depth_inputs"] = {
             "convergence_assessment": evaluation_results.get("convergence_assessment", {}),
             "semantic_validation": evaluation_results.get("semantic_validation", {}),
-            "plan_state": plan.model_dump() if plan else {},
+            "plan_state": plan_state,
         }
 
         # T095: Integrate state snapshot logging before Phase D transition
-        if logger and correlation_id:
-            logger.log_state_snapshot(
+        if snapshot_log is not _NULL_LOGGER:
+            snapshot_log.log_state_snapshot(
                 correlation_id=correlation_id,
                 phase="D",
                 pass_number=pass_number,
-                plan_state=plan.model_dump() if plan and hasattr(plan, "model_dump") else {},
+                plan_state=plan_state,
                 ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
-                phase_state={"task_profile": task_profile.model_dump() if hasattr(task_profile, "model_dump") else str(task_profile), "evaluation_results": evaluation_results},
+                phase_state={"task_profile": _model_state(task_profile, str), "evaluation_results": evaluation_results},
                 snapshot_type="before_transition",
             )
 
         # T031: Integrate context validation before Phase D LLM calls
-        spec = get_context_propagation_specification("D")
-        is_valid, error_message, missing_fields = validate_context_propagation("D", context, spec)
+        spec = CONTEXT_SPEC_PHASE_D
+        is_valid, error_message, missing_fields = self._validate_context_propagation("D", context, spec)
         if not is_valid:
             error = ContextPropagationError(
                 phase="D",
@@ -2206,26 +2285,24 @@ class PhaseOrchestrator:
                 message=error_message,
             )
             # T103: Integrate structured error logging for Phase D failures
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="D",
-                    pass_number=pass_number,
-                    error_code="AEON.CONTEXT_PROPAGATION.D.001",
-                    severity="ERROR",
-                    affected_component="phase_d",
-                    failure_condition=error_message,
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="D",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="D",
+                pass_number=pass_number,
+                error_code="AEON.CONTEXT_PROPAGATION.D.001",
+                severity="ERROR",
+                affected_component="phase_d",
+                failure_condition=error_message,
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="D",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             return (False, None, str(error))
 
         # Build LLM context from validated context
@@ -2237,9 +2314,6 @@ class PhaseOrchestrator:
             semantic_validation_dict = evaluation_results.get("semantic_validation", {})
 
             # Convert dicts to model instances if needed
-            from aeon.convergence.models import ConvergenceAssessment
-            from aeon.validation.models import SemanticValidationReport
-
             convergence_assessment = None
             if convergence_assessment_dict:
                 try:
@@ -2300,46 +2374,20 @@ class PhaseOrchestrator:
                     }
 
                 # T095: Integrate state snapshot logging after Phase D transition
-                if logger and correlation_id:
-                    logger.log_state_snapshot(
+                if snapshot_log is not _NULL_LOGGER:
+                    snapshot_log.log_state_snapshot(
                         correlation_id=correlation_id,
                         phase="D",
                         pass_number=pass_number,
-                        plan_state=plan.model_dump() if plan and hasattr(plan, "model_dump") else {},
+                        plan_state=plan_state,
                         ttl_remaining=adjusted_ttl,
-                        phase_state={"updated_task_profile": updated_profile.model_dump() if hasattr(updated_profile, "model_dump") else str(updated_profile)},
+                        phase_state={"updated_task_profile": _model_state(updated_profile, str)},
                         snapshot_type="after_transition",
                     )
 
-                phase_duration = (datetime.now() - phase_start_time).total_seconds()
+                phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
                 # T091: Integrate phase exit logging in Phase D
-                if logger and correlation_id:
-                    logger.log_phase_exit(
-                        phase="D",
-                        correlation_id=correlation_id,
-                        pass_number=pass_number,
-                        duration=phase_duration,
-                        outcome="success",
-                    )
-
-                return (True, updated_profile, None)
-
-            # T095: Integrate state snapshot logging after Phase D transition (no update)
-            if logger and correlation_id:
-                logger.log_state_snapshot(
-                    correlation_id=correlation_id,
-                    phase="D",
-                    pass_number=pass_number,
-                    plan_state=plan.model_dump() if plan and hasattr(plan, "model_dump") else {},
-                    ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
-                    phase_state={"task_profile": "unchanged"},
-                    snapshot_type="after_transition",
-                )
-
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            # T091: Integrate phase exit logging in Phase D
-            if logger and correlation_id:
-                logger.log_phase_exit(
+                log.log_phase_exit(
                     phase="D",
                     correlation_id=correlation_id,
                     pass_number=pass_number,
@@ -2347,29 +2395,50 @@ class PhaseOrchestrator:
                     outcome="success",
                 )
 
+                return (True, updated_profile, None)
+
+            # T095: Integrate state snapshot logging after Phase D transition (no update)
+            snapshot_log.log_state_snapshot(
+                correlation_id=correlation_id,
+                phase="D",
+                pass_number=pass_number,
+                plan_state=plan_state,
+                ttl_remaining=ttl_remaining if ttl_remaining is not None else 0,
+                phase_state={"task_profile": "unchanged"},
+                snapshot_type="after_transition",
+            )
+
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            # T091: Integrate phase exit logging in Phase D
+            log.log_phase_exit(
+                phase="D",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="success",
+            )
+
             return (True, None, None)
         except Exception as e:
             # T103: Integrate structured error logging for Phase D failures
-            if logger and correlation_id:
-                logger.log_phase_transition_error(
-                    correlation_id=correlation_id,
-                    phase="D",
-                    pass_number=pass_number,
-                    error_code="AEON.PHASE_TRANSITION.D_A.001",
-                    severity="ERROR",
-                    affected_component="phase_d",
-                    failure_condition=str(e),
-                    retryable=False,
-                )
-            phase_duration = (datetime.now() - phase_start_time).total_seconds()
-            if logger and correlation_id:
-                logger.log_phase_exit(
-                    phase="D",
-                    correlation_id=correlation_id,
-                    pass_number=pass_number,
-                    duration=phase_duration,
-                    outcome="failure",
-                )
+            log.log_phase_transition_error(
+                correlation_id=correlation_id,
+                phase="D",
+                pass_number=pass_number,
+                error_code="AEON.PHASE_TRANSITION.D_A.001",
+                severity="ERROR",
+                affected_component="phase_d",
+                failure_condition=str(e),
+                retryable=False,
+            )
+            phase_duration = (time.perf_counter_ns() - phase_start_ns) / 1e9
+            log.log_phase_exit(
+                phase="D",
+                correlation_id=correlation_id,
+                pass_number=pass_number,
+                duration=phase_duration,
+                outcome="failure",
+            )
             # If update fails, return error
             return (False, None, str(e))
 
@@ -2450,9 +2519,6 @@ def execute_phase_e(
     Raises:
         Never raises exceptions. Always produces a degraded FinalAnswer if synthesis fails.
     """
-    from aeon.prompts.registry import PromptId, PromptNotFoundError, NoOutputModelError, RenderingError
-    import json
-    
     # Detect degraded conditions (T067)
     missing_fields = []
     if phase_e_input.plan_state is None:
@@ -2492,22 +2558,9 @@ def execute_phase_e(
     
     try:
         # Convert PhaseEInput to AnswerSynthesisInput for prompt registry
-        from aeon.prompts.registry import AnswerSynthesisInput
-        synthesis_input = AnswerSynthesisInput(
-            request=phase_e_input.request,
-            correlation_id=phase_e_input.correlation_id,
-            execution_start_timestamp=phase_e_input.execution_start_timestamp,
-            convergence_status=phase_e_input.convergence_status,
-            total_passes=phase_e_input.total_passes,
-            total_refinements=phase_e_input.total_refinements,
-            ttl_remaining=phase_e_input.ttl_remaining,
-            plan_state=phase_e_input.plan_state,
-            execution_results=phase_e_input.execution_results,
-            convergence_assessment=phase_e_input.convergence_assessment,
-            execution_passes=phase_e_input.execution_passes,
-            semantic_validation=phase_e_input.semantic_validation,
-            task_profile=phase_e_input.task_profile,
-        )
+        # PhaseEInput has the same fields and constraints and is already validated,
+        # so its field values are reused without re-validating the nested pass data
+        synthesis_input = AnswerSynthesisInput.model_construct(**dict(phase_e_input))
         
         # Retrieve synthesis prompts (T064)
         try:
@@ -0,0 +1,69 @@
+"""Plan cache for skipping Phase A and Phase B on repeated requests.
+
+This module contains the PlanCache class that stores the Phase A TaskProfile
+and TTL allocation together with the Phase B refined plan, keyed by the
+request string, so recurring requests can proceed directly to Phase C.
+"""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from aeon.adaptive.models import TaskProfile
+    from aeon.plan.models import Plan
+
+__all__ = ["PlanCache", "PlanCacheEntry"]
+
+
+# Type alias for a cached entry: (task_profile, ttl_allocated, refined_plan)
+PlanCacheEntry = Tuple["TaskProfile", int, "Plan"]
+
+
+class PlanCache:
+    """Bounded LRU cache of Phase A/B outputs keyed by request."""
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize plan cache.
+
+        Args:
+            max_size: Maximum number of cached requests (least recently used evicted first)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, PlanCacheEntry]" = OrderedDict()
+
+    def get(self, request: str) -> Optional[PlanCacheEntry]:
+        """
+        Look up cached Phase A/B outputs for a request.
+
+        Returns:
+            Tuple of (task_profile, ttl_allocated, refined_plan) or None on miss.
+            The plan is a deep copy, so callers may mutate step state freely.
+        """
+        entry = self._entries.get(request)
+        if entry is None:
+            return None
+        self._entries.move_to_end(request)
+        task_profile, ttl_allocated, plan = entry
+        return task_profile, ttl_allocated, plan.model_copy(deep=True)
+
+    def put(self, request: str, task_profile: "TaskProfile", ttl_allocated: int, plan: "Plan") -> None:
+        """
+        Store Phase A/B outputs for a request.
+
+        The plan is stored as given; callers must pass a snapshot that will not be
+        mutated afterwards (e.g. a deep copy taken before Phase C).
+        """
+        self._entries[request] = (task_profile, ttl_allocated, plan)
+        self._entries.move_to_end(request)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,7 +5,9 @@ including dependency checking, context population, and index population,
 extracted from the kernel to reduce LOC.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+import operator
+import weakref
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from aeon.plan.models import Plan, PlanStep
@@ -35,6 +37,11 @@ StepPreparationResult = List["PlanStep"]
 class StepPreparation:
     """Handles step preparation including dependency checking and context population."""
 
+    def __init__(self) -> None:
+        """Initialize step preparation."""
+        # (plan ref, its steps) from the last populate_step_indices call
+        self._last_indexed: Optional[Tuple["weakref.ref[Plan]", Tuple["PlanStep", ...]]] = None
+
     def get_ready_steps(
         self,
         plan: "Plan",
@@ -53,6 +60,8 @@ class StepPreparation:
         from aeon.plan.models import StepStatus
 
         ready_steps = []
+        # step_id -> status, built on the first dependency check (first step wins on duplicate ids)
+        status_by_id = None
         for step in plan.steps:
             if step.status == StepStatus.PENDING:
                 # Check if all dependencies are complete
@@ -60,11 +69,10 @@ class StepPreparation:
                 # Check for dependencies field (may not exist in all plans)
                 dependencies = getattr(step, "dependencies", None)
                 if dependencies:
+                    if status_by_id is None:
+                        status_by_id = {s.step_id: s.status for s in reversed(plan.steps)}
                     for dep_id in dependencies:
-                        dep_step = next(
-                            (s for s in plan.steps if s.step_id == dep_id), None
-                        )
-                        if not dep_step or dep_step.status != StepStatus.COMPLETE:
+                        if status_by_id.get(dep_id) != StepStatus.COMPLETE:
                             dependencies_satisfied = False
                             break
                 if dependencies_satisfied:
@@ -128,11 +136,27 @@ class StepPreparation:
 
         Args:
             plan: Plan to populate indices for
+
+        Indices depend only on step order, so the call is skipped when the same
+        plan still holds the same step objects in the same order as last time.
         """
+        steps = tuple(plan.steps)
+        last = self._last_indexed
+        if (
+            last is not None
+            and last[0]() is plan
+            and len(last[1]) == len(steps)
+            and all(map(operator.is_, last[1], steps))
+        ):
+            return
+
         total_steps = len(plan.steps)
         for idx, step in enumerate(plan.steps, start=1):
             if hasattr(step, "step_index"):
                 step.step_index = idx
             if hasattr(step, "total_steps"):
                 step.total_steps = total_steps
+        # Hold the steps themselves: comparing by id() would misfire once a removed
+        # step is freed and a new step reuses its address
+        self._last_indexed = (weakref.ref(plan), steps)
 
@@ -7,6 +7,8 @@ extracted from the kernel to reduce LOC.
 import uuid
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
+from aeon.kernel.state import ExecutionHistory, TTLExpirationResponse
+
 if TYPE_CHECKING:
     from aeon.kernel.state import ExecutionPass, OrchestrationState
 
@@ -64,8 +66,6 @@ class TTLStrategy:
         Returns:
             Tuple of (success, response_dict, error_message)
         """
-        from aeon.kernel.state import ExecutionHistory, TTLExpirationResponse
-
         try:
             ttl_remaining = state.ttl_remaining if state else 0
 
@@ -90,9 +90,12 @@ class TTLStrategy:
                     "expiration": expiration_response.model_dump(),
                 },
                 overall_statistics={
-                    "total_passes": len(execution_passes),
-                    "total_refinements": sum(
-                        len(p.refinement_changes) for p in execution_passes
+                    # PassHistory also counts passes evicted from the bounded history
+                    "total_passes": getattr(execution_passes, "total_passes", len(execution_passes)),
+                    "total_refinements": getattr(
+                        execution_passes,
+                        "total_refinements",
+                        sum(len(p.refinement_changes) for p in execution_passes),
                     ),
                     "convergence_achieved": False,
                     "total_time": 0.0,
@@ -130,8 +133,6 @@ def check_ttl_before_phase_entry(
         - If ttl_remaining > 0, returns (True, None)
         - If ttl_remaining == 0, returns (False, TTLExpirationResponse with expiration_type="phase_boundary")
     """
-    from aeon.kernel.state import TTLExpirationResponse
-
     if ttl_remaining > 0:
         return (True, None)
 
@@ -167,8 +168,6 @@ def check_ttl_after_llm_call(
         - If ttl_remaining > 0, returns (True, None)
         - If ttl_remaining == 0, returns (False, TTLExpirationResponse with expiration_type="mid_phase")
     """
-    from aeon.kernel.state import TTLExpirationResponse
-
     if ttl_remaining > 0:
         return (True, None)
 
@@ -201,5 +200,5 @@ def decrement_ttl_per_cycle(ttl_remaining: int) -> int:
         - Called once per complete cycle (A→B→C→D)
         - Returns max(0, ttl_remaining - 1) to prevent negative values
     """
-    return max(0, ttl_remaining - 1)
+    return ttl_remaining - 1 if ttl_remaining > 0 else 0
 
@@ -24,6 +24,7 @@ def check_ttl_at_phase_boundary(
     execution_pass: Optional[ExecutionPass] = None,
     pass_number: int = 0,
     plan_state: Optional[Dict[str, Any]] = None,
+    plan: Optional[Any] = None,  # Plan
 ) -> None:
     """
     Check TTL at phase boundary.
@@ -36,6 +37,8 @@ def check_ttl_at_phase_boundary(
         execution_pass: Optional execution pass for TTL check
         pass_number: Pass number if execution_pass not provided
         plan_state: Plan state dict if execution_pass not provided
+        plan: Plan if execution_pass and plan_state are not provided; serialized
+            only when TTL is exhausted
 
     Raises:
         TTLExpiredError: If TTL is exhausted
@@ -46,7 +49,7 @@ def check_ttl_at_phase_boundary(
             temp_pass = ExecutionPass(
                 pass_number=pass_number,
                 phase=phase,
-                plan_state=plan_state or {},
+                plan_state=plan_state or (plan.model_dump() if plan is not None else {}),
                 ttl_remaining=0,
             )
         else:
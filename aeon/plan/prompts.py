@@ -72,8 +72,6 @@ def build_reasoning_prompt(
                       - refinement_changes: Refinement changes (list)
                       
                       Unused keys (present in context but not used in prompt):
-                      - initial_plan_steps: Step metadata (for future use)
-                      - refined_plan_steps: Step metadata (for future use)
                       - current_plan_state: Full plan state (for future use)
                       - execution_results: Execution results (for future use)
                       - evaluation_results: Evaluation results (for future use)
@@ -52,6 +52,31 @@ class TestJSONLLogger:
         finally:
             file_path.unlink(missing_ok=True)
 
+    def test_log_entry_phase_event_omits_unrelated_fields(self):
+        """Test that phase-aware events only serialize their own fields."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            file_path = Path(f.name)
+
+        try:
+            logger = JSONLLogger(file_path=file_path)
+            logger.log_phase_exit(
+                phase="A",
+                correlation_id="test-correlation-id",
+                pass_number=1,
+                duration=0.5,
+                outcome="success",
+            )
+
+            with open(file_path, 'r') as f:
+                entry = json.loads(f.readline())
+            assert entry["event"] == "phase_exit"
+            assert entry["duration"] == 0.5
+            assert entry["errors"] == []
+            assert "step_number" not in entry
+            assert "before_plan_fragment" not in entry
+        finally:
+            file_path.unlink(missing_ok=True)
+
     def test_log_entry_appends_multiple_entries(self):
         """Test that multiple log entries are appended to file."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
@@ -469,7 +494,7 @@ class TestPhaseAwareLogging:
             )
             
             logger.log_error(correlation_id=correlation_id, error=error_record)
-            
+
             with open(file_path, 'r') as f:
                 entry = json.loads(f.readline())
                 assert entry["correlation_id"] == correlation_id
@@ -477,6 +502,61 @@ class TestPhaseAwareLogging:
             file_path.unlink(missing_ok=True)
 
 
+class TestSnapshotSampling:
+    """Test per-execution sampling of state/TTL snapshots."""
+
+    def test_sampled_out_execution_skips_snapshots_only(self):
+        """Test that a zero sample rate drops snapshots but keeps phase events."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            file_path = Path(f.name)
+
+        try:
+            logger = JSONLLogger(file_path=file_path, snapshot_sample_rate=0.0)
+            correlation_id = "test-correlation-id-sampled"
+
+            logger.log_phase_entry(phase="A", correlation_id=correlation_id, pass_number=0)
+            logger.log_ttl_snapshot(
+                correlation_id=correlation_id,
+                phase="A",
+                pass_number=0,
+                ttl_before=10,
+                ttl_after=10,
+                ttl_at_boundary=10,
+            )
+            logger.log_state_snapshot(
+                correlation_id=correlation_id,
+                phase="A",
+                pass_number=0,
+                plan_state={},
+                ttl_remaining=10,
+                phase_state={},
+                snapshot_type="before_transition",
+            )
+
+            with open(file_path, 'r') as f:
+                events = [json.loads(line)["event"] for line in f]
+            assert events == ["phase_entry"]
+        finally:
+            file_path.unlink(missing_ok=True)
+
+    def test_sampling_is_deterministic_per_correlation_id(self):
+        """Test that the sampling decision is stable for a correlation_id and tracks the rate."""
+        logger = JSONLLogger(file_path=Path("unused.jsonl"), snapshot_sample_rate=0.5)
+        correlation_ids = [f"execution-{i}" for i in range(1000)]
+
+        decisions = [logger.should_sample(cid) for cid in correlation_ids]
+
+        assert decisions == [logger.should_sample(cid) for cid in correlation_ids]
+        assert 350 < sum(decisions) < 650
+        assert JSONLLogger(file_path=Path("unused.jsonl")).should_sample("execution-0") is True
+        assert JSONLLogger().should_sample("execution-0") is False
+
+    def test_invalid_sample_rate_rejected(self):
+        """Test that sample rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            JSONLLogger(snapshot_sample_rate=1.5)
+
+
 class TestUS3DebugLogging:
     """Test US3 debug logging features (T077-T079)."""
 
@@ -758,3 +838,61 @@ class TestUS3DebugLogging:
         finally:
             file_path.unlink(missing_ok=True)
 
+
+class TestBufferedLogging:
+    """Test buffered JSONL writes."""
+
+    def test_buffered_entries_written_at_phase_exit(self):
+        """Test that buffered entries reach the file together when the phase exits."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            file_path = Path(f.name)
+
+        try:
+            logger = JSONLLogger(file_path=file_path, buffer_size=100)
+            correlation_id = "test-correlation-id-buffered"
+
+            logger.log_phase_entry(phase="A", correlation_id=correlation_id, pass_number=0)
+            assert file_path.read_text() == ""
+
+            logger.log_phase_exit(
+                phase="A",
+                correlation_id=correlation_id,
+                pass_number=0,
+                duration=0.1,
+                outcome="success",
+            )
+            events = [json.loads(line)["event"] for line in file_path.read_text().splitlines()]
+            assert events == ["phase_entry", "phase_exit"]
+        finally:
+            file_path.unlink(missing_ok=True)
+
+    def test_buffer_flushes_when_full(self):
+        """Test that reaching buffer_size writes the pending entries."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            file_path = Path(f.name)
+
+        try:
+            logger = JSONLLogger(file_path=file_path, buffer_size=2)
+
+            logger.log_phase_entry(phase="A", correlation_id="cid", pass_number=0)
+            assert file_path.read_text() == ""
+            logger.log_phase_entry(phase="B", correlation_id="cid", pass_number=0)
+            assert len(file_path.read_text().splitlines()) == 2
+        finally:
+            file_path.unlink(missing_ok=True)
+
+    def test_multipass_entry_is_buffered(self):
+        """Test that log_multipass_entry goes through the buffer like other events."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            file_path = Path(f.name)
+
+        try:
+            logger = JSONLLogger(file_path=file_path, buffer_size=100)
+
+            logger.log_multipass_entry(pass_number=1, phase="C", plan_state={})
+            assert file_path.read_text() == ""
+            logger.flush()
+            entries = [json.loads(line) for line in file_path.read_text().splitlines()]
+            assert [e["type"] for e in entries] == ["multipass_entry"]
+        finally:
+            file_path.unlink(missing_ok=True)
@@ -1,6 +1,9 @@
 """Unit tests for observability models."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
+from pydantic import ValidationError
 
 from aeon.observability.models import (
     ConvergenceAssessmentSummary,
@@ -31,13 +34,13 @@ class TestCorrelationID:
 
     def test_correlation_id_invalid_format(self):
         """Test that CorrelationID rejects invalid format."""
-        with pytest.raises(Exception):  # ValueError from validator
+        with pytest.raises(ValueError):
             CorrelationID(value="invalid-id")
 
     def test_correlation_id_is_frozen(self):
         """Test that CorrelationID is immutable."""
         correlation_id = CorrelationID(value="6ba7b810-9dad-11d1-80b4-00c04fd430c8")
-        with pytest.raises(Exception):  # ValidationError from Pydantic
+        with pytest.raises(AttributeError):
             correlation_id.value = "new-value"
 
 
@@ -70,7 +73,7 @@ class TestErrorRecord:
 
     def test_error_record_invalid_code_format(self):
         """Test that ErrorRecord rejects invalid error code format."""
-        with pytest.raises(Exception):  # ValueError from validator
+        with pytest.raises(ValidationError):
             ErrorRecord(
                 code="INVALID.FORMAT",
                 severity=ErrorSeverity.ERROR,
@@ -80,7 +83,7 @@ class TestErrorRecord:
 
     def test_error_record_empty_message(self):
         """Test that ErrorRecord rejects empty message."""
-        with pytest.raises(Exception):  # ValueError from validator
+        with pytest.raises(ValidationError):
             ErrorRecord(
                 code="AEON.REFINEMENT.001",
                 severity=ErrorSeverity.ERROR,
@@ -115,16 +118,41 @@ class TestPlanFragment:
         assert len(fragment.changed_steps) == 1
         assert len(fragment.unchanged_step_ids) == 1
 
+    def test_plan_fragment_converts_dict_steps(self):
+        """Test that PlanFragment validates dict steps into PlanStep."""
+        fragment = PlanFragment(
+            changed_steps=[{"step_id": "step_1", "description": "Step 1"}],
+            unchanged_step_ids=["step_2"],
+        )
+        assert isinstance(fragment.changed_steps[0], PlanStep)
+        assert fragment.changed_steps[0].step_id == "step_1"
+
     def test_plan_fragment_no_overlap(self):
         """Test that PlanFragment rejects overlapping step IDs."""
         step1 = PlanStep(step_id="step_1", description="Step 1", status=StepStatus.PENDING)
         
-        with pytest.raises(Exception):  # ValueError from validator
+        with pytest.raises(ValueError):
             PlanFragment(
                 changed_steps=[step1],
                 unchanged_step_ids=["step_1"],  # Overlap!
             )
 
+    def test_plan_fragment_model_dump(self):
+        """Test that PlanFragment serializes to plain lists and step dicts."""
+        step1 = PlanStep(step_id="step_1", description="Step 1", status=StepStatus.PENDING)
+
+        fragment = PlanFragment(changed_steps=[step1], unchanged_step_ids=["step_2"])
+        dumped = fragment.model_dump()
+
+        assert dumped["changed_steps"] == [step1.model_dump()]
+        assert dumped["unchanged_step_ids"] == ["step_2"]
+
+    def test_plan_fragment_is_frozen(self):
+        """Test that PlanFragment is immutable."""
+        fragment = PlanFragment(changed_steps=[], unchanged_step_ids=["step_1"])
+        with pytest.raises(FrozenInstanceError):
+            fragment.unchanged_step_ids = ()
+
 
 class TestConvergenceAssessmentSummary:
     """Test ConvergenceAssessmentSummary model."""
@@ -152,7 +180,7 @@ class TestConvergenceAssessmentSummary:
 
     def test_convergence_assessment_summary_empty_reason_codes(self):
         """Test that ConvergenceAssessmentSummary rejects empty reason_codes."""
-        with pytest.raises(Exception):  # ValueError from validator
+        with pytest.raises(ValidationError):
             ConvergenceAssessmentSummary(
                 converged=True,
                 reason_codes=[],
@@ -189,7 +217,7 @@ class TestValidationIssuesSummary:
 
     def test_validation_issues_summary_total_mismatch(self):
         """Test that ValidationIssuesSummary rejects total that doesn't match sum."""
-        with pytest.raises(Exception):  # ValueError from validator
+        with pytest.raises(ValidationError):
             ValidationIssuesSummary(
                 total_issues=5,
                 critical_count=1,
@@ -0,0 +1,80 @@
+"""Unit tests for context building and normalization helpers."""
+
+import pytest
+
+from aeon.orchestration.context_ops import (
+    build_phase_context,
+    normalize_context,
+    prepare_context_for_llm,
+)
+
+
+def _phase_a_context():
+    return {
+        "request": "Test request",
+        "pass_number": 1,
+        "phase": "A",
+        "ttl_remaining": 10,
+        "correlation_id": "test-correlation-id",
+        "execution_start_timestamp": "2024-01-01T00:00:00",
+        "extra_field": "not propagated",
+    }
+
+
+class TestPrepareContextForLLM:
+    """Test prepare_context_for_llm and its legacy wrapper."""
+
+    def test_returns_only_must_have_fields(self):
+        """Test that only must-have fields are propagated."""
+        llm_context = prepare_context_for_llm("A", _phase_a_context())
+
+        assert "extra_field" not in llm_context
+        assert llm_context["request"] == "Test request"
+        assert llm_context["correlation_id"] == "test-correlation-id"
+
+    def test_raises_on_missing_fields(self):
+        """Test that missing required fields raise ValueError."""
+        context = _phase_a_context()
+        del context["ttl_remaining"]
+
+        with pytest.raises(ValueError, match="ttl_remaining"):
+            prepare_context_for_llm("A", context)
+
+    def test_build_phase_context_matches(self):
+        """Test that build_phase_context delegates to the fused helper."""
+        context = _phase_a_context()
+        assert build_phase_context("A", context) == prepare_context_for_llm("A", context)
+
+
+class TestNormalizeContext:
+    """Test normalize_context."""
+
+    def test_fills_defaults_for_missing_fields(self):
+        """Test that missing must-have fields get their defaults."""
+        normalized = normalize_context({"phase": "A"}, "A")
+
+        assert normalized["request"] == ""
+        assert normalized["pass_number"] == 0
+        assert normalized["ttl_remaining"] is None
+        assert normalized["phase"] == "A"
+
+    def test_preserves_field_order_and_drops_extras(self):
+        """Test that normalized keys follow the spec order and extras are dropped."""
+        normalized = normalize_context(_phase_a_context(), "A")
+
+        assert list(normalized) == [
+            "request",
+            "pass_number",
+            "phase",
+            "ttl_remaining",
+            "correlation_id",
+            "execution_start_timestamp",
+        ]
+
+    def test_does_not_mutate_cached_skeleton(self):
+        """Test that repeated calls do not leak values between contexts."""
+        normalize_context(_phase_a_context(), "A")
+        normalized = normalize_context({}, "A")
+
+        assert normalized["request"] == ""
+        assert normalized["correlation_id"] is None
@@ -0,0 +1,312 @@
+"""Unit tests for OrchestrationEngine."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from aeon.orchestration.engine import OrchestrationEngine
+from aeon.plan.models import Plan, PlanStep, StepStatus
+
+
+def _make_engine(**overrides):
+    kwargs = {
+        "llm": Mock(),
+        "phase_orchestrator": Mock(),
+        "step_executor": Mock(),
+        "step_preparation": Mock(),
+        "ttl_strategy": Mock(),
+    }
+    kwargs.update(overrides)
+    return OrchestrationEngine(**kwargs)
+
+
+def _plan():
+    return Plan(
+        goal="Test goal",
+        steps=[PlanStep(step_id="step1", description="Step 1", status=StepStatus.PENDING)],
+    )
+
+
+def _run_multipass(engine, converged=True, plan=None):
+    from aeon.kernel.state import ExecutionContext, OrchestrationState
+
+    engine._execute_phase_c_loop = Mock(side_effect=lambda *args: (converged, args[3]))
+    state = OrchestrationState(plan=_plan(), ttl_remaining=10)
+    context = ExecutionContext(
+        correlation_id="test-run-multipass",
+        execution_start_timestamp="2024-01-01T00:00:00",
+    )
+    with patch("aeon.orchestration.engine.execute_phase_e", return_value={"answer": "ok"}), \
+            patch("aeon.orchestration.engine.get_prompt_registry"), \
+            patch("aeon.orchestration.engine.build_execution_result", return_value={}):
+        return engine.run_multipass("request", plan, context, state, 10, Mock())
+
+
+class TestRunMultipassAsync:
+    """Test the async entry point of the multipass loop."""
+
+    def test_delegates_to_run_multipass(self):
+        """Test that run_multipass_async returns the synchronous loop's result."""
+        engine = _make_engine()
+        expected = {"status": "converged"}
+        engine.run_multipass = Mock(return_value=expected)
+        context, state, step_fn = Mock(), Mock(), Mock()
+
+        result = asyncio.run(
+            engine.run_multipass_async("request", None, context, state, 5, step_fn)
+        )
+
+        assert result is expected
+        engine.run_multipass.assert_called_once_with("request", None, context, state, 5, step_fn)
+
+    def test_concurrent_requests(self):
+        """Test that multiple requests can be awaited together."""
+        engine = _make_engine()
+        engine.run_multipass = Mock(side_effect=lambda request, *args: {"request": request})
+
+        async def run_both():
+            return await asyncio.gather(
+                engine.run_multipass_async("first", None, Mock(), Mock(), 5, Mock()),
+                engine.run_multipass_async("second", None, Mock(), Mock(), 5, Mock()),
+            )
+
+        results = asyncio.run(run_both())
+
+        assert [r["request"] for r in results] == ["first", "second"]
+
+
+class TestConcurrentSteps:
+    """Test the max_concurrent_steps guard."""
+
+    def test_kernel_step_executor_rejected_when_concurrent(self):
+        """Test that the kernel's non-thread-safe _execute_step cannot run concurrently."""
+        from aeon.kernel.orchestrator import Orchestrator
+
+        engine = _make_engine(max_concurrent_steps=4)
+        kernel = Orchestrator.__new__(Orchestrator)
+
+        with pytest.raises(ValueError, match="max_concurrent_steps"):
+            engine.run_multipass("request", _plan(), Mock(), Mock(), 5, kernel._execute_step)
+
+
+class TestPlanCacheIntegration:
+    """Test that run_multipass consults and fills the plan cache."""
+
+    def test_converged_run_populates_cache_and_hit_skips_phases_a_b(self):
+        """Test that a converged run is cached and the next run skips Phases A and B."""
+        from aeon.adaptive.models import TaskProfile
+        from aeon.orchestration.plan_cache import PlanCache
+
+        cache = PlanCache()
+        engine = _make_engine(plan_cache=cache, plan_generator=lambda request: _plan())
+        engine.execute_phase_a = Mock(return_value=(TaskProfile.default(), 8))
+        engine.execute_phase_b = Mock(side_effect=lambda request, plan, *args: plan)
+
+        _run_multipass(engine)
+        _run_multipass(engine)
+
+        assert len(cache) == 1
+        engine.execute_phase_a.assert_called_once()
+        engine.execute_phase_b.assert_called_once()
+
+    def test_unconverged_run_is_not_cached(self):
+        """Test that runs that do not converge are not stored."""
+        from aeon.adaptive.models import TaskProfile
+        from aeon.orchestration.plan_cache import PlanCache
+
+        cache = PlanCache()
+        engine = _make_engine(plan_cache=cache, plan_generator=lambda request: _plan())
+        engine.execute_phase_a = Mock(return_value=(TaskProfile.default(), 8))
+        engine.execute_phase_b = Mock(side_effect=lambda request, plan, *args: plan)
+
+        _run_multipass(engine, converged=False)
+
+        assert len(cache) == 0
+
+    def test_explicit_plan_bypasses_cache(self):
+        """Test that a caller-supplied plan is neither served from nor stored in the cache."""
+        from aeon.adaptive.models import TaskProfile
+        from aeon.orchestration.plan_cache import PlanCache
+
+        cache = PlanCache()
+        cache.put("request", TaskProfile.default(), 8, _plan())
+        engine = _make_engine(plan_cache=cache)
+        engine.execute_phase_a = Mock(return_value=(TaskProfile.default(), 8))
+        engine.execute_phase_b = Mock(side_effect=lambda request, plan, *args: plan)
+        explicit = Plan(
+            goal="Explicit goal",
+            steps=[PlanStep(step_id="stepX", description="Step X", status=StepStatus.PENDING)],
+        )
+
+        _run_multipass(engine, plan=explicit)
+
+        engine.execute_phase_a.assert_called_once()
+        assert engine.execute_phase_b.call_args[0][1] is explicit
+        assert cache.get("request")[2].goal == "Test goal"
+
+
+class TestCombinedPhaseAB:
+    """Test the combined Phase A+B hook."""
+
+    def test_combined_phase_ab_replaces_split_phases(self):
+        """Test that phase_ab_fn supplies Phase A/B outputs in one call."""
+        from aeon.adaptive.models import TaskProfile
+
+        refined = _plan()
+        phase_ab_fn = Mock(return_value=(TaskProfile.default(), 20, refined))
+        engine = _make_engine(phase_ab_fn=phase_ab_fn)
+        engine.execute_phase_a = Mock()
+        engine.execute_phase_b = Mock()
+
+        _run_multipass(engine)
+
+        phase_ab_fn.assert_called_once()
+        engine.execute_phase_a.assert_not_called()
+        engine.execute_phase_b.assert_not_called()
+        inputs_b_c = engine._execute_phase_c_loop.call_args[0][4]
+        assert inputs_b_c["refined_plan"] is refined
+
+    def test_combined_phase_ab_logs_and_checks_ttl(self):
+        """Test that the combined call is logged as Phase A and TTL-checked at the A/B boundaries."""
+        from aeon.adaptive.models import TaskProfile
+        from aeon.exceptions import TTLExpiredError
+        from aeon.kernel.state import ExecutionContext
+
+        logger = Mock()
+        phase_ab_fn = Mock(return_value=(TaskProfile.default(), 0, _plan()))
+        engine = _make_engine(phase_ab_fn=phase_ab_fn, logger=logger)
+        context = ExecutionContext(
+            correlation_id="test-phase-ab",
+            execution_start_timestamp="2024-01-01T00:00:00",
+        )
+
+        with pytest.raises(TTLExpiredError):
+            engine.execute_phase_ab("request", _plan(), 10, context)
+
+        assert logger.log_phase_entry.call_args.kwargs["phase"] == "A"
+        assert logger.log_phase_exit.call_args.kwargs["outcome"] == "success"
+
+
+class TestCollectPhaseEContext:
+    """Test extraction of Phase E input fields from execution passes."""
+
+    def test_no_passes(self):
+        """Test that all fields are None without execution passes."""
+        from aeon.orchestration.engine import _collect_phase_e_context
+
+        context = _collect_phase_e_context([], Mock())
+
+        assert set(context.values()) == {None}
+
+    def test_fields_from_passes(self):
+        """Test that results are flattened and evaluation fields come from the last pass."""
+        from aeon.kernel.state import ExecutionPass
+        from aeon.orchestration.engine import _collect_phase_e_context
+
+        passes = [
+            ExecutionPass(
+                pass_number=n,
+                phase="C",
+                plan_state={"goal": f"pass {n}"},
+                ttl_remaining=5,
+                execution_results=[{"step_id": f"step{n}"}],
+                evaluation_results={"convergence_assessment": {"converged": n == 2}},
+            )
+            for n in (1, 2)
+        ]
+
+        context = _collect_phase_e_context(passes, Mock())
+
+        assert context["plan_state"] == {"goal": "pass 2"}
+        assert [r["step_id"] for r in context["execution_results"]] == ["step1", "step2"]
+        assert context["convergence_assessment"] == {"converged": True}
+        assert context["semantic_validation"] is None
+        assert len(context["execution_passes"]) == 2
+
+    def test_older_passes_are_summarized(self):
+        """Test that only the requested number of recent passes are serialized in full."""
+        from aeon.kernel.state import ExecutionPass
+        from aeon.orchestration.engine import _collect_phase_e_context
+
+        passes = [
+            ExecutionPass(pass_number=n, phase="C", plan_state={"goal": "g"}, ttl_remaining=5)
+            for n in range(1, 8)
+        ]
+
+        context = _collect_phase_e_context(passes, Mock(), detailed_passes=5)
+
+        assert len(context["execution_passes"]) == len(passes)
+        assert context["execution_passes"][0] == {
+            "pass_number": 1,
+            "phase": "C",
+            "converged": False,
+            "ttl_remaining": 5,
+            "num_results": 0,
+            "summarized": True,
+        }
+        assert context["execution_passes"][2] == passes[2].model_dump()
+        assert context["execution_passes"][-1] == passes[-1].model_dump()
+
+    def test_all_passes_in_full_by_default(self):
+        """Test that no pass is summarized unless detailed_passes is set."""
+        from aeon.kernel.state import ExecutionPass
+        from aeon.orchestration.engine import _collect_phase_e_context
+
+        passes = [
+            ExecutionPass(pass_number=n, phase="C", plan_state={"goal": "g"}, ttl_remaining=5)
+            for n in range(1, 8)
+        ]
+
+        context = _collect_phase_e_context(passes, Mock())
+
+        assert context["execution_passes"] == [p.model_dump() for p in passes]
+
+
+class TestPromptRegistry:
+    """Test lazy prompt registry resolution."""
+
+    def test_registry_resolved_once(self):
+        """Test that the prompt registry is looked up only on first use."""
+        engine = _make_engine()
+
+        with patch("aeon.orchestration.engine.get_prompt_registry", return_value=Mock()) as get_registry:
+            first = engine._get_prompt_registry()
+            second = engine._get_prompt_registry()
+
+        assert first is second
+        get_registry.assert_called_once()
+
+
+class TestContractValidationToggle:
+    """Test that contract checks can be disabled."""
+
+    def test_enabled_by_default(self):
+        """Test that the real contract checks are bound by default."""
+        from aeon.orchestration.contracts import validate_transition_contract
+
+        engine = _make_engine()
+
+        assert engine._validate_transition_contract is validate_transition_contract
+
+    def test_disabled_checks_are_no_ops(self):
+        """Test that disabled checks accept inputs that would fail validation."""
+        engine = _make_engine(validate_contracts=False)
+
+        assert engine._validate_transition_contract("A→B", {}) is None
+        assert engine._validate_phase_entry(None, "C") is None
+
+
+class TestDump:
+    """Test the cached model_dump dispatch helper."""
+
+    def test_dumps_models_and_passes_through_other_values(self):
+        """Test that models are serialized and plain values returned as-is."""
+        from aeon.orchestration.engine import _dump
+
+        plan = _plan()
+        data = {"answer": "ok"}
+
+        assert _dump(plan) == plan.model_dump()
+        assert _dump(data) is data
+        assert _dump(None) is None
@@ -0,0 +1,51 @@
+"""Unit tests for structured error record creation."""
+
+from aeon.observability.models import ErrorRecord
+from aeon.orchestration.errors import _compute_error_type, assign_error_code, create_error_record
+
+
+class TestAssignErrorCode:
+    """Test error code assignment."""
+
+    def test_component_error_types_keep_their_component(self):
+        """Test that error types naming an error-code component are used as the component."""
+        assert assign_error_code("VALIDATION", transition="D→A/B") == "AEON.VALIDATION.001"
+        assert assign_error_code("TOOL", phase="C") == "AEON.TOOL.001"
+
+    def test_other_error_types_map_to_phase_or_execution(self):
+        """Test that unknown error types are filed under PHASE in a phase and EXECUTION otherwise."""
+        assert assign_error_code("TTL_EXPIRED", phase="C") == "AEON.PHASE.001"
+        assert assign_error_code("TTL_EXPIRED", transition="A→B") == "AEON.PHASE.001"
+        assert assign_error_code("TTL_EXPIRED") == "AEON.EXECUTION.001"
+
+
+class TestCreateErrorRecord:
+    """Test conversion of non-Aeon exceptions into error records."""
+
+    def test_error_type_from_class_name(self):
+        """Test that the error type is derived from the class name and cached."""
+
+        class ToolError(Exception):
+            pass
+
+        record = create_error_record(ToolError("tool failed"), subsystem="tools")
+
+        assert record.code == "AEON.TOOL.001"
+        assert record.affected_component == "tools"
+        assert record.message == "tool failed"
+        assert _compute_error_type(ToolError) == "TOOL"
+        assert _compute_error_type.cache_info().hits >= 1
+
+    def test_non_aeon_error_with_phase(self):
+        """Test that a record is produced for arbitrary exceptions and messages are stripped."""
+        record = create_error_record(ValueError("  bad value  "), phase="C")
+
+        assert record.code == "AEON.PHASE.001"
+        assert record.affected_component == "phase_c"
+        assert record.message == "bad value"
+
+    def test_record_round_trips_through_validation(self):
+        """Test that produced records satisfy the ErrorRecord schema."""
+        record = create_error_record(KeyError("missing"), transition="A→B")
+
+        assert ErrorRecord.model_validate(record.model_dump()) == record
@@ -0,0 +1,163 @@
+"""Unit tests for ExecutionPass building and serialization helpers."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from aeon.exceptions import ExecutionPassValidationError
+from aeon.observability.helpers import build_execution_result
+from aeon.orchestration.execution_pass_ops import (
+    PassHistory,
+    build_execution_pass_after_phase,
+    build_execution_pass_before_phase,
+    finalize_execution_pass,
+    merge_evaluation_results,
+    merge_execution_results,
+    set_refinement_changes,
+    update_ttl_remaining,
+)
+
+
+class TestInPlaceUpdates:
+    """Test that per-pass updates reuse the single ExecutionPass built at pass start."""
+
+    def test_pass_updates_do_not_allocate_new_passes(self):
+        """Test that merge/set/update helpers mutate and return the same object."""
+        execution_pass = build_execution_pass_before_phase(1, "C", {"goal": "g"}, 5)
+
+        updated = merge_execution_results(execution_pass, [{"step_id": "step1"}])
+        updated = merge_evaluation_results(updated, {"converged": True})
+        updated = set_refinement_changes(updated, [{"action": "modify"}])
+        updated = update_ttl_remaining(updated, 4)
+        updated = build_execution_pass_after_phase(updated)
+
+        assert updated is execution_pass
+        assert execution_pass.execution_results == [{"step_id": "step1"}]
+        assert execution_pass.evaluation_results == {"converged": True}
+        assert execution_pass.ttl_remaining == 4
+
+
+class TestPassTiming:
+    """Test timing information threaded through pass start and completion."""
+
+    def test_duration_from_threaded_start_time(self):
+        """Test that a threaded start time is recorded and used for the duration."""
+        start = datetime(2024, 1, 1, 0, 0, 0)
+        execution_pass = build_execution_pass_before_phase(1, "C", {}, 5, start_time=start)
+        build_execution_pass_after_phase(execution_pass, start + timedelta(seconds=2), start_time=start)
+
+        assert execution_pass.timing_information["start_time"] == start.isoformat()
+        assert execution_pass.timing_information["duration"] == 2.0
+
+    def test_duration_uses_recorded_start_time(self):
+        """Test that completion uses the start time recorded at pass creation."""
+        start = datetime(2024, 1, 1, 0, 0, 0)
+        execution_pass = build_execution_pass_before_phase(1, "C", {}, 5, start_time=start)
+        execution_pass.timing_information["start_time"] = "not-an-iso-timestamp"
+        build_execution_pass_after_phase(execution_pass, start + timedelta(seconds=3))
+
+        assert execution_pass.timing_information["duration"] == 3.0
+
+    def test_end_time_derived_from_monotonic_clock(self):
+        """Test that completion measures elapsed time without reading the wall clock."""
+        start = datetime(2024, 1, 1, 0, 0, 0)
+        with patch("aeon.orchestration.execution_pass_ops.time.perf_counter", side_effect=[10.0, 11.5]):
+            execution_pass = build_execution_pass_before_phase(1, "C", {}, 5, start_time=start)
+            build_execution_pass_after_phase(execution_pass)
+
+        assert execution_pass.timing_information["duration"] == 1.5
+        assert execution_pass.timing_information["end_time"] == "2024-01-01T00:00:01.500000"
+
+
+class TestFinalizeExecutionPass:
+    """Test fused pass completion and validation."""
+
+    def test_completes_and_validates(self):
+        """Test that timing is completed and a valid Phase C pass is accepted."""
+        execution_pass = build_execution_pass_before_phase(1, "C", {}, 5)
+        execution_pass.evaluation_results = {"convergence_assessment": {"converged": True}}
+
+        result = finalize_execution_pass(execution_pass, "C")
+
+        assert result is execution_pass
+        assert "end_time" in execution_pass.timing_information
+        assert execution_pass.timing_information["duration"] >= 0
+
+    def test_invalid_pass_raises_unless_validation_disabled(self):
+        """Test that invariant violations raise only when validation is enabled."""
+        execution_pass = build_execution_pass_before_phase(1, "C", {}, 5)
+        execution_pass.execution_results = [{"step_id": "step1"}]  # missing status
+
+        with pytest.raises(ExecutionPassValidationError):
+            finalize_execution_pass(execution_pass, "C")
+        finalize_execution_pass(execution_pass, "C", validate=False)
+
+
+class TestPassHistory:
+    """Test the optionally bounded history of completed passes."""
+
+    def _passes(self, count):
+        return [build_execution_pass_before_phase(n, "C", {}, 5) for n in range(1, count + 1)]
+
+    def test_unbounded_by_default(self):
+        """Test that all passes are kept without a limit."""
+        history = PassHistory(self._passes(4))
+
+        assert len(history) == 4
+        assert history.total_passes == 4
+
+    def test_oldest_passes_evicted_to_sink(self):
+        """Test that passes beyond the limit are evicted oldest-first into the sink."""
+        evicted = []
+        history = PassHistory(max_passes=2, on_evict=evicted.append)
+        for execution_pass in self._passes(5):
+            history.append(execution_pass)
+
+        assert [p.pass_number for p in history] == [4, 5]
+        assert [p.pass_number for p in evicted] == [1, 2, 3]
+        assert history.total_passes == 5
+        assert history[-1:][0].pass_number == 5
+
+    def test_totals_include_evicted_passes(self):
+        """Test that pass and refinement totals survive eviction."""
+        history = PassHistory(max_passes=1)
+        for execution_pass in self._passes(3):
+            set_refinement_changes(execution_pass, [{"action": "modify"}])
+            history.append(execution_pass)
+
+        assert len(history) == 1
+        assert history.total_passes == 3
+        assert history.total_refinements == 3
+
+        result = build_execution_result(
+            "exec-1",
+            "request",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 1, 0, 0, 1),
+            10,
+            None,
+            converged=False,
+            status="max_passes_reached",
+            state=None,
+            execution_passes=history,
+            total_passes=history.total_passes,
+            total_refinements=history.total_refinements,
+        )
+        statistics = result["execution_history"]["overall_statistics"]
+        assert statistics["total_passes"] == 3
+        assert statistics["total_refinements"] == 3
+
+
+class TestMergeExecutionResults:
+    """Test execution result merge semantics."""
+
+    def test_replaces_results_without_copying(self):
+        """Test that results replace earlier ones and the list is stored as given."""
+        execution_pass = build_execution_pass_before_phase(1, "C", {}, 5)
+        merge_execution_results(execution_pass, [{"step_id": "old", "status": "complete"}])
+        results = [{"step_id": "step1", "status": "complete"}]
+
+        merge_execution_results(execution_pass, results)
+
+        assert execution_pass.execution_results is results
@@ -33,6 +33,22 @@ from aeon.exceptions import LLMError
 class TestPhaseTransitionContracts:
     """Test phase transition contract constants and retrieval."""
 
+    def test_constants_pass_model_validation(self):
+        """Test that the unvalidated module constants would pass full validation."""
+        from aeon.orchestration.phases import (
+            CONTEXT_SPEC_PHASE_A,
+            CONTEXT_SPEC_PHASE_B,
+            CONTEXT_SPEC_PHASE_C,
+            CONTEXT_SPEC_PHASE_D,
+            ContextPropagationSpecification,
+            PhaseTransitionContract,
+        )
+
+        for contract in (CONTRACT_A_TO_B, CONTRACT_B_TO_C, CONTRACT_C_TO_D, CONTRACT_D_TO_A_B):
+            assert PhaseTransitionContract.model_validate(contract.model_dump()) == contract
+        for spec in (CONTEXT_SPEC_PHASE_A, CONTEXT_SPEC_PHASE_B, CONTEXT_SPEC_PHASE_C, CONTEXT_SPEC_PHASE_D):
+            assert ContextPropagationSpecification.model_validate(spec.model_dump()) == spec
+
     def test_get_contract_a_to_b(self):
         """Test retrieving A→B contract."""
         contract = get_phase_transition_contract("A→B")
@@ -133,6 +149,31 @@ class TestContractAtoB:
         assert error_message is None
         assert phase_error is None
 
+    def test_validate_and_enforce_checks_inputs_once(self):
+        """Test that combined validation and enforcement validates inputs a single time."""
+        from unittest.mock import patch
+
+        from aeon.orchestration import phases
+
+        inputs = {"task_profile": TaskProfile.default(), "initial_plan": Mock(), "ttl": 10}
+
+        with patch.object(
+            phases, "validate_phase_transition_contract", wraps=phases.validate_phase_transition_contract
+        ) as validate:
+            phases.validate_and_enforce_phase_transition("A→B", inputs, {"refined_plan": Mock()})
+
+        validate.assert_called_once()
+
+    def test_validate_and_enforce_missing_output_raises(self):
+        """Test that a missing guaranteed output raises a non-retryable error."""
+        from aeon.orchestration.phases import validate_and_enforce_phase_transition
+
+        inputs = {"task_profile": TaskProfile.default(), "initial_plan": Mock(), "ttl": 10}
+
+        with pytest.raises(PhaseTransitionError) as exc_info:
+            validate_and_enforce_phase_transition("A→B", inputs, {})
+        assert exc_info.value.retryable is False
+
     def test_enforce_a_to_b_missing_output(self):
         """Test A→B contract enforcement with missing output."""
         task_profile = TaskProfile.default()
@@ -272,6 +313,18 @@ class TestContractDtoAB:
         assert is_valid is False
         assert "ttl" in error_message.lower() or "validation" in error_message.lower()
 
+    def test_custom_contract_rules_are_used(self):
+        """Test that a caller-supplied contract is validated by its own rules."""
+        custom = CONTRACT_D_TO_A_B.model_copy(
+            update={"required_inputs": {"ttl_remaining": lambda x: x > 10, "note": None}}
+        )
+
+        assert validate_phase_transition_contract("D→A/B", {"ttl_remaining": 5}, custom) == (
+            False,
+            "Validation failed for input: ttl_remaining",
+        )
+        assert validate_phase_transition_contract("D→A/B", {"ttl_remaining": 20, "note": None}, custom) == (True, None)
+
 
 class TestInvalidTransitions:
     """Test that invalid phase transitions are prevented."""
@@ -481,6 +534,19 @@ class TestLLMProviderErrorHandling:
         assert exc_info.value.retryable is False  # After retry exhaustion, treated as non-retryable
 
 
+class TestRetryableErrorClassification:
+    """Test provider error classification."""
+
+    def test_keyword_classification(self):
+        """Test that non-retryable keywords win over retryable ones."""
+        from aeon.orchestration.phases import _is_retryable_error
+
+        assert _is_retryable_error(RuntimeError("Connection reset")) is True
+        assert _is_retryable_error(RuntimeError("Timeout: TTL expired")) is False
+        assert _is_retryable_error(LLMError("unknown failure")) is True
+        assert _is_retryable_error(ValueError("unknown failure")) is False
+
+
 class TestFailureConditions:
     """Test failure condition enumeration and classification."""
 
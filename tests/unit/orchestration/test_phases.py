@@ -1,5 +1,6 @@
 """Unit tests for PhaseOrchestrator."""
 
+import threading
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
@@ -140,6 +141,85 @@ class TestPhaseOrchestratorPhaseA:
         assert allocated_ttl == 20  # Uses global_ttl as fallback
         assert error == "TTL allocation failed"
 
+    def test_phase_a_logs_only_with_correlation_id(self):
+        """Test phase_a_taskprofile_ttl routes logging to the null logger without a correlation_id."""
+        orchestrator = PhaseOrchestrator()
+        mock_adaptive_depth = Mock()
+        mock_adaptive_depth.allocate_ttl.return_value = 15
+        logger = Mock()
+
+        orchestrator.phase_a_taskprofile_ttl(
+            request="Test request",
+            adaptive_depth=mock_adaptive_depth,
+            global_ttl=20,
+            logger=logger,
+        )
+        assert logger.method_calls == []
+
+        execution_context = ExecutionContext(
+            correlation_id="test-phase-a-logging",
+            execution_start_timestamp=datetime.now().isoformat()
+        )
+        orchestrator.phase_a_taskprofile_ttl(
+            request="Test request",
+            adaptive_depth=mock_adaptive_depth,
+            global_ttl=20,
+            execution_context=execution_context,
+            logger=logger,
+        )
+        logger.log_phase_entry.assert_called_once()
+        logger.log_phase_exit.assert_called_once()
+
+    def test_phase_a_snapshots_with_logger_lacking_should_sample(self):
+        """Test that a logger without should_sample still receives every snapshot."""
+        orchestrator = PhaseOrchestrator()
+        mock_adaptive_depth = Mock()
+        mock_adaptive_depth.allocate_ttl.return_value = 15
+        logger = Mock(spec=[
+            "log_phase_entry",
+            "log_phase_exit",
+            "log_state_snapshot",
+            "log_ttl_snapshot",
+            "log_phase_transition_error",
+        ])
+        execution_context = ExecutionContext(
+            correlation_id="test-phase-a-unsampled-logger",
+            execution_start_timestamp=datetime.now().isoformat()
+        )
+
+        orchestrator.phase_a_taskprofile_ttl(
+            request="Test request",
+            adaptive_depth=mock_adaptive_depth,
+            global_ttl=20,
+            execution_context=execution_context,
+            logger=logger,
+        )
+
+        logger.log_ttl_snapshot.assert_called()
+        logger.log_state_snapshot.assert_called()
+
+    def test_phase_a_without_context_validation(self):
+        """Test that validate_context=False skips the structured context validation pass."""
+        mock_adaptive_depth = Mock()
+
+        # Missing correlation_id: validated orchestrator reports a context propagation failure
+        success, _, error = PhaseOrchestrator().phase_a_taskprofile_ttl(
+            request="Test request",
+            adaptive_depth=mock_adaptive_depth,
+            global_ttl=20,
+        )
+        assert success is False
+        assert "correlation_id" in error
+
+        # Without validation, build_llm_context() is the remaining guard
+        with pytest.raises(ValueError, match="correlation_id"):
+            PhaseOrchestrator(validate_context=False).phase_a_taskprofile_ttl(
+                request="Test request",
+                adaptive_depth=mock_adaptive_depth,
+                global_ttl=20,
+            )
+        mock_adaptive_depth.infer_task_profile.assert_not_called()
+
 
 class TestPhaseOrchestratorPhaseB:
     """Test PhaseOrchestrator.phase_b_initial_plan_refinement()."""
@@ -443,6 +523,100 @@ class TestPhaseOrchestratorPhaseCExecute:
         assert results[0]["status"] == "failed"
         assert "error" in results[0]
 
+    def test_phase_c_execute_batch_concurrent_preserves_order(self):
+        """Test that concurrent batch execution returns results in plan order."""
+        orchestrator = PhaseOrchestrator()
+
+        execution_context = ExecutionContext(
+            correlation_id="test-phase-c-execute-concurrent",
+            execution_start_timestamp=datetime.now().isoformat()
+        )
+        task_profile = TaskProfile.default()
+
+        plan = Plan(
+            goal="Test goal",
+            steps=[
+                PlanStep(step_id=f"step{i}", description=f"Step {i}", status=StepStatus.PENDING)
+                for i in range(1, 5)
+            ]
+        )
+        state = OrchestrationState(plan=plan, ttl_remaining=10)
+
+        mock_memory = Mock()
+        mock_memory.read.return_value = None
+
+        def execute_step_fn(step, state):
+            if step.step_id == "step3":
+                raise Exception("Step execution failed")
+            step.status = StepStatus.COMPLETE
+            step.step_output = f"Output from {step.step_id}"
+
+        results = orchestrator.phase_c_execute_batch(
+            plan=plan,
+            state=state,
+            step_executor=Mock(),
+            tool_registry=None,
+            memory=mock_memory,
+            supervisor=None,
+            execute_step_fn=execute_step_fn,
+            execution_context=execution_context,
+            task_profile=task_profile,
+            pass_number=1,
+            ttl_remaining=10,
+            request="Test request",
+            max_concurrent_steps=4,
+        )
+
+        assert [r["step_id"] for r in results] == ["step1", "step2", "step3", "step4"]
+        assert results[0]["output"] == "Output from step1"
+        assert results[2]["status"] == "failed"
+        assert "error" in results[2]
+
+
+    def test_phase_c_execute_batch_runs_steps_in_parallel(self):
+        """Test that max_concurrent_steps > 1 runs ready steps on separate threads at once."""
+        orchestrator = PhaseOrchestrator()
+        execution_context = ExecutionContext(
+            correlation_id="test-phase-c-execute-parallel",
+            execution_start_timestamp=datetime.now().isoformat()
+        )
+        plan = Plan(
+            goal="Test goal",
+            steps=[
+                PlanStep(step_id=f"step{i}", description=f"Step {i}", status=StepStatus.PENDING)
+                for i in range(1, 4)
+            ]
+        )
+        state = OrchestrationState(plan=plan, ttl_remaining=10)
+        # Every step waits until all three are running; serial execution would break the barrier
+        barrier = threading.Barrier(3, timeout=5)
+        thread_ids = set()
+
+        def execute_step_fn(step, state):
+            thread_ids.add(threading.get_ident())
+            barrier.wait()
+            step.status = StepStatus.COMPLETE
+            step.step_output = f"Output from {step.step_id}"
+
+        results = orchestrator.phase_c_execute_batch(
+            plan=plan,
+            state=state,
+            step_executor=Mock(),
+            tool_registry=None,
+            memory=None,
+            supervisor=None,
+            execute_step_fn=execute_step_fn,
+            execution_context=execution_context,
+            task_profile=TaskProfile.default(),
+            pass_number=1,
+            ttl_remaining=10,
+            request="Test request",
+            max_concurrent_steps=3,
+        )
+
+        assert [r["status"] for r in results] == ["complete"] * 3
+        assert len(thread_ids) == 3
+
 
 class TestPhaseOrchestratorPhaseCEvaluate:
     """Test PhaseOrchestrator.phase_c_evaluate()."""
@@ -917,3 +1091,63 @@ class TestPhaseOrchestratorPhaseD:
         assert result_profile is None
         assert error == "Update failed"
 
+
+class TestBuildLLMContext:
+    """Test construction of LLM context from the phase context propagation spec."""
+
+    def _context_a(self, **overrides):
+        context = {
+            "request": "do something",
+            "pass_number": 0,
+            "phase": "A",
+            "ttl_remaining": 5,
+            "correlation_id": "test-llm-context",
+            "execution_start_timestamp": "2024-01-01T00:00:00",
+            "extra": "dropped",
+        }
+        context.update(overrides)
+        return context
+
+    def test_only_required_fields_are_kept(self):
+        """Test that the LLM context contains exactly the must-have fields in spec order."""
+        from aeon.orchestration.phases import CONTEXT_SPEC_PHASE_A, build_llm_context
+
+        llm_context = build_llm_context("A", self._context_a())
+
+        assert tuple(llm_context) == CONTEXT_SPEC_PHASE_A.must_have_fields
+        assert "extra" not in llm_context
+
+    def test_missing_or_null_fields_raise(self):
+        """Test that missing and null required fields are reported."""
+        from aeon.orchestration.phases import build_llm_context
+
+        context = self._context_a(request=None)
+        del context["ttl_remaining"]
+
+        with pytest.raises(ValueError, match="request, ttl_remaining"):
+            build_llm_context("A", context)
+
+
+class TestValidateContextPropagation:
+    """Test context validation against the phase context propagation spec."""
+
+    def test_complete_context_is_valid(self):
+        """Test that a context with all required non-null fields validates."""
+        from aeon.orchestration.phases import validate_context_propagation
+
+        context = TestBuildLLMContext()._context_a()
+
+        assert validate_context_propagation("A", context) == (True, None, [])
+
+    def test_missing_fields_reported_in_spec_order(self):
+        """Test that missing fields are listed in specification order."""
+        from aeon.orchestration.phases import validate_context_propagation
+
+        context = TestBuildLLMContext()._context_a(correlation_id=None)
+        del context["request"]
+
+        is_valid, error_message, missing_fields = validate_context_propagation("A", context)
+
+        assert is_valid is False
+        assert missing_fields == ["request", "correlation_id"]
+        assert error_message == "Missing required context fields: request, correlation_id"
@@ -0,0 +1,53 @@
+"""Unit tests for PlanCache."""
+
+import pytest
+
+from aeon.adaptive.models import TaskProfile
+from aeon.orchestration.plan_cache import PlanCache
+from aeon.plan.models import Plan, PlanStep, StepStatus
+
+
+def _plan(goal="Test goal"):
+    return Plan(
+        goal=goal,
+        steps=[PlanStep(step_id="step1", description="Step 1", status=StepStatus.PENDING)],
+    )
+
+
+class TestPlanCache:
+    """Test PlanCache lookups, copies and eviction."""
+
+    def test_miss_returns_none(self):
+        """Test that an unknown request is a miss."""
+        assert PlanCache().get("unknown request") is None
+
+    def test_hit_returns_independent_plan_copy(self):
+        """Test that hits return a copy callers can mutate without affecting the cache."""
+        cache = PlanCache()
+        profile = TaskProfile.default()
+        cache.put("request", profile, 10, _plan())
+
+        task_profile, ttl_allocated, plan = cache.get("request")
+        plan.steps[0].status = StepStatus.COMPLETE
+
+        assert task_profile is profile
+        assert ttl_allocated == 10
+        assert cache.get("request")[2].steps[0].status == StepStatus.PENDING
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = PlanCache(max_size=2)
+        profile = TaskProfile.default()
+        cache.put("first", profile, 10, _plan("first"))
+        cache.put("second", profile, 10, _plan("second"))
+        cache.get("first")
+        cache.put("third", profile, 10, _plan("third"))
+
+        assert len(cache) == 2
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+
+    def test_invalid_max_size(self):
+        """Test that a non-positive max_size is rejected."""
+        with pytest.raises(ValueError):
+            PlanCache(max_size=0)
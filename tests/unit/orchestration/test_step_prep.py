@@ -75,6 +75,27 @@ class TestStepPreparation:
         assert len(ready_steps) >= 1
         assert any(s.step_id == "step1" for s in ready_steps)
 
+    def test_get_ready_steps_dependency_status_lookup(self):
+        """Test that dependencies resolve by step_id, with unknown dependencies never ready."""
+        step_prep = StepPreparation()
+
+        def step(step_id, status, dependencies=None):
+            return Mock(step_id=step_id, status=status, dependencies=dependencies)
+
+        plan = Mock(
+            steps=[
+                step("step1", StepStatus.COMPLETE),
+                step("step2", StepStatus.FAILED),
+                step("step3", StepStatus.PENDING, ["step1"]),
+                step("step4", StepStatus.PENDING, ["step1", "step2"]),
+                step("step5", StepStatus.PENDING, ["missing"]),
+            ]
+        )
+
+        ready_steps = step_prep.get_ready_steps(plan, None)
+
+        assert [s.step_id for s in ready_steps] == ["step3"]
+
     def test_get_ready_steps_no_pending_steps(self):
         """Test get_ready_steps when no steps are pending."""
         step_prep = StepPreparation()
@@ -237,6 +258,44 @@ class TestStepPreparation:
         assert plan.steps[0].step_index == 1
         assert plan.steps[0].total_steps == 1
 
+    def test_populate_step_indices_reindexes_after_step_change(self):
+        """Test that repeated calls skip unchanged plans but reindex after edits."""
+        step_prep = StepPreparation()
+
+        plan = Plan(
+            goal="Test goal",
+            steps=[
+                PlanStep(step_id="step1", description="Step 1"),
+                PlanStep(step_id="step2", description="Step 2"),
+            ]
+        )
+
+        step_prep.populate_step_indices(plan)
+        step_prep.populate_step_indices(plan)
+        plan.steps.insert(0, PlanStep(step_id="step0", description="Step 0"))
+        step_prep.populate_step_indices(plan)
+
+        assert [step.step_index for step in plan.steps] == [1, 2, 3]
+        assert all(step.total_steps == 3 for step in plan.steps)
+
+    def test_populate_step_indices_reindexes_replaced_steps(self):
+        """Test that steps replaced by new objects are reindexed even if they compare equal."""
+        step_prep = StepPreparation()
+
+        plan = Plan(
+            goal="Test goal",
+            steps=[
+                PlanStep(step_id="step1", description="Step 1"),
+                PlanStep(step_id="step2", description="Step 2"),
+            ]
+        )
+
+        step_prep.populate_step_indices(plan)
+        plan.steps = [step.model_copy(update={"step_index": None}) for step in plan.steps]
+        step_prep.populate_step_indices(plan)
+
+        assert [step.step_index for step in plan.steps] == [1, 2]
+
     def test_populate_step_indices_single_step_plan(self):
         """Test populate_step_indices with single step plan."""
         step_prep = StepPreparation()
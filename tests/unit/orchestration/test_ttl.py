@@ -193,3 +193,27 @@ class TestTTLStrategy:
         assert success is True
         assert error is None
 
+
+class TestCheckTTLAtPhaseBoundary:
+    """Test TTL boundary checks that take a live plan."""
+
+    def test_plan_not_serialized_while_ttl_remains(self):
+        """Test that the plan is only dumped once TTL is exhausted."""
+        from unittest.mock import Mock
+
+        from aeon.orchestration.validation import check_ttl_at_phase_boundary
+
+        plan = Mock()
+        check_ttl_at_phase_boundary(3, "B", None, 0, plan=plan)
+
+        plan.model_dump.assert_not_called()
+
+    def test_expired_ttl_raises_with_plan(self):
+        """Test that an exhausted TTL raises when only a plan is given."""
+        from aeon.exceptions import TTLExpiredError
+        from aeon.orchestration.validation import check_ttl_at_phase_boundary
+
+        plan = Plan(goal="Test goal", steps=[PlanStep(step_id="step1", description="Step 1")])
+
+        with pytest.raises(TTLExpiredError):
+            check_ttl_at_phase_boundary(0, "B", None, 0, plan=plan)